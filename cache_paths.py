@@ -0,0 +1,16 @@
+"""
+Cache Paths
+
+Locates the on-disk cache shared by the fetcher and the MJML compiler.
+Kept free of heavy imports so either module can use it cheaply.
+"""
+
+import os
+
+
+def get_cache_dir() -> str:
+    """Root directory for on-disk caches (override with TEMPLATEFORGE_CACHE_DIR)."""
+    return os.environ.get(
+        'TEMPLATEFORGE_CACHE_DIR',
+        os.path.join(os.path.expanduser('~'), '.cache', 'templateforge')
+    )
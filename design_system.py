@@ -4,6 +4,8 @@ TopMail Design System Configuration
 Defines all tokens, spacing rules, and design constraints for email templates.
 """
 
+import re
+
 # Layout Rules
 MAX_WIDTH = 640
 SPACING_INCREMENTS = [8, 12, 16, 24]
@@ -107,9 +109,7 @@ DESIGN_SKINS = {
 }
 
 
-def get_base_styles():
-    """Returns base CSS styles for email templates."""
-    return """
+_BASE_STYLES_TEMPLATE = """
     <style type="text/css">
         /* Reset styles */
         body, table, td, p, a, li { -webkit-text-size-adjust: 100%; -ms-text-size-adjust: 100%; }
@@ -152,6 +152,35 @@ def get_base_styles():
     """
 
 
+def _split_template(template):
+    """Split a template on {token} placeholders.
+
+    Returns a list alternating literal chunks (even indexes) and token
+    names (odd indexes). Literal CSS braces like "{ margin: 0; }" are left
+    alone since they are not bare word tokens.
+    """
+    return re.split(r'\{(\w+)\}', template)
+
+
+_BASE_STYLES_PARTS = _split_template(_BASE_STYLES_TEMPLATE)
+
+
+def get_base_styles():
+    """Returns base CSS styles for email templates."""
+    return _BASE_STYLES_TEMPLATE
+
+
+def apply_skin(skin):
+    """Returns base CSS styles with a skin's token values substituted.
+
+    Tokens the skin doesn't define are left as {token}.
+    """
+    return "".join(
+        part if i % 2 == 0 else str(skin[part]) if part in skin else "{" + part + "}"
+        for i, part in enumerate(_BASE_STYLES_PARTS)
+    )
+
+
 def get_outlook_conditionals():
     """Returns Outlook-specific conditional comments."""
     return """
@@ -6,13 +6,53 @@ Fetches and parses email templates from public MJML/HTML sources.
 Converts them to TopMail design system format.
 """
 
+import io
+import base64
+import os
 import re
+import gzip
 import json
+import time
+import hashlib
+import tempfile
+import threading
+import http.client
+import urllib.parse
 import urllib.request
-import urllib.error
-from typing import Dict, List, Optional, Any
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
 from html.parser import HTMLParser
 
+from cache_paths import get_cache_dir
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml is optional; html.parser is used instead
+    lxml_etree = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json encoder is used instead
+    orjson = None
+
+
+# Headers sent with every outbound template request
+REQUEST_HEADERS = {
+    'User-Agent': 'TemplateForge/1.0 (Email Template Generator)',
+    'Accept-Encoding': 'gzip',
+}
+
+# Responses larger than this (after decompression) are rejected
+MAX_RESPONSE_BYTES = 2_000_000
+
+# Upper bound on concurrent template downloads
+FETCH_MAX_WORKERS = 16
+
+# Cached responses younger than this are returned without any network request
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
 
 # Public MJML template repositories and sources
 EXTERNAL_SOURCES = {
@@ -48,177 +88,551 @@ EXTERNAL_SOURCES = {
 }
 
 
+# MJML structural tags tracked by MJMLParser, mapped to their section kind
+MJML_TAGS = {
+    'mj-hero': 'hero',
+    'mj-section': 'section',
+    'mj-column': 'column',
+    'mj-text': 'text',
+    'mj-button': 'button',
+    'mj-image': 'image',
+    'mj-divider': 'divider',
+    'mj-social': 'social',
+    'mj-navbar': 'navbar',
+    'mj-table': 'table',
+}
+
+
+@dataclass(slots=True)
+class Section:
+    """An MJML structural element found by MJMLParser."""
+
+    mjml_tag: str
+    section_type: str
+    attrs: Tuple[Tuple[str, Optional[str]], ...]  # (name, value) pairs in source order
+    content: List[str]
+
+    def attrs_dict(self) -> Dict[str, Optional[str]]:
+        """Attributes as a dict, built on demand."""
+        return dict(self.attrs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form used for JSON output."""
+        return {
+            'mjml_tag': self.mjml_tag,
+            'section_type': self.section_type,
+            'attrs': self.attrs_dict(),
+            'content': self.content
+        }
+
+
+def json_default(obj: Any) -> Any:
+    """json.dump hook that serializes parsed Section records."""
+    if isinstance(obj, Section):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_results_json(results: Any, path: str) -> None:
+    """Write fetch results to path as indented JSON, using orjson when available."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(
+                results,
+                default=json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS,
+            ))
+    else:
+        with open(path, 'w') as f:
+            json.dump(results, f, indent=2, default=json_default)
+
+
 class MJMLParser(HTMLParser):
     """Parse MJML to extract structure and content."""
 
+    # Both HTMLParser and lxml's HTML parser report tag names lowercased,
+    # so tags are looked up directly without re-lowering them per event.
+
     def __init__(self):
         super().__init__()
         self.sections = []
+        # TopMail section types in first-seen order, filled as sections close
+        self.sections_used = {}
         self.current_section = None
         self.current_content = []
         self.in_text = False
-        self.mjml_tags = {
-            'mj-hero': 'hero',
-            'mj-section': 'section',
-            'mj-column': 'column',
-            'mj-text': 'text',
-            'mj-button': 'button',
-            'mj-image': 'image',
-            'mj-divider': 'divider',
-            'mj-social': 'social',
-            'mj-navbar': 'navbar',
-            'mj-table': 'table',
-        }
 
     def handle_starttag(self, tag, attrs):
-        tag_lower = tag.lower()
-        if tag_lower in self.mjml_tags:
-            self.current_section = {
-                'mjml_tag': tag_lower,
-                'section_type': self.mjml_tags[tag_lower],
-                'attrs': dict(attrs),
-                'content': []
-            }
-        if tag_lower == 'mj-text':
-            self.in_text = True
-            self.current_content = []
+        section_type = MJML_TAGS.get(tag)
+        if section_type is not None:
+            self.current_section = Section(tag, section_type, tuple(attrs), [])
+            if tag == 'mj-text':
+                self.in_text = True
+                self.current_content = []
 
     def handle_endtag(self, tag):
-        tag_lower = tag.lower()
-        if tag_lower == 'mj-text' and self.in_text:
+        if tag == 'mj-text' and self.in_text:
             self.in_text = False
-            if self.current_section:
-                self.current_section['content'].append(''.join(self.current_content))
-        if tag_lower in self.mjml_tags and self.current_section:
-            if self.current_section['mjml_tag'] == tag_lower:
-                self.sections.append(self.current_section)
-                self.current_section = None
+            if self.current_section is not None:
+                self.current_section.content.append(''.join(self.current_content))
+        current = self.current_section
+        if current is not None and current.mjml_tag == tag:
+            self.sections.append(current)
+            self.sections_used.setdefault(map_mjml_to_section_type(tag, current.attrs))
+            self.current_section = None
 
     def handle_data(self, data):
         if self.in_text:
             self.current_content.append(data.strip())
 
 
+# Interned "<tag>" / "</tag>" strings reused across HTML reconstruction
+_OPEN_TAG_CACHE = {}
+_CLOSE_TAG_CACHE = {}
+
+
 class HTMLEmailParser(HTMLParser):
-    """Parse HTML emails to extract structure."""
+    """
+    Parse HTML emails to extract structure.
 
-    def __init__(self):
+    Only table nesting is tracked by default; pass capture_html=True to
+    also rebuild each extracted section's markup into its 'html' field.
+    """
+
+    def __init__(self, capture_html: bool = False):
         super().__init__()
+        self.capture_html = capture_html
         self.sections = []
+        self.sections_used = {}
         self.current_depth = 0
         self.in_table = False
         self.table_depth = 0
-        self.current_section_content = []
+        self.current_section_content = io.StringIO()
 
     def handle_starttag(self, tag, attrs):
         if tag == 'table':
             self.table_depth += 1
             if self.table_depth == 2:  # Main content tables
-                self.current_section_content = []
-        self.current_section_content.append(f'<{tag}>')
+                self.current_section_content.seek(0)
+                self.current_section_content.truncate()
+        # Markup outside a main content table never reaches a section
+        if self.capture_html and self.table_depth >= 2:
+            self.current_section_content.write(
+                _OPEN_TAG_CACHE.get(tag) or _OPEN_TAG_CACHE.setdefault(tag, f'<{tag}>')
+            )
 
     def handle_endtag(self, tag):
-        self.current_section_content.append(f'</{tag}>')
+        if self.capture_html and self.table_depth >= 2:
+            self.current_section_content.write(
+                _CLOSE_TAG_CACHE.get(tag) or _CLOSE_TAG_CACHE.setdefault(tag, f'</{tag}>')
+            )
         if tag == 'table':
-            if self.table_depth == 2 and self.current_section_content:
-                self.sections.append({
-                    'html': ''.join(self.current_section_content),
-                    'type': 'extracted_section'
-                })
+            if self.table_depth == 2:
+                if self.capture_html:
+                    self.sections.append({
+                        'html': self.current_section_content.getvalue(),
+                        'type': 'extracted_section'
+                    })
+                else:
+                    self.sections.append({'type': 'extracted_section'})
+                self.sections_used.setdefault('extracted_section')
             self.table_depth -= 1
 
     def handle_data(self, data):
-        if data.strip():
-            self.current_section_content.append(data)
+        # Text outside a main content table never reaches a section
+        if self.table_depth < 2 or not self.capture_html:
+            return
+        if data and not data.isspace():
+            self.current_section_content.write(data)
+
 
+def _response_cache_path(url: str) -> str:
+    """Location of the cached response for a URL."""
+    digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(get_cache_dir(), 'http', f"{digest}.json")
 
-def fetch_url(url: str, timeout: int = 10) -> Optional[str]:
-    """Fetch content from a URL."""
+
+def _load_cached_response(url: str) -> Optional[Dict[str, Any]]:
+    """Read a cached response entry, or None if missing/unreadable."""
     try:
-        headers = {
-            'User-Agent': 'TemplateForge/1.0 (Email Template Generator)'
-        }
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            return response.read().decode('utf-8')
-    except urllib.error.HTTPError as e:
-        print(f"  HTTP Error {e.code}: {url}")
+        with open(_response_cache_path(url), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_response(url: str, entry: Dict[str, Any]) -> None:
+    """Atomically write a response entry; caching is best-effort."""
+    path = _response_cache_path(url)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(path),
+                                         suffix='.tmp', delete=False) as f:
+            json.dump(entry, f)
+        os.replace(f.name, path)
+    except OSError:
+        pass
+
+
+# Keep-alive connections, one per (scheme, host) for each fetch thread
+_CONNECTIONS = threading.local()
+
+# Redirect statuses followed by _http_get
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+def _proxy_for(parts: urllib.parse.SplitResult) -> Optional[urllib.parse.SplitResult]:
+    """
+    The proxy to use for a URL, chosen the way urllib.request chooses it.
+
+    Honours HTTP_PROXY / HTTPS_PROXY (or the platform's proxy settings) and
+    no_proxy. Returns the split proxy URL, or None to connect directly.
+    """
+    proxy = urllib.request.getproxies().get(parts.scheme)
+    if not proxy or urllib.request.proxy_bypass(parts.hostname or ''):
         return None
-    except urllib.error.URLError as e:
-        print(f"  URL Error: {e.reason}")
+    if '://' not in proxy:
+        proxy = 'http://' + proxy
+    return urllib.parse.urlsplit(proxy)
+
+
+def _proxy_headers(proxy: urllib.parse.SplitResult) -> Dict[str, str]:
+    """Basic Proxy-Authorization for credentials embedded in the proxy URL."""
+    if proxy.username is None:
+        return {}
+    credentials = '%s:%s' % (urllib.parse.unquote(proxy.username),
+                             urllib.parse.unquote(proxy.password or ''))
+    token = base64.b64encode(credentials.encode('utf-8')).decode('ascii')
+    return {'Proxy-Authorization': f'Basic {token}'}
+
+
+def _get_connection(scheme: str, netloc: str, timeout: int,
+                    proxy: Optional[urllib.parse.SplitResult] = None) -> http.client.HTTPConnection:
+    """
+    Return this thread's open connection to a host, creating it if needed.
+
+    With a proxy, plain HTTP connects to the proxy itself and HTTPS is
+    tunnelled through it with CONNECT.
+    """
+    pool = getattr(_CONNECTIONS, 'pool', None)
+    if pool is None:
+        pool = _CONNECTIONS.pool = {}
+    conn = pool.get((scheme, netloc, proxy))
+    if conn is None:
+        # The proxy's host[:port], without any credentials
+        host = netloc if proxy is None else proxy.netloc.rpartition('@')[2]
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(host, timeout=timeout)
+            if proxy is not None:
+                conn.set_tunnel(netloc, headers=_proxy_headers(proxy))
+        elif scheme == 'http':
+            conn = http.client.HTTPConnection(host, timeout=timeout)
+        else:
+            raise ValueError(f"unsupported URL scheme: {scheme}")
+        pool[(scheme, netloc, proxy)] = conn
+    return conn
+
+
+def _drop_connection(scheme: str, netloc: str,
+                     proxy: Optional[urllib.parse.SplitResult] = None) -> None:
+    """Close and forget this thread's connection to a host."""
+    pool = getattr(_CONNECTIONS, 'pool', None)
+    conn = pool.pop((scheme, netloc, proxy), None) if pool else None
+    if conn is not None:
+        conn.close()
+
+
+def _http_get(url: str, headers: Dict[str, str], timeout: int, max_bytes: int,
+              max_redirects: int = 5) -> Tuple[int, http.client.HTTPResponse, bytes]:
+    """
+    GET a URL over a pooled keep-alive connection.
+
+    Returns (status, response, body). The body is gunzipped when needed and
+    empty for 304 responses. A request on a reused connection that the
+    server has already closed is retried once on a fresh connection.
+    Proxies configured in the environment are used as urllib would.
+    """
+    for _ in range(max_redirects + 1):
+        parts = urllib.parse.urlsplit(url)
+        proxy = _proxy_for(parts)
+        request_headers = headers
+        if proxy is not None and parts.scheme == 'http':
+            # Plain HTTP is sent to the proxy with the absolute URL as target
+            path = urllib.parse.urlunsplit(parts._replace(fragment=''))
+            request_headers = {**headers, **_proxy_headers(proxy)}
+        else:
+            path = parts.path or '/'
+            if parts.query:
+                path += '?' + parts.query
+
+        for attempt in range(2):
+            conn = _get_connection(parts.scheme, parts.netloc, timeout, proxy)
+            reused = conn.sock is not None
+            try:
+                conn.request('GET', path, headers=request_headers)
+                response = conn.getresponse()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                _drop_connection(parts.scheme, parts.netloc, proxy)
+                if not reused or attempt:
+                    raise
+            except Exception:
+                _drop_connection(parts.scheme, parts.netloc, proxy)
+                raise
+
+        if response.status in _REDIRECT_STATUSES and response.getheader('Location'):
+            response.read()
+            url = urllib.parse.urljoin(url, response.getheader('Location'))
+            continue
+        if response.status == 304 or response.status >= 400:
+            response.read()
+            return response.status, response, b''
+
+        try:
+            stream = response
+            if response.getheader('Content-Encoding') == 'gzip':
+                stream = gzip.GzipFile(fileobj=response)
+            data = stream.read(max_bytes + 1)
+            if len(data) > max_bytes:
+                raise ValueError(f"response exceeds {max_bytes} bytes")
+            if not response.isclosed():
+                response.read()
+        except Exception:
+            _drop_connection(parts.scheme, parts.netloc, proxy)
+            raise
+        if response.will_close:
+            _drop_connection(parts.scheme, parts.netloc, proxy)
+        return response.status, response, data
+
+    raise ValueError(f"too many redirects: {url}")
+
+
+def fetch_url(url: str, timeout: int = 10, max_bytes: int = MAX_RESPONSE_BYTES) -> Optional[str]:
+    """
+    Fetch content from a URL.
+
+    Responses are cached on disk with their ETag/Last-Modified validators.
+    Fresh entries (younger than CACHE_TTL_SECONDS) skip the network; stale
+    ones are revalidated with a conditional request and reused on 304.
+    Bodies are requested gzip-compressed and capped at max_bytes, and
+    connections are kept alive and reused per host within each thread.
+    """
+    cached = _load_cached_response(url)
+    if cached and time.time() - cached.get('fetched_at', 0) < CACHE_TTL_SECONDS:
+        return cached['body']
+
+    headers = dict(REQUEST_HEADERS)
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    try:
+        status, response, data = _http_get(url, headers, timeout, max_bytes)
+    except OSError as e:
+        print(f"  URL Error: {e}")
         return None
     except Exception as e:
         print(f"  Error fetching {url}: {e}")
         return None
 
+    if status == 304 and cached:
+        cached['fetched_at'] = time.time()
+        _store_cached_response(url, cached)
+        return cached['body']
+    if status >= 300:
+        print(f"  HTTP Error {status}: {url}")
+        return None
 
-def parse_mjml_structure(mjml_content: str) -> Dict[str, Any]:
-    """Parse MJML content and extract structure."""
+    body = data.decode('utf-8', errors='replace')
+    _store_cached_response(url, {
+        'etag': response.getheader('ETag'),
+        'last_modified': response.getheader('Last-Modified'),
+        'body': body,
+        'fetched_at': time.time(),
+    })
+    return body
+
+
+def _emit_text(parser: HTMLParser, text: Optional[str]) -> None:
+    """Forward a text node to the parser, skipping empty ones."""
+    if text:
+        parser.handle_data(text)
+
+
+# An MJML tag that repeats an attribute name
+_REPEATED_MJ_ATTR_RE = re.compile(r'<mj-[^<>]*?\s([\w:-]+)\s*=[^<>]*?\s\1\s*=')
+
+
+def _feed_parser(parser: HTMLParser, content: str, use_lxml: bool = True) -> None:
+    """
+    Drive a parser's handle_* callbacks over content.
+
+    With lxml installed the document is streamed through libxml2 via
+    iterparse and the callbacks are replayed in document order; finished
+    elements are cleared and detached so memory stays O(depth). Without
+    lxml, or with use_lxml=False, this is plain HTMLParser.feed().
+    """
+    if not content or content.isspace():
+        return
+    if lxml_etree is None or not use_lxml:
+        parser.feed(content)
+        return
+
+    stream = io.BytesIO(content.encode('utf-8'))
+    events = lxml_etree.iterparse(
+        stream,
+        events=('start', 'end', 'comment', 'pi'),
+        html=True,
+        recover=True,
+        encoding='utf-8',
+    )
+    # Last finished node: its tail text is emitted once we know what follows it
+    closed = None
+
+    for event, elem in events:
+        if closed is not None:
+            _emit_text(parser, closed.tail)
+            parent = closed.getparent()
+            closed.clear()
+            if parent is not None:
+                parent.remove(closed)
+        elif event != 'end':
+            parent = elem.getparent()
+            if parent is not None:
+                _emit_text(parser, parent.text)
+        else:
+            _emit_text(parser, elem.text)
+
+        if event == 'start':
+            closed = None
+            parser.handle_starttag(elem.tag, list(elem.attrib.items()))
+        elif event == 'end':
+            parser.handle_endtag(elem.tag)
+            closed = elem
+        else:
+            closed = elem
+
+
+def _parse_result(sections: List[Section], sections_used: List[str], content: str,
+                  raw_preview_chars: int, keep_raw: bool) -> Dict[str, Any]:
+    """Assemble a parse result, keeping the full source only when asked to."""
+    result = {
+        'sections': sections,
+        'sections_used': sections_used,
+        'raw_preview': content[:raw_preview_chars]
+    }
+    if keep_raw:
+        result['raw'] = content
+    return result
+
+
+def parse_mjml_structure(mjml_content: str, raw_preview_chars: int = 500,
+                         keep_raw: bool = False) -> Dict[str, Any]:
+    """
+    Parse MJML content and extract structure.
+
+    Only the first raw_preview_chars characters of the source are kept in
+    the result, as 'raw_preview'. Set keep_raw to also keep the full source
+    under 'raw'.
+    """
     parser = MJMLParser()
     try:
-        parser.feed(mjml_content)
+        # libxml2 keeps the first of a repeated attribute; html.parser keeps
+        # the last, which is what section attrs have always reported
+        _feed_parser(parser, mjml_content,
+                     use_lxml=not _REPEATED_MJ_ATTR_RE.search(mjml_content))
     except Exception as e:
         print(f"  MJML parsing error: {e}")
-        return {'sections': [], 'raw': mjml_content}
+        return _parse_result([], [], mjml_content, raw_preview_chars, keep_raw)
+
+    return _parse_result(parser.sections, list(parser.sections_used),
+                         mjml_content, raw_preview_chars, keep_raw)
 
-    return {
-        'sections': parser.sections,
-        'raw': mjml_content
-    }
 
+def parse_html_structure(html_content: str, raw_preview_chars: int = 500,
+                         capture_html: bool = False, keep_raw: bool = False) -> Dict[str, Any]:
+    """
+    Parse HTML email content and extract structure.
 
-def parse_html_structure(html_content: str) -> Dict[str, Any]:
-    """Parse HTML email content and extract structure."""
-    parser = HTMLEmailParser()
+    Only the first raw_preview_chars characters of the source are kept in
+    the result, as 'raw_preview'. Set keep_raw to also keep the full source
+    under 'raw', and capture_html to include each extracted section's markup.
+    """
+    parser = HTMLEmailParser(capture_html=capture_html)
     try:
-        parser.feed(html_content)
+        # Captured markup is rebuilt tag for tag, so it comes from html.parser:
+        # lxml closes void elements and repairs misnested tags
+        _feed_parser(parser, html_content, use_lxml=not capture_html)
     except Exception as e:
         print(f"  HTML parsing error: {e}")
-        return {'sections': [], 'raw': html_content}
+        return _parse_result([], [], html_content, raw_preview_chars, keep_raw)
 
-    return {
-        'sections': parser.sections,
-        'raw': html_content
-    }
+    return _parse_result(parser.sections, list(parser.sections_used),
+                         html_content, raw_preview_chars, keep_raw)
 
 
-def map_mjml_to_section_type(mjml_tag: str, attrs: dict) -> str:
-    """Map MJML tags to TopMail section types."""
-    mapping = {
-        'mj-hero': 'hero',
-        'mj-navbar': 'header_nav',
-        'mj-button': 'cta_band',
-        'mj-social': 'social_icons',
-        'mj-divider': 'divider',
-        'mj-table': 'order_summary',
-    }
+# MJML tags that map straight to a TopMail section type
+_MJML_SECTION_TYPES = {
+    'mj-hero': 'hero',
+    'mj-navbar': 'header_nav',
+    'mj-button': 'cta_band',
+    'mj-social': 'social_icons',
+    'mj-divider': 'divider',
+    'mj-table': 'order_summary',
+}
+
+# mj-section attribute signature (is full-width, has background) -> section type
+_MJML_SECTION_RULES = {
+    (True, False): 'hero',
+    (True, True): 'hero',
+    (False, True): 'cta_band',
+}
+
 
-    if mjml_tag == 'mj-section':
-        # Infer type from attributes or content
-        if attrs.get('full-width') == 'full-width':
-            return 'hero'
-        if 'background-color' in attrs:
-            return 'cta_band'
+def map_mjml_to_section_type(mjml_tag: str, attrs) -> str:
+    """
+    Map MJML tags to TopMail section types.
+
+    attrs may be a dict or a sequence of (name, value) pairs.
+    """
+    section_type = _MJML_SECTION_TYPES.get(mjml_tag)
+    if section_type is not None:
+        return section_type
+    if mjml_tag != 'mj-section':
         return '1col_text'
 
-    return mapping.get(mjml_tag, '1col_text')
+    # Infer type from attributes; only two keys matter, so scan the pairs
+    full_width = has_background = False
+    for name, value in (attrs.items() if isinstance(attrs, dict) else attrs):
+        if name == 'full-width':
+            full_width = value == 'full-width'
+        elif name == 'background-color':
+            has_background = True
+    return _MJML_SECTION_RULES.get((full_width, has_background), '1col_text')
 
 
 def normalize_external_template(parsed_template: Dict, source_name: str) -> Dict:
     """Convert a parsed template to TopMail normalized format."""
-    sections_used = []
-
-    for section in parsed_template.get('sections', []):
-        if 'mjml_tag' in section:
-            section_type = map_mjml_to_section_type(
-                section['mjml_tag'],
-                section.get('attrs', {})
-            )
-        else:
-            section_type = section.get('type', 'generic')
-
-        if section_type not in sections_used:
-            sections_used.append(section_type)
+    if 'sections_used' in parsed_template:
+        # Section types were already resolved during the parse
+        sections_used = list(parsed_template['sections_used'])
+    else:
+        sections_used = []
+        for section in parsed_template.get('sections', []):
+            if isinstance(section, Section):
+                section_type = map_mjml_to_section_type(section.mjml_tag, section.attrs)
+            elif 'mjml_tag' in section:
+                section_type = map_mjml_to_section_type(
+                    section['mjml_tag'],
+                    section.get('attrs', {})
+                )
+            else:
+                section_type = section.get('type', 'generic')
+
+            if section_type not in sections_used:
+                sections_used.append(section_type)
 
     # Ensure we have header and footer
     if 'header_nav' not in sections_used:
@@ -230,56 +644,91 @@ def normalize_external_template(parsed_template: Dict, source_name: str) -> Dict
         'source': source_name,
         'sections_extracted': sections_used,
         'section_count': len(sections_used),
-        'raw_content': parsed_template.get('raw', '')[:500] + '...'  # Truncated for reference
+        'raw_content': parsed_template.get('raw_preview', parsed_template.get('raw', '')[:500]) + '...'  # Truncated for reference
     }
 
 
-def fetch_templates_from_source(source_id: str, verbose: bool = True) -> List[Dict]:
-    """Fetch all templates from a specific source."""
-    if source_id not in EXTERNAL_SOURCES:
-        raise ValueError(f"Unknown source: {source_id}")
+def _build_template_record(source_id: str, source: Dict, template_file: str, content: str,
+                           keep_raw: bool = False) -> Dict:
+    """Parse and normalize one fetched template into a result record."""
+    # Parse based on type
+    if source['type'] == 'mjml':
+        parsed = parse_mjml_structure(content, keep_raw=keep_raw)
+    else:
+        parsed = parse_html_structure(content, keep_raw=keep_raw)
 
+    normalized = normalize_external_template(
+        parsed,
+        f"{source['name']}/{template_file}"
+    )
+
+    return {
+        'filename': template_file,
+        'source_id': source_id,
+        'source_name': source['name'],
+        'type': source['type'],
+        'url': f"{source['base_url']}/{template_file}",
+        'parsed': parsed,
+        'normalized': normalized
+    }
+
+
+def _submit_source_fetches(executor: ThreadPoolExecutor, source_id: str, verbose: bool) -> Dict:
+    """Queue every template download for a source; returns future -> (index, filename)."""
     source = EXTERNAL_SOURCES[source_id]
-    templates = []
 
     if verbose:
         print(f"Fetching from {source['name']}...")
 
-    for template_file in source['templates']:
+    futures = {}
+    for index, template_file in enumerate(source['templates']):
         url = f"{source['base_url']}/{template_file}"
 
         if verbose:
             print(f"  Fetching: {template_file}")
 
-        content = fetch_url(url)
+        futures[executor.submit(fetch_url, url)] = (index, template_file)
+
+    return futures
+
+
+def _collect_source_templates(source_id: str, futures: Dict, keep_raw: bool = False) -> List[Dict]:
+    """Build records as downloads complete, returned in the source's template order."""
+    source = EXTERNAL_SOURCES[source_id]
+    records = {}
+
+    for future in as_completed(futures):
+        index, template_file = futures[future]
+        content = future.result()
         if not content:
             continue
+        records[index] = _build_template_record(source_id, source, template_file, content, keep_raw)
 
-        # Parse based on type
-        if source['type'] == 'mjml':
-            parsed = parse_mjml_structure(content)
-        else:
-            parsed = parse_html_structure(content)
+    return [records[index] for index in sorted(records)]
 
-        normalized = normalize_external_template(
-            parsed,
-            f"{source['name']}/{template_file}"
-        )
 
-        templates.append({
-            'filename': template_file,
-            'source_id': source_id,
-            'source_name': source['name'],
-            'type': source['type'],
-            'parsed': parsed,
-            'normalized': normalized
-        })
+def fetch_templates_from_source(source_id: str, verbose: bool = True,
+                                keep_raw: bool = False) -> List[Dict]:
+    """
+    Fetch all templates from a specific source.
+
+    Set keep_raw to keep each template's full source in its parse result.
+    """
+    if source_id not in EXTERNAL_SOURCES:
+        raise ValueError(f"Unknown source: {source_id}")
+
+    workers = max(1, min(FETCH_MAX_WORKERS, len(EXTERNAL_SOURCES[source_id]['templates'])))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = _submit_source_fetches(executor, source_id, verbose)
+        return _collect_source_templates(source_id, futures, keep_raw)
 
-    return templates
 
+def fetch_all_external_templates(verbose: bool = True, keep_raw: bool = False) -> Dict[str, Any]:
+    """
+    Fetch templates from all configured sources.
 
-def fetch_all_external_templates(verbose: bool = True) -> Dict[str, Any]:
-    """Fetch templates from all configured sources."""
+    Set keep_raw to keep each template's full source in its parse result.
+    """
     results = {
         'sources_queried': [],
         'templates_fetched': [],
@@ -297,53 +746,59 @@ def fetch_all_external_templates(verbose: bool = True) -> Dict[str, Any]:
         print("Fetching External Templates")
         print("=" * 50)
 
-    for source_id in EXTERNAL_SOURCES.keys():
-        source_info = EXTERNAL_SOURCES[source_id]
-        results['sources_queried'].append({
-            'id': source_id,
-            'name': source_info['name'],
-            'template_count': len(source_info['templates'])
-        })
-
-        try:
-            templates = fetch_templates_from_source(source_id, verbose)
-            results['templates_fetched'].extend(templates)
-            results['summary']['successful_fetches'] += len(templates)
-        except Exception as e:
-            results['errors'].append({
-                'source': source_id,
-                'error': str(e)
+    # One pool for every source so downloads overlap across sources too
+    with ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS) as executor:
+        pending = []
+        for source_id, source_info in EXTERNAL_SOURCES.items():
+            template_count = len(source_info['templates'])
+            results['sources_queried'].append({
+                'id': source_id,
+                'name': source_info['name'],
+                'template_count': template_count
             })
-            results['summary']['failed_fetches'] += len(source_info['templates'])
+            futures = _submit_source_fetches(executor, source_id, verbose)
+            pending.append((source_id, template_count, futures))
+
+        summary = results['summary']
+        templates_fetched = results['templates_fetched']
+        for source_id, template_count, futures in pending:
+            try:
+                templates = _collect_source_templates(source_id, futures, keep_raw)
+                templates_fetched.extend(templates)
+                summary['successful_fetches'] += len(templates)
+            except Exception as e:
+                results['errors'].append({
+                    'source': source_id,
+                    'error': str(e)
+                })
+                summary['failed_fetches'] += template_count
 
-    results['summary']['total_templates'] = len(results['templates_fetched'])
+    summary['total_templates'] = len(templates_fetched)
 
     if verbose:
         print()
-        print(f"Summary: {results['summary']['total_templates']} templates fetched")
-        print(f"  Successful: {results['summary']['successful_fetches']}")
-        print(f"  Failed: {results['summary']['failed_fetches']}")
+        print(f"Summary: {summary['total_templates']} templates fetched")
+        print(f"  Successful: {summary['successful_fetches']}")
+        print(f"  Failed: {summary['failed_fetches']}")
 
     return results
 
 
 def extract_section_patterns(templates: List[Dict]) -> List[Dict]:
-    """Extract unique section patterns from fetched templates."""
-    patterns = {}
+    """Extract unique section patterns from fetched templates, most common first."""
+    occurrences = Counter()
+    sources = defaultdict(list)
 
     for template in templates:
-        normalized = template.get('normalized', {})
-        for section_type in normalized.get('sections_extracted', []):
-            if section_type not in patterns:
-                patterns[section_type] = {
-                    'type': section_type,
-                    'occurrences': 0,
-                    'sources': []
-                }
-            patterns[section_type]['occurrences'] += 1
-            patterns[section_type]['sources'].append(template['filename'])
+        filename = template['filename']
+        for section_type in template.get('normalized', {}).get('sections_extracted', ()):
+            occurrences[section_type] += 1
+            sources[section_type].append(filename)
 
-    return list(patterns.values())
+    return [
+        {'type': section_type, 'occurrences': count, 'sources': sources[section_type]}
+        for section_type, count in occurrences.most_common()
+    ]
 
 
 def list_available_sources() -> List[Dict]:
@@ -405,13 +860,12 @@ if __name__ == "__main__":
         results = fetch_all_external_templates(verbose)
 
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(results, f, indent=2)
+        write_results_json(results, args.output)
         if verbose:
             print(f"\nSaved to: {args.output}")
     elif not args.quiet:
         print("\nExtracted section patterns:")
         templates_list = results.get('templates_fetched', results.get('templates', []))
         patterns = extract_section_patterns(templates_list)
-        for pattern in sorted(patterns, key=lambda x: -x['occurrences']):
+        for pattern in patterns:
             print(f"  {pattern['type']}: {pattern['occurrences']} occurrences")
@@ -11,35 +11,605 @@ import subprocess
 import shutil
 import tempfile
 import os
+import json
+import time
+import atexit
+import select
+import signal
+import socket
+import hashlib
+import io
+import importlib.metadata
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, lru_cache
+from pathlib import Path
+from string import Formatter, Template
 
 from design_system import IMAGE_PLACEHOLDERS, COPY_TOKENS, DESIGN_SKINS
+from cache_paths import get_cache_dir
 
+try:
+    import mrml
+except ImportError:  # mrml is optional; MJML is compiled with Node instead
+    mrml = None
 
-def get_mjml_path():
-    """Get the path to the MJML CLI executable."""
+try:
+    import htmlmin
+except ImportError:  # htmlmin is optional; see MJML_MINIFY_WITH_HTMLMIN
+    htmlmin = None
+
+try:
+    import resource
+except ImportError:  # resource is POSIX-only; MJML subprocesses run unbounded elsewhere
+    resource = None
+
+
+# Directory holding this module, package.json and node_modules
+_MODULE_DIR = Path(__file__).resolve().parent
+
+# MJML CLI location relative to a project root, and its copy next to this module
+_NODE_MJML_BIN = Path("node_modules", ".bin", "mjml")
+_LOCAL_MJML_BIN = _MODULE_DIR / _NODE_MJML_BIN
+
+
+# Limits applied to every MJML subprocess. Memory is capped through the data
+# segment rather than the address space, since V8 reserves several GB of
+# virtual memory up front and fails to start under a small RLIMIT_AS.
+MJML_MAX_MEMORY_BYTES = 1 << 30
+MJML_MAX_OUTPUT_BYTES = 16 << 20
+
+
+# Limits are applied from the parent once the process has started: a
+# preexec_fn would run Python code between fork and exec, which can deadlock
+# when other threads hold locks. prlimit is Linux-only, so elsewhere MJML
+# processes run unbounded.
+_CAN_LIMIT_CHILDREN = hasattr(resource, 'prlimit')
+
+
+def _limit_child_resources(pid):
+    """Cap memory and written file size of a started MJML process."""
+    if not _CAN_LIMIT_CHILDREN:
+        return
+    try:
+        resource.prlimit(pid, resource.RLIMIT_DATA, (MJML_MAX_MEMORY_BYTES, MJML_MAX_MEMORY_BYTES))
+        # One byte of headroom so oversized output is detectable from its file size
+        resource.prlimit(pid, resource.RLIMIT_FSIZE, (MJML_MAX_OUTPUT_BYTES + 1, MJML_MAX_OUTPUT_BYTES + 1))
+    except ProcessLookupError:
+        pass
+
+
+def _start_mjml_process(cmd, **kwargs):
+    """Popen an MJML process in its own session, with resource limits applied."""
+    proc = subprocess.Popen(cmd, start_new_session=True, **kwargs)
+    _limit_child_resources(proc.pid)
+    return proc
+
+
+def _kill_mjml_process(proc):
+    """Kill an MJML process together with anything it started."""
+    try:
+        if hasattr(os, 'killpg'):
+            # The process leads its own session, so its pid is the group id
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except ProcessLookupError:
+        pass
+
+
+def _run_mjml_process(cmd, input=None, stdout=None, stderr=None, timeout=None):
+    """subprocess.run for MJML processes: limited, and killed on timeout or interrupt."""
+    stdin = subprocess.PIPE if input is not None else None
+    with _start_mjml_process(cmd, stdin=stdin, stdout=stdout, stderr=stderr) as proc:
+        try:
+            _, err = proc.communicate(input, timeout=timeout)
+        except BaseException:
+            _kill_mjml_process(proc)
+            proc.wait()
+            raise
+    return subprocess.CompletedProcess(cmd, proc.returncode, None, err)
+
+
+# Leading bytes of MJML's stderr kept as the error message on failure
+MJML_MAX_ERROR_BYTES = 4096
+
+
+def _error_message(stderr):
+    """Decode the start of a failed MJML run's stderr as its error message."""
+    return stderr[:MJML_MAX_ERROR_BYTES].decode('utf-8', errors='replace') or 'MJML compilation failed'
+
+
+def _output_too_large_result():
+    return {
+        'success': False,
+        'html': None,
+        'error': f'MJML output exceeded {MJML_MAX_OUTPUT_BYTES} bytes'
+    }
+
+
+def _mjml_search_context():
+    """What the MJML CLI search depends on: PATH, the module directory and the cwd."""
+    return [os.environ.get('PATH', os.defpath), str(_MODULE_DIR), os.getcwd()]
+
+
+def _mjml_bin_cache_path(context):
+    """File remembering the resolved MJML CLI path for one search context."""
+    digest = hashlib.blake2b(json.dumps(context).encode('utf-8'), digest_size=8).hexdigest()
+    return os.path.join(get_cache_dir(), f'mjml_bin-{digest}')
+
+
+def _find_mjml_path():
+    """Search PATH and local node_modules for the MJML CLI."""
     # Check global install first
     global_mjml = shutil.which("mjml")
     if global_mjml:
         return global_mjml
 
-    # Check local node_modules
-    local_paths = [
-        os.path.join(os.path.dirname(__file__), "node_modules", ".bin", "mjml"),
-        os.path.join(os.getcwd(), "node_modules", ".bin", "mjml"),
-    ]
-    for local_path in local_paths:
-        if os.path.isfile(local_path) and os.access(local_path, os.X_OK):
-            return local_path
+    # Check local node_modules (next to this module, then the working directory)
+    for local_path in (_LOCAL_MJML_BIN, Path.cwd() / _NODE_MJML_BIN):
+        if local_path.is_file() and os.access(local_path, os.X_OK):
+            return str(local_path)
 
     return None
 
 
+@cache
+def get_mjml_path():
+    """
+    Get the path to the MJML CLI executable.
+
+    The lookup runs once per process. A found path is remembered on disk
+    together with the PATH, module directory and working directory it was
+    found from, so a later process with the same search context skips the
+    search as long as that file is still executable, while other checkouts
+    and environments search for themselves. Call
+    invalidate_mjml_path_cache() after installing or removing MJML to
+    search again.
+    """
+    context = _mjml_search_context()
+    cache_path = _mjml_bin_cache_path(context)
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cached = json.load(f)
+        path = cached['path']
+        if cached['context'] == context and os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    path = _find_mjml_path()
+    if path:
+        try:
+            os.makedirs(get_cache_dir(), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'context': context, 'path': path}, f)
+        except OSError:
+            pass
+    return path
+
+
 def is_mjml_available():
     """Check if MJML CLI is installed and available."""
     return get_mjml_path() is not None
 
 
-def compile_mjml_to_html(mjml_content, minify=True, beautify=False):
+def invalidate_mjml_path_cache():
+    """Forget the cached MJML CLI location so the next lookup searches again."""
+    get_mjml_path.cache_clear()
+    # Compile cache keys name the CLI, so results compiled so far are dropped too
+    _renderer_fingerprint.cache_clear()
+    _compile_cached.cache_clear()
+    try:
+        os.unlink(_mjml_bin_cache_path(_mjml_search_context()))
+    except OSError:
+        pass
+
+
+def _compile_with_mrml(mjml_content, minify, beautify):
+    """
+    Compile MJML in-process with the mrml bindings, when they're installed.
+
+    Returns a compile_mjml_to_html-style result dict, or None if mrml is not
+    installed, beautified output was asked for (mrml has no beautifier), or
+    mrml could not parse the document; the caller then uses Node MJML.
+
+    mrml has no minifier either, so minify only disables its comments.
+    """
+    if mrml is None or beautify:
+        return None
+    try:
+        output = mrml.to_html(
+            mjml_content,
+            render_options=mrml.RenderOptions(disable_comments=bool(minify))
+        )
+    except Exception:
+        return None
+    return {
+        'success': True,
+        'html': output.content,
+        'error': None
+    }
+
+
+# Node script that keeps MJML loaded between compiles (see mjml_server.js)
+MJML_SERVER_SCRIPT = str(_MODULE_DIR / "mjml_server.js")
+
+# Seconds to wait for the MJML server to answer one request
+MJML_SERVER_TIMEOUT = 30
+
+# Unix socket of a shared MJML server started with
+# `node mjml_server.js <socket path>`. When set, compiles are sent there
+# first, so many Python processes share one Node/MJML instance instead of
+# each starting their own; if it can't be reached the local server is used.
+MJML_SERVER_SOCKET = os.environ.get('TEMPLATEFORGE_MJML_SOCKET')
+
+# Exchanges in a row that may fail before a server is given up on for the
+# rest of the process; compiles then go to the CLI instead of paying for a
+# respawn or a connection attempt every time
+MJML_SERVER_MAX_FAILURES = 3
+
+_mjml_server = None
+_mjml_server_failed = False
+_mjml_server_failures = 0
+_shared_server_failures = 0
+_mjml_server_lock = threading.Lock()
+
+
+def _stop_mjml_server():
+    """Terminate the persistent MJML server, if one is running."""
+    global _mjml_server
+    server, _mjml_server = _mjml_server, None
+    if server is not None and server.poll() is None:
+        server.kill()
+        server.wait()
+
+
+atexit.register(_stop_mjml_server)
+
+
+def _get_mjml_server():
+    """
+    Return the running MJML server process, starting it on first use.
+
+    Returns None when Node, the server script or the mjml package is not
+    available; callers then fall back to the one-shot MJML CLI.
+    """
+    global _mjml_server, _mjml_server_failed
+    if _mjml_server is not None and _mjml_server.poll() is None:
+        return _mjml_server
+    if _mjml_server_failed:
+        return None
+
+    node_bin = shutil.which("node")
+    if not node_bin or not os.path.isfile(MJML_SERVER_SCRIPT):
+        _mjml_server_failed = True
+        return None
+
+    try:
+        _mjml_server = _start_mjml_process(
+            [node_bin, MJML_SERVER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+    except OSError:
+        _mjml_server_failed = True
+        return None
+
+    return _mjml_server
+
+
+def _server_frame(mjml_content, minify, beautify):
+    """Encode one compile request as a length-prefixed frame for the server."""
+    payload = json.dumps({
+        "mjml": mjml_content,
+        "minify": minify,
+        "beautify": beautify,
+    }).encode("utf-8")
+    return b"%d\n" % len(payload) + payload
+
+
+def _exchange_with_server(out_fd, in_fd, request, count):
+    """
+    Write request frames to the server while reading its replies.
+
+    Writing and reading are interleaved with select(), in PIPE_BUF-sized
+    writes, so neither side can block on a full pipe while the other
+    waits. Returns the count decoded replies, in order.
+    """
+    pending = memoryview(request)
+    buffer = bytearray()
+    replies = []
+    deadline = time.monotonic() + MJML_SERVER_TIMEOUT
+    while len(replies) < count:
+        remaining = deadline - time.monotonic()
+        writers = [out_fd] if pending else []
+        readable, writable, _ = select.select([in_fd], writers, [], max(remaining, 0))
+        if not readable and not writable:
+            raise TimeoutError("MJML server did not respond")
+        if writable:
+            pending = pending[os.write(out_fd, pending[:select.PIPE_BUF]):]
+        if readable:
+            data = os.read(in_fd, 65536)
+            if not data:
+                raise EOFError("MJML server exited")
+            buffer += data
+            while True:
+                newline = buffer.find(b"\n")
+                if newline == -1:
+                    break
+                end = newline + 1 + int(buffer[:newline])
+                if len(buffer) < end:
+                    break
+                replies.append(json.loads(buffer[newline + 1:end]))
+                del buffer[:end]
+                # Each reply restarts the clock, so long batches don't time out
+                deadline = time.monotonic() + MJML_SERVER_TIMEOUT
+    return replies
+
+
+def _exchange_with_shared_server(request, count):
+    """Run one exchange with the server at MJML_SERVER_SOCKET; None if it fails."""
+    global _shared_server_failures
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(MJML_SERVER_TIMEOUT)
+            sock.connect(MJML_SERVER_SOCKET)
+            sock.setblocking(False)
+            replies = _exchange_with_server(sock.fileno(), sock.fileno(), request, count)
+    except (OSError, EOFError, ValueError):
+        _shared_server_failures += 1
+        return None
+    _shared_server_failures = 0
+    return replies
+
+
+def _compile_batch_with_server(mjml_contents, minify, beautify):
+    """
+    Compile documents through the persistent server in one pipelined exchange.
+
+    Returns a list of compile_mjml_to_html-style result dicts, or None if
+    the server is unavailable or failed (the caller should fall back to
+    the CLI). The shared server at MJML_SERVER_SOCKET is tried first.
+    """
+    global _mjml_server_failed, _mjml_server_failures
+    request = b"".join(_server_frame(content, minify, beautify) for content in mjml_contents)
+
+    replies = None
+    if MJML_SERVER_SOCKET and _shared_server_failures < MJML_SERVER_MAX_FAILURES:
+        replies = _exchange_with_shared_server(request, len(mjml_contents))
+
+    if replies is None:
+        with _mjml_server_lock:
+            server = _get_mjml_server()
+            if server is None:
+                return None
+            try:
+                replies = _exchange_with_server(server.stdin.fileno(), server.stdout.fileno(),
+                                                request, len(mjml_contents))
+            except EOFError:
+                # The server exited; most likely the mjml package can't be loaded
+                _mjml_server_failed = True
+                _stop_mjml_server()
+                return None
+            except (OSError, ValueError):
+                # Timed out or answered garbage; a fresh server is started
+                # next time, unless this keeps happening
+                _stop_mjml_server()
+                _mjml_server_failures += 1
+                if _mjml_server_failures >= MJML_SERVER_MAX_FAILURES:
+                    _mjml_server_failed = True
+                return None
+            _mjml_server_failures = 0
+
+    results = []
+    for reply in replies:
+        if reply.get("error"):
+            results.append({
+                'success': False,
+                'html': None,
+                'error': reply["error"]
+            })
+        else:
+            results.append({
+                'success': True,
+                'html': reply.get("html", ""),
+                'error': None
+            })
+    return results
+
+
+def _compile_with_server(mjml_content, minify, beautify):
+    """
+    Compile MJML through the persistent server.
+
+    Returns a compile_mjml_to_html-style result dict, or None if the server
+    is unavailable or failed (the caller should fall back to the CLI).
+    """
+    results = _compile_batch_with_server([mjml_content], minify, beautify)
+    return results[0] if results is not None else None
+
+
+# Opt in (TEMPLATEFORGE_HTMLMIN=1) to minify with htmlmin in-process rather
+# than with MJML's minifier, so minified and unminified compiles share one
+# cached compile. htmlmin only collapses markup whitespace: unlike MJML's
+# minifier it leaves the CSS in <style> blocks as written, so the output is
+# larger and differs from MJML's. Ignored when htmlmin is not installed.
+MJML_MINIFY_WITH_HTMLMIN = os.environ.get('TEMPLATEFORGE_HTMLMIN') == '1'
+
+
+def _minifies_in_process(minify, beautify):
+    """Whether minified output is produced with htmlmin instead of by MJML."""
+    return bool(minify) and not beautify and MJML_MINIFY_WITH_HTMLMIN and htmlmin is not None
+
+
+def _minified_result(result):
+    """Minify a successful compile result's HTML in-process with htmlmin."""
+    if not result['success']:
+        return result
+    # Comments are kept: Outlook conditional comments are markup in email
+    return dict(result, html=htmlmin.minify(result['html'], remove_empty_space=True))
+
+
+def _check_mjml_content(mjml_content):
+    """Return an error result for input that can't compile, without running MJML."""
+    if not mjml_content or mjml_content.isspace():
+        error = 'Empty MJML content'
+    elif '<mjml' not in mjml_content:
+        error = 'MJML content has no <mjml> root element'
+    else:
+        return None
+    return {
+        'success': False,
+        'html': None,
+        'error': error
+    }
+
+
+class _CompileFailed(Exception):
+    """Raised inside the compile cache so failed compiles are not cached."""
+
+    def __init__(self, result):
+        super().__init__(result['error'])
+        self.result = result
+
+
+# Upper bound on the on-disk compiled-HTML cache. It is checked as entries
+# are stored, and the least recently used ones are removed until it fits.
+MJML_CACHE_MAX_BYTES = 256 << 20
+MJML_CACHE_TRIM_INTERVAL = 100
+
+_compiled_cache_stores = 0
+
+
+def _mjml_package_version(package_dir):
+    """The version in an mjml package directory's package.json, or None."""
+    try:
+        with open(os.path.join(package_dir, 'package.json'), encoding='utf-8') as f:
+            return json.load(f).get('version')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+@cache
+def _renderer_fingerprint():
+    """
+    Describe the renderers compiles can go through, for compile cache keys.
+
+    Names the mrml version, the mjml package the server loads, and the CLI
+    path with its package version. Installing, upgrading or switching any of
+    them therefore starts a fresh set of cache entries instead of serving
+    HTML made by another renderer.
+    """
+    parts = []
+    if mrml is not None:
+        try:
+            parts.append('mrml=' + importlib.metadata.version('mrml'))
+        except importlib.metadata.PackageNotFoundError:
+            parts.append('mrml=unknown')
+    server_package = Path(MJML_SERVER_SCRIPT).parent / 'node_modules' / 'mjml'
+    parts.append(f'server={_mjml_package_version(server_package)}')
+    mjml_bin = get_mjml_path()
+    if mjml_bin:
+        # node_modules/.bin/mjml links to <mjml package>/bin/mjml
+        cli_package = Path(os.path.realpath(mjml_bin)).parent.parent
+        parts.append(f'cli={mjml_bin}@{_mjml_package_version(cli_package)}')
+    return '|'.join(parts)
+
+
+def _compiled_cache_dir():
+    """Root of the on-disk compiled-HTML cache."""
+    return os.path.join(get_cache_dir(), 'mjml')
+
+
+def _compiled_cache_path(mjml_content, minify, beautify):
+    """
+    Disk cache location for compiled HTML, addressed by content, flags and renderer.
+
+    Entries are sharded into subdirectories by the first two hex digits so
+    no single directory grows to tens of thousands of files.
+    """
+    digest = hashlib.blake2b(mjml_content.encode('utf-8'), digest_size=20)
+    digest.update(b'|minify=%d|beautify=%d|' % (bool(minify), bool(beautify)))
+    digest.update(_renderer_fingerprint().encode('utf-8'))
+    key = digest.hexdigest()
+    return os.path.join(_compiled_cache_dir(), key[:2], f"{key}.html")
+
+
+def _load_compiled_html(mjml_content, minify, beautify):
+    """Return cached compiled HTML, or None if it isn't cached."""
+    path = _compiled_cache_path(mjml_content, minify, beautify)
+    try:
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        # A hit counts as a use, so trimming removes the least recently used
+        os.utime(path)
+    except OSError:
+        return None
+    return html
+
+
+def _trim_compiled_cache():
+    """Remove the least recently used disk cache entries beyond MJML_CACHE_MAX_BYTES."""
+    entries = []
+    total = 0
+    try:
+        for shard in os.scandir(_compiled_cache_dir()):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+    except OSError:
+        return
+    entries.sort()
+    for _, size, path in entries:
+        if total <= MJML_CACHE_MAX_BYTES:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        total -= size
+
+
+def _store_compiled_html(mjml_content, minify, beautify, html):
+    """Atomically write compiled HTML to the disk cache; caching is best-effort."""
+    global _compiled_cache_stores
+    path = _compiled_cache_path(mjml_content, minify, beautify)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(path),
+                                         suffix='.tmp', delete=False) as f:
+            f.write(html)
+        os.replace(f.name, path)
+    except OSError:
+        return
+
+    # Trim on a process's first store and then every MJML_CACHE_TRIM_INTERVAL
+    _compiled_cache_stores += 1
+    if (_compiled_cache_stores - 1) % MJML_CACHE_TRIM_INTERVAL == 0:
+        _trim_compiled_cache()
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(mjml_content, minify, beautify):
+    """Compiled HTML for an MJML document; raises _CompileFailed on errors."""
+    html = _load_compiled_html(mjml_content, minify, beautify)
+    if html is not None:
+        return html
+    result = _compile_mjml_uncached(mjml_content, minify, beautify)
+    if not result['success']:
+        raise _CompileFailed(result)
+    _store_compiled_html(mjml_content, minify, beautify, result['html'])
+    return result['html']
+
+
+def compile_mjml_to_html(mjml_content, minify=True, beautify=False, enable_cache=True):
     """
     Compile MJML markup to production-ready HTML using the MJML CLI.
 
@@ -47,6 +617,8 @@ def compile_mjml_to_html(mjml_content, minify=True, beautify=False):
         mjml_content: MJML string to compile
         minify: Whether to minify the output HTML (default: True)
         beautify: Whether to beautify the output HTML (default: False)
+        enable_cache: Use the in-memory and on-disk compiled-HTML caches
+            (default: True); pass False to always compile afresh
 
     Returns:
         dict with keys:
@@ -55,7 +627,80 @@ def compile_mjml_to_html(mjml_content, minify=True, beautify=False):
             - 'error': error message (if failed)
 
     Note: Requires MJML CLI to be installed (`npm install -g mjml`)
+
+    Compiles run in-process with mrml when that optional package is
+    installed, then go through a persistent Node process (mjml_server.js)
+    when the local mjml package can be loaded, and otherwise run the MJML
+    CLI once per call. Successful results are cached in memory and on disk,
+    keyed by the full MJML text, the flags and the installed renderers
+    (mrml and mjml versions, CLI path). With MJML_MINIFY_WITH_HTMLMIN set,
+    minified output is made by minifying the cached unminified HTML here.
+
+    mrml has no minifier: under mrml, minify=True only drops HTML comments,
+    so its output is larger than MJML's minified HTML.
     """
+    invalid = _check_mjml_content(mjml_content)
+    if invalid is not None:
+        return invalid
+
+    if _minifies_in_process(minify, beautify):
+        # Compile (and cache) unminified HTML, then minify it here
+        return _minified_result(compile_mjml_to_html(mjml_content, minify=False,
+                                                     enable_cache=enable_cache))
+
+    if not enable_cache:
+        return _compile_mjml_uncached(mjml_content, bool(minify), bool(beautify))
+
+    try:
+        html = _compile_cached(mjml_content, bool(minify), bool(beautify))
+    except _CompileFailed as e:
+        return e.result
+    return {
+        'success': True,
+        'html': html,
+        'error': None
+    }
+
+
+def clear_compiled_cache(disk=False):
+    """
+    Forget compiled HTML held in memory.
+
+    With disk=True the on-disk cache is deleted as well, e.g. to drop
+    entries written before a renderer problem was fixed.
+    """
+    _compile_cached.cache_clear()
+    if disk:
+        shutil.rmtree(_compiled_cache_dir(), ignore_errors=True)
+
+
+# Scratch space for CLI input and output files; None means the default
+# tempdir. Point TEMPLATEFORGE_SCRATCH_DIR at a tmpfs such as /dev/shm so
+# compiles never wait on disk writes. tmpfs is small and shared, so when it
+# is full or missing the default tempdir is used instead.
+_SCRATCH_DIR = os.environ.get('TEMPLATEFORGE_SCRATCH_DIR') or None
+
+
+def _scratch_file():
+    """Temp file in the scratch dir, or the default tempdir if that fails."""
+    if _SCRATCH_DIR:
+        try:
+            return tempfile.TemporaryFile(dir=_SCRATCH_DIR)
+        except OSError:
+            pass
+    return tempfile.TemporaryFile()
+
+
+def _compile_mjml_uncached(mjml_content, minify, beautify):
+    """Compile one document via mrml, the MJML server or the CLI (see compile_mjml_to_html)."""
+    rendered = _compile_with_mrml(mjml_content, minify, beautify)
+    if rendered is not None:
+        return rendered
+
+    served = _compile_with_server(mjml_content, minify, beautify)
+    if served is not None:
+        return served
+
     mjml_bin = get_mjml_path()
     if not mjml_bin:
         return {
@@ -65,44 +710,46 @@ def compile_mjml_to_html(mjml_content, minify=True, beautify=False):
         }
 
     try:
-        # Create temporary file for MJML input
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.mjml', delete=False) as f:
-            f.write(mjml_content)
-            mjml_file_path = f.name
-
-        try:
-            # Build command
-            cmd = [mjml_bin, mjml_file_path, '-s']  # -s outputs to stdout
-
-            if minify:
-                cmd.extend(['--config.minify', 'true'])
-            if beautify:
-                cmd.extend(['--config.beautify', 'true'])
-
-            # Run MJML CLI
-            result = subprocess.run(
+        # Build command: -i reads MJML from stdin, -s writes HTML to stdout
+        cmd = [mjml_bin, '-i', '-s']
+
+        if minify:
+            cmd.extend(['--config.minify', 'true'])
+        if beautify:
+            cmd.extend(['--config.beautify', 'true'])
+
+        # Run MJML CLI, letting it write the HTML straight into a temp file
+        # so large documents aren't accumulated in memory chunk by chunk.
+        # Each call gets its own file: a reused one would also be inherited,
+        # offset and all, by forked worker processes.
+        with _scratch_file() as stdout_file:
+            result = _run_mjml_process(
                 cmd,
-                capture_output=True,
-                text=True,
+                input=mjml_content.encode('utf-8'),
+                stdout=stdout_file,
+                stderr=subprocess.PIPE,
                 timeout=30
             )
-
-            if result.returncode == 0:
-                return {
-                    'success': True,
-                    'html': result.stdout,
-                    'error': None
-                }
-            else:
-                return {
-                    'success': False,
-                    'html': None,
-                    'error': result.stderr or 'MJML compilation failed'
-                }
-
-        finally:
-            # Clean up temp file
-            os.unlink(mjml_file_path)
+            # Check the size before reading so runaway output is never loaded
+            too_large = os.fstat(stdout_file.fileno()).st_size > MJML_MAX_OUTPUT_BYTES
+            if result.returncode == 0 and not too_large:
+                stdout_file.seek(0)
+                html = stdout_file.read().decode('utf-8', errors='replace')
+
+        if too_large:
+            return _output_too_large_result()
+        if result.returncode == 0:
+            return {
+                'success': True,
+                'html': html,
+                'error': None
+            }
+        else:
+            return {
+                'success': False,
+                'html': None,
+                'error': _error_message(result.stderr)
+            }
 
     except subprocess.TimeoutExpired:
         return {
@@ -118,6 +765,147 @@ def compile_mjml_to_html(mjml_content, minify=True, beautify=False):
         }
 
 
+def compile_mjml_batch(mjml_contents, minify=True, beautify=False):
+    """
+    Compile several MJML documents, starting Node.js and MJML only once.
+
+    Documents already in the compiled-HTML cache are not recompiled. The
+    rest are rendered with mrml when installed, then go through the
+    persistent MJML server when it is available;
+    otherwise each input is written to a shared temporary directory and a
+    single MJML CLI run writes the matching .html files to an output directory.
+
+    Args:
+        mjml_contents: List of MJML strings to compile
+        minify: Whether to minify the output HTML (default: True)
+        beautify: Whether to beautify the output HTML (default: False)
+
+    Returns:
+        List of result dicts (same shape as compile_mjml_to_html), in input order
+    """
+    mjml_contents = list(mjml_contents)
+    if _minifies_in_process(minify, beautify):
+        return [_minified_result(r) for r in compile_mjml_batch(mjml_contents, minify=False)]
+
+    results = [None] * len(mjml_contents)
+
+    # Invalid documents and ones already in the compiled-HTML cache skip compilation
+    pending = []
+    for index, content in enumerate(mjml_contents):
+        invalid = _check_mjml_content(content)
+        if invalid is not None:
+            results[index] = invalid
+            continue
+        html = _load_compiled_html(content, minify, beautify)
+        if html is not None:
+            results[index] = {'success': True, 'html': html, 'error': None}
+        else:
+            pending.append(index)
+
+    # mrml renders in-process; documents it can't handle go to Node MJML
+    compiled = {}
+    for index in pending:
+        rendered = _compile_with_mrml(mjml_contents[index], minify, beautify)
+        if rendered is not None:
+            compiled[index] = rendered
+    pending_node = [index for index in pending if index not in compiled]
+
+    # The persistent server takes the whole batch in one pipelined exchange
+    served = None
+    if pending_node:
+        served = _compile_batch_with_server(
+            [mjml_contents[index] for index in pending_node], minify, beautify
+        )
+    if served is not None:
+        compiled.update(zip(pending_node, served))
+        remaining = []
+    else:
+        remaining = pending_node
+    if remaining:
+        cli_results = _compile_batch_with_cli(
+            [mjml_contents[index] for index in remaining], minify, beautify
+        )
+        compiled.update(zip(remaining, cli_results))
+
+    for index in pending:
+        result = compiled[index]
+        if result['success']:
+            _store_compiled_html(mjml_contents[index], minify, beautify, result['html'])
+        results[index] = result
+    return results
+
+
+def _compile_batch_with_cli(mjml_contents, minify, beautify):
+    """Run the MJML CLI once over a list of documents (see compile_mjml_batch)."""
+    if len(mjml_contents) <= 1:
+        return [compile_mjml_to_html(content, minify=minify, beautify=beautify)
+                for content in mjml_contents]
+
+    mjml_bin = get_mjml_path()
+    if not mjml_bin:
+        return [compile_mjml_to_html(content, minify=minify, beautify=beautify)
+                for content in mjml_contents]
+
+    try:
+        try:
+            return _run_cli_batch(mjml_bin, mjml_contents, minify, beautify, _SCRATCH_DIR)
+        except OSError:
+            if _SCRATCH_DIR is None:
+                raise
+            # The scratch dir is full or gone: retry in the default tempdir
+            return _run_cli_batch(mjml_bin, mjml_contents, minify, beautify, None)
+
+    except subprocess.TimeoutExpired:
+        error = 'MJML compilation timed out'
+    except Exception as e:
+        error = f'MJML compilation error: {str(e)}'
+    return [{'success': False, 'html': None, 'error': error} for _ in mjml_contents]
+
+
+def _run_cli_batch(mjml_bin, mjml_contents, minify, beautify, scratch_dir):
+    """Compile documents with one CLI run in a temp dir under scratch_dir."""
+    with tempfile.TemporaryDirectory(prefix='mjml-batch-', dir=scratch_dir) as batch_dir:
+        out_dir = os.path.join(batch_dir, 'out')
+        os.mkdir(out_dir)
+
+        input_paths = []
+        for index, content in enumerate(mjml_contents):
+            path = os.path.join(batch_dir, f'{index}.mjml')
+            with open(path, 'wb') as f:
+                f.write(content.encode('utf-8'))
+            input_paths.append(path)
+
+        cmd = [mjml_bin, *input_paths, '-o', out_dir]
+        if minify:
+            cmd.extend(['--config.minify', 'true'])
+        if beautify:
+            cmd.extend(['--config.beautify', 'true'])
+
+        # The HTML is read from out_dir, and documents without output are retried
+        _run_mjml_process(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=30 + len(mjml_contents)
+        )
+
+        # A non-zero exit can come from a single bad document; the CLI
+        # still writes the HTML for every other one, so keep those
+        results = []
+        for index, content in enumerate(mjml_contents):
+            html_path = os.path.join(out_dir, f'{index}.html')
+            if (os.path.isfile(html_path)
+                    and os.path.getsize(html_path) <= MJML_MAX_OUTPUT_BYTES):
+                with open(html_path, 'rb') as f:
+                    html = f.read().decode('utf-8', errors='replace')
+                results.append({'success': True, 'html': html, 'error': None})
+            else:
+                # The CLI reports errors for the batch as a whole, so
+                # recompile documents without output alone to get their own error
+                results.append(compile_mjml_to_html(content, minify=minify, beautify=beautify))
+        return results
+
+
 def compile_template(template_data, minify=True):
     """
     Compile a template's MJML to HTML.
@@ -128,14 +916,30 @@ def compile_template(template_data, minify=True):
 
     Returns:
         Updated template_data with 'compiled_html' key added
+
+    Goes through compile_mjml_to_html, so re-compiling MJML seen earlier in
+    the process is served from its in-memory cache without touching disk.
     """
-    if 'mjml' not in template_data:
-        template_data['compiled_html'] = None
-        template_data['compilation_error'] = 'No MJML content to compile'
-        return template_data
+    if _templates_with_mjml([template_data]):
+        _apply_compile_result(template_data,
+                              compile_mjml_to_html(template_data['mjml'], minify=minify))
+    return template_data
 
-    result = compile_mjml_to_html(template_data['mjml'], minify=minify)
 
+def _templates_with_mjml(templates):
+    """Mark templates without MJML as failed and return the ones to compile."""
+    to_compile = []
+    for template_data in templates:
+        if 'mjml' not in template_data:
+            template_data['compiled_html'] = None
+            template_data['compilation_error'] = 'No MJML content to compile'
+        else:
+            to_compile.append(template_data)
+    return to_compile
+
+
+def _apply_compile_result(template_data, result):
+    """Store a compile result on a template as compiled_html / compilation_error."""
     if result['success']:
         template_data['compiled_html'] = result['html']
         template_data['compilation_error'] = None
@@ -143,21 +947,369 @@ def compile_template(template_data, minify=True):
         template_data['compiled_html'] = None
         template_data['compilation_error'] = result['error']
 
+
+def compile_templates(templates, minify=True):
+    """
+    Compile the MJML of many templates with one batched MJML CLI run.
+
+    Args:
+        templates: List of template dicts, each normally with an 'mjml' key
+        minify: Whether to minify output
+
+    Returns:
+        The same list, each template updated as compile_template would
+    """
+    to_compile = _templates_with_mjml(templates)
+
+    results = compile_mjml_batch([t['mjml'] for t in to_compile], minify=minify)
+    for template_data, result in zip(to_compile, results):
+        _apply_compile_result(template_data, result)
+
+    return templates
+
+
+_compile_pool = None
+_compile_pool_lock = threading.Lock()
+
+# Workers are spawned, not forked: a forked worker would inherit this
+# module's MJML server handle and pipes, its locks and any open temp files
+_POOL_CONTEXT = multiprocessing.get_context('spawn')
+
+
+def _get_compile_pool():
+    """Return the shared compile process pool, creating it on first use."""
+    global _compile_pool
+    with _compile_pool_lock:
+        if _compile_pool is None:
+            _compile_pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                                mp_context=_POOL_CONTEXT)
+            atexit.register(_compile_pool.shutdown)
+        return _compile_pool
+
+
+def _compile_in_worker(mjml_content, minify):
+    """Process-pool entry point; each worker keeps its own MJML server."""
+    return compile_mjml_to_html(mjml_content, minify=minify)
+
+
+def compile_templates_parallel(templates, minify=True):
+    """
+    Compile many templates' MJML across a persistent pool of worker processes.
+
+    For synchronous callers that want compiles spread over every core: each
+    worker process runs its own MJML server (or CLI calls), so documents
+    compile side by side instead of queueing on one Node process.
+    Templates are updated in place as compile_template would. The largest
+    documents are submitted first so one big template doesn't finish last
+    on an otherwise idle pool.
+
+    Returns:
+        The same list of templates
+    """
+    to_compile = _templates_with_mjml(templates)
+    to_compile.sort(key=lambda t: len(t['mjml']), reverse=True)
+
+    pool = _get_compile_pool()
+    futures = [pool.submit(_compile_in_worker, t['mjml'], minify) for t in to_compile]
+    for template_data, future in zip(to_compile, futures):
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {
+                'success': False,
+                'html': None,
+                'error': f'MJML compilation error: {str(e)}'
+            }
+        _apply_compile_result(template_data, result)
+
+    return templates
+
+
+async def compile_mjml_async(mjml_content, minify=True, beautify=False, semaphore=None):
+    """
+    Compile MJML to HTML in a MJML CLI subprocess without blocking the event loop.
+
+    The MJML is piped to the CLI on stdin; results are shared with the
+    compiled-HTML disk cache. Pass a shared asyncio.Semaphore to bound how
+    many compiles run at once.
+
+    Returns:
+        dict with the same keys as compile_mjml_to_html
+    """
+    # asyncio is imported where it's used: it is the costliest import in
+    # this module and only the async entry points need it
+    import asyncio
+
+    invalid = _check_mjml_content(mjml_content)
+    if invalid is not None:
+        return invalid
+
+    if _minifies_in_process(minify, beautify):
+        return _minified_result(await compile_mjml_async(mjml_content, minify=False, semaphore=semaphore))
+
+    cached = _load_compiled_html(mjml_content, minify, beautify)
+    if cached is not None:
+        return {
+            'success': True,
+            'html': cached,
+            'error': None
+        }
+
+    rendered = _compile_with_mrml(mjml_content, minify, beautify)
+    if rendered is not None:
+        _store_compiled_html(mjml_content, minify, beautify, rendered['html'])
+        return rendered
+
+    mjml_bin = get_mjml_path()
+    if not mjml_bin:
+        return {
+            'success': False,
+            'error': 'MJML CLI not found. Install with: npm install -g mjml (or npm install mjml locally)',
+            'html': None
+        }
+
+    cmd = [mjml_bin, '-i', '-s']
+    if minify:
+        cmd.extend(['--config.minify', 'true'])
+    if beautify:
+        cmd.extend(['--config.beautify', 'true'])
+
+    async def run():
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True
+        )
+        _limit_child_resources(proc.pid)
+
+        async def write_input():
+            try:
+                proc.stdin.write(mjml_content.encode('utf-8'))
+                await proc.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # MJML exited early; its exit status says why
+            proc.stdin.close()
+
+        async def read_output():
+            # Read in chunks and stop MJML once the cap is passed, so runaway
+            # output is never buffered whole (the sync path caps its file instead)
+            chunks = []
+            size = 0
+            while True:
+                chunk = await proc.stdout.read(1 << 16)
+                if not chunk:
+                    return b''.join(chunks)
+                size += len(chunk)
+                if size > MJML_MAX_OUTPUT_BYTES:
+                    _kill_mjml_process(proc)
+                    return None
+                chunks.append(chunk)
+
+        async def read_error():
+            # Only the start of stderr becomes the error message
+            head = b''
+            while True:
+                chunk = await proc.stderr.read(1 << 16)
+                if not chunk:
+                    return head
+                if len(head) < MJML_MAX_ERROR_BYTES:
+                    head += chunk[:MJML_MAX_ERROR_BYTES - len(head)]
+
+        async def exchange():
+            _, out, err = await asyncio.gather(write_input(), read_output(), read_error())
+            await proc.wait()
+            return out, err
+
+        try:
+            out, err = await asyncio.wait_for(exchange(), timeout=30)
+        except BaseException:
+            # Timed out or cancelled: don't leave the MJML process running
+            if proc.returncode is None:
+                _kill_mjml_process(proc)
+                await proc.wait()
+            raise
+        return proc.returncode, out, err
+
+    try:
+        if semaphore is not None:
+            async with semaphore:
+                returncode, out, err = await run()
+        else:
+            returncode, out, err = await run()
+    except asyncio.TimeoutError:
+        return {
+            'success': False,
+            'html': None,
+            'error': 'MJML compilation timed out'
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'html': None,
+            'error': f'MJML compilation error: {str(e)}'
+        }
+
+    if out is None:
+        return _output_too_large_result()
+    if returncode == 0:
+        html = out.decode('utf-8', errors='replace')
+        _store_compiled_html(mjml_content, minify, beautify, html)
+        return {
+            'success': True,
+            'html': html,
+            'error': None
+        }
+    return {
+        'success': False,
+        'html': None,
+        'error': _error_message(err)
+    }
+
+
+async def compile_template_async(template_data, minify=True, semaphore=None):
+    """
+    Coroutine version of compile_template.
+
+    Args:
+        template_data: Dict with 'mjml' key containing MJML string
+        minify: Whether to minify output
+        semaphore: Optional asyncio.Semaphore bounding concurrent compiles
+
+    Returns:
+        Updated template_data with 'compiled_html' key added
+    """
+    if 'mjml' not in template_data:
+        template_data['compiled_html'] = None
+        template_data['compilation_error'] = 'No MJML content to compile'
+        return template_data
+
+    result = await compile_mjml_async(template_data['mjml'], minify=minify, semaphore=semaphore)
+    _apply_compile_result(template_data, result)
     return template_data
 
 
-def get_mjml_head(skin_name="apple_light"):
-    """Generate MJML head section with styles and fonts."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+async def compile_templates_async(templates, minify=True, max_concurrency=None):
+    """
+    Compile many templates' MJML concurrently, one MJML CLI process each.
+
+    At most max_concurrency (default: CPU count) compiles run at a time.
+    Templates are updated in place as compile_template would.
+
+    Returns:
+        The same list of templates
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_concurrency or os.cpu_count() or 1)
+    await asyncio.gather(*[
+        compile_template_async(template_data, minify=minify, semaphore=semaphore)
+        for template_data in templates
+    ])
+    return templates
+
+
+async def compile_templates_streaming(templates, minify=True, concurrency=None):
+    """
+    Compile templates' MJML as they arrive, yielding each one once compiled.
+
+    templates may be any iterable, including a lazy one (such as templates
+    being generated on the fly); it is consumed only as fast as compiles
+    finish, with at most concurrency (default: min(4, CPU count)) MJML
+    processes in flight. Templates are updated in place as compile_template
+    would and yielded in completion order.
+    """
+    import asyncio
+
+    limit = concurrency or min(4, os.cpu_count() or 1)
+    source = iter(templates)
+    in_flight = set()
 
-    return f'''  <mj-head>
-    <mj-title>{{{{emailSubject}}}}</mj-title>
-    <mj-preview>{{{{preheader}}}}</mj-preview>
+    def refill():
+        for template_data in source:
+            in_flight.add(asyncio.ensure_future(compile_template_async(template_data, minify=minify)))
+            if len(in_flight) >= limit:
+                break
+
+    refill()
+    try:
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            in_flight.difference_update(done)
+            refill()
+            for task in done:
+                yield task.result()
+    finally:
+        # The consumer stopped early: cancel the remaining compiles and wait
+        # for them, so their MJML processes are killed and reaped here
+        for task in in_flight:
+            task.cancel()
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+class _PassThrough(dict):
+    """Format fields that format_map leaves as {{name}} runtime placeholders when unknown."""
+
+    def __missing__(self, key):
+        return "{{" + key + "}}"
+
+
+# Format fields for the MJML templates below, one flat mapping per skin: the
+# skin's tokens (brandBG, brandPrimary, ...) plus image placeholders as
+# img_<key> and copy tokens as copy_<key>. Built once at import. Any other
+# {field} in a template is a runtime placeholder and comes out as {{field}}.
+_SKIN_VIEW = {
+    name: _PassThrough({
+        **skin,
+        **{f"img_{key}": value for key, value in IMAGE_PLACEHOLDERS.items()},
+        **{f"copy_{key}": value for key, value in COPY_TOKENS.items()},
+    })
+    for name, skin in DESIGN_SKINS.items()
+}
+
+
+def _skin_view(skin_name):
+    """Template fields for a skin; unknown skins fall back to apple_light."""
+    return _SKIN_VIEW.get(skin_name) or _SKIN_VIEW["apple_light"]
+
+
+def _repeat_fragment(fragment, items):
+    """
+    Repeat a section-template fragment once per item.
+
+    The fragment's $-placeholders (string.Template) are filled from each
+    item in turn, so its {skin fields} are left for format_map.
+    """
+    fragment = Template(fragment)
+    return "".join(fragment.substitute(item) for item in items)
+
+
+_PLAN_FEATURE_MJML = '''        <mj-text font-size="13px" color="{brandText}" padding="0 16px $bottom">
+          &#10003; {plan${plan}Feature${n}}
+        </mj-text>
+'''
+
+
+def _plan_features(plan, count):
+    """Check-marked feature rows for a pricing plan; the last is padded more below."""
+    return _repeat_fragment(_PLAN_FEATURE_MJML, [
+        {"plan": plan, "n": n, "bottom": "16px" if n == count else "6px"}
+        for n in range(1, count + 1)
+    ])
+
+
+# Head and section markup as str.format templates over _skin_view fields.
+# Output depends only on the skin, so renders are cached per skin: the head
+# by its own builder, sections through _rendered (see _SECTION_TEMPLATES).
+_HEAD_MJML = '''  <mj-head>
+    <mj-title>{emailSubject}</mj-title>
+    <mj-preview>{preheader}</mj-preview>
     <mj-attributes>
-      <mj-all font-family="{skin['brandFont']}" />
-      <mj-text font-size="16px" color="{skin['brandText']}" line-height="1.6" />
-      <mj-button background-color="{skin['brandAccent']}" color="#ffffff" font-size="16px" font-weight="600" border-radius="8px" padding="16px 32px" />
-      <mj-section background-color="{skin['brandBG']}" padding="24px" />
+      <mj-all font-family="{brandFont}" />
+      <mj-text font-size="16px" color="{brandText}" line-height="1.6" />
+      <mj-button background-color="{brandAccent}" color="#ffffff" font-size="16px" font-weight="600" border-radius="8px" padding="16px 32px" />
+      <mj-section background-color="{brandBG}" padding="24px" />
     </mj-attributes>
     <mj-style>
       .headline {{ font-size: 32px; line-height: 1.2; }}
@@ -166,399 +1318,422 @@ def get_mjml_head(skin_name="apple_light"):
   </mj-head>'''
 
 
-def section_to_mjml_hero(skin_name="apple_light"):
-    """Convert hero section to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+@lru_cache(maxsize=8)
+def get_mjml_head(skin_name="apple_light"):
+    """Generate MJML head section with styles and fonts."""
+    return _HEAD_MJML.format_map(_skin_view(skin_name))
+
 
-    return f'''    <mj-section padding="0">
+_HERO_MJML = '''    <mj-section padding="0">
       <mj-column>
-        <mj-image src="{IMAGE_PLACEHOLDERS['hero']}" alt="{{{{heroAlt}}}}" width="640px" />
+        <mj-image src="{img_hero}" alt="{heroAlt}" width="640px" />
       </mj-column>
     </mj-section>
     <mj-section padding="24px 24px 32px">
       <mj-column>
-        <mj-text align="center" font-size="32px" color="{skin['brandPrimary']}" padding="0 0 16px">
-          {COPY_TOKENS['headline']}
+        <mj-text align="center" font-size="32px" color="{brandPrimary}" padding="0 0 16px">
+          {copy_headline}
         </mj-text>
-        <mj-text align="center" font-size="18px" color="{skin['brandSecondary']}" padding="0 0 24px">
-          {COPY_TOKENS['subheadline']}
+        <mj-text align="center" font-size="18px" color="{brandSecondary}" padding="0 0 24px">
+          {copy_subheadline}
         </mj-text>
-        <mj-button href="{{{{ctaUrl}}}}" background-color="{skin['brandAccent']}">
-          {COPY_TOKENS['ctaLabel']}
+        <mj-button href="{ctaUrl}" background-color="{brandAccent}">
+          {copy_ctaLabel}
         </mj-button>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_subhero(skin_name="apple_light"):
-    """Convert subhero section to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_hero(skin_name="apple_light"):
+    """Convert hero section to MJML."""
+    return _rendered("hero", skin_name)
 
-    return f'''    <mj-section padding="24px">
+
+_SUBHERO_MJML = '''    <mj-section padding="24px">
       <mj-column>
-        <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="{{{{imageAlt}}}}" width="300px" />
-        <mj-text align="center" font-size="24px" color="{skin['brandPrimary']}" padding="16px 0 8px">
-          {COPY_TOKENS['headline']}
+        <mj-image src="{img_product}" alt="{imageAlt}" width="300px" />
+        <mj-text align="center" font-size="24px" color="{brandPrimary}" padding="16px 0 8px">
+          {copy_headline}
         </mj-text>
-        <mj-text align="center" color="{skin['brandText']}">
-          {COPY_TOKENS['bodyText']}
+        <mj-text align="center" color="{brandText}">
+          {copy_bodyText}
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_1col_text(skin_name="apple_light"):
-    """Convert single column text to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_subhero(skin_name="apple_light"):
+    """Convert subhero section to MJML."""
+    return _rendered("subhero", skin_name)
 
-    return f'''    <mj-section padding="24px">
+
+_1COL_TEXT_MJML = '''    <mj-section padding="24px">
       <mj-column>
-        <mj-text font-size="24px" color="{skin['brandPrimary']}" padding="0 0 12px">
-          {COPY_TOKENS['headline']}
+        <mj-text font-size="24px" color="{brandPrimary}" padding="0 0 12px">
+          {copy_headline}
         </mj-text>
-        <mj-text color="{skin['brandText']}">
-          {COPY_TOKENS['bodyText']}
+        <mj-text color="{brandText}">
+          {copy_bodyText}
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_2col_text_image(skin_name="apple_light"):
-    """Convert two-column text/image to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_1col_text(skin_name="apple_light"):
+    """Convert single column text to MJML."""
+    return _rendered("1col_text", skin_name)
+
 
-    return f'''    <mj-section padding="24px">
+_2COL_TEXT_IMAGE_MJML = '''    <mj-section padding="24px">
       <mj-column width="50%">
-        <mj-text font-size="20px" color="{skin['brandPrimary']}" padding="0 12px 12px 0">
-          {COPY_TOKENS['headline']}
+        <mj-text font-size="20px" color="{brandPrimary}" padding="0 12px 12px 0">
+          {copy_headline}
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandText']}" padding="0 12px 0 0">
-          {COPY_TOKENS['bodyText']}
+        <mj-text font-size="14px" color="{brandText}" padding="0 12px 0 0">
+          {copy_bodyText}
         </mj-text>
       </mj-column>
       <mj-column width="50%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="{{{{imageAlt}}}}" />
+        <mj-image src="{img_product}" alt="{imageAlt}" />
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_3col_features(skin_name="apple_light"):
-    """Convert three-column features to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_2col_text_image(skin_name="apple_light"):
+    """Convert two-column text/image to MJML."""
+    return _rendered("2col_text_image", skin_name)
 
-    return f'''    <mj-section padding="24px">
+
+_3COL_FEATURES_MJML = '''    <mj-section padding="24px">
       <mj-column width="33%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['icon']}" width="64px" align="center" />
-        <mj-text align="center" font-size="16px" color="{skin['brandPrimary']}" padding="12px 8px 8px">
-          {{{{feature1Title}}}}
+        <mj-image src="{img_icon}" width="64px" align="center" />
+        <mj-text align="center" font-size="16px" color="{brandPrimary}" padding="12px 8px 8px">
+          {feature1Title}
         </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" padding="0 8px">
-          {{{{feature1Text}}}}
+        <mj-text align="center" font-size="14px" color="{brandSecondary}" padding="0 8px">
+          {feature1Text}
         </mj-text>
       </mj-column>
       <mj-column width="33%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['icon']}" width="64px" align="center" />
-        <mj-text align="center" font-size="16px" color="{skin['brandPrimary']}" padding="12px 8px 8px">
-          {{{{feature2Title}}}}
+        <mj-image src="{img_icon}" width="64px" align="center" />
+        <mj-text align="center" font-size="16px" color="{brandPrimary}" padding="12px 8px 8px">
+          {feature2Title}
         </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" padding="0 8px">
-          {{{{feature2Text}}}}
+        <mj-text align="center" font-size="14px" color="{brandSecondary}" padding="0 8px">
+          {feature2Text}
         </mj-text>
       </mj-column>
       <mj-column width="33%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['icon']}" width="64px" align="center" />
-        <mj-text align="center" font-size="16px" color="{skin['brandPrimary']}" padding="12px 8px 8px">
-          {{{{feature3Title}}}}
+        <mj-image src="{img_icon}" width="64px" align="center" />
+        <mj-text align="center" font-size="16px" color="{brandPrimary}" padding="12px 8px 8px">
+          {feature3Title}
         </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" padding="0 8px">
-          {{{{feature3Text}}}}
+        <mj-text align="center" font-size="14px" color="{brandSecondary}" padding="0 8px">
+          {feature3Text}
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_product_grid(skin_name="apple_light"):
-    """Convert product grid to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_3col_features(skin_name="apple_light"):
+    """Convert three-column features to MJML."""
+    return _rendered("3col_features", skin_name)
 
-    return f'''    <mj-section padding="24px">
+
+_PRODUCT_GRID_MJML = '''    <mj-section padding="24px">
       <mj-column width="50%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="{{{{product1Alt}}}}" />
-        <mj-text align="center" font-size="16px" color="{skin['brandPrimary']}" padding="12px 8px 4px">
-          {{{{product1Name}}}}
+        <mj-image src="{img_product}" alt="{product1Alt}" />
+        <mj-text align="center" font-size="16px" color="{brandPrimary}" padding="12px 8px 4px">
+          {product1Name}
         </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandAccent']}" font-weight="600" padding="0 8px">
-          {{{{product1Price}}}}
+        <mj-text align="center" font-size="14px" color="{brandAccent}" font-weight="600" padding="0 8px">
+          {product1Price}
         </mj-text>
       </mj-column>
       <mj-column width="50%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="{{{{product2Alt}}}}" />
-        <mj-text align="center" font-size="16px" color="{skin['brandPrimary']}" padding="12px 8px 4px">
-          {{{{product2Name}}}}
+        <mj-image src="{img_product}" alt="{product2Alt}" />
+        <mj-text align="center" font-size="16px" color="{brandPrimary}" padding="12px 8px 4px">
+          {product2Name}
         </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandAccent']}" font-weight="600" padding="0 8px">
-          {{{{product2Price}}}}
+        <mj-text align="center" font-size="14px" color="{brandAccent}" font-weight="600" padding="0 8px">
+          {product2Price}
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_testimonial(skin_name="apple_light"):
-    """Convert testimonial to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_product_grid(skin_name="apple_light"):
+    """Convert product grid to MJML."""
+    return _rendered("product_grid", skin_name)
+
 
-    return f'''    <mj-section padding="32px 24px" background-color="{skin['brandSecondary']}20">
+_TESTIMONIAL_MJML = '''    <mj-section padding="32px 24px" background-color="{brandSecondary}20">
       <mj-column>
-        <mj-image src="{IMAGE_PLACEHOLDERS['avatar']}" width="80px" align="center" border-radius="50%" />
-        <mj-text align="center" font-size="18px" font-style="italic" color="{skin['brandText']}" padding="16px 0 0">
-          &ldquo;{COPY_TOKENS['testimonialQuote']}&rdquo;
+        <mj-image src="{img_avatar}" width="80px" align="center" border-radius="50%" />
+        <mj-text align="center" font-size="18px" font-style="italic" color="{brandText}" padding="16px 0 0">
+          &ldquo;{copy_testimonialQuote}&rdquo;
         </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" font-weight="600" padding="12px 0 0">
-          {COPY_TOKENS['testimonialAuthor']}
+        <mj-text align="center" font-size="14px" color="{brandSecondary}" font-weight="600" padding="12px 0 0">
+          {copy_testimonialAuthor}
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_story_block(skin_name="apple_light"):
-    """Convert story block to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_testimonial(skin_name="apple_light"):
+    """Convert testimonial to MJML."""
+    return _rendered("testimonial", skin_name)
 
-    return f'''    <mj-section padding="24px">
+
+_STORY_BLOCK_MJML = '''    <mj-section padding="24px">
       <mj-column>
-        <mj-image src="{IMAGE_PLACEHOLDERS['hero']}" alt="{{{{storyImageAlt}}}}" />
-        <mj-text font-size="24px" color="{skin['brandPrimary']}" padding="16px 0 12px">
-          {COPY_TOKENS['headline']}
+        <mj-image src="{img_hero}" alt="{storyImageAlt}" />
+        <mj-text font-size="24px" color="{brandPrimary}" padding="16px 0 12px">
+          {copy_headline}
         </mj-text>
-        <mj-text color="{skin['brandText']}" padding="0 0 16px">
-          {COPY_TOKENS['bodyText']}
+        <mj-text color="{brandText}" padding="0 0 16px">
+          {copy_bodyText}
         </mj-text>
         <mj-text>
-          <a href="{{{{readMoreUrl}}}}" style="color: {skin['brandAccent']}; text-decoration: underline;">Read more &rarr;</a>
+          <a href="{readMoreUrl}" style="color: {brandAccent}; text-decoration: underline;">Read more &rarr;</a>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_cta_band(skin_name="apple_light"):
-    """Convert CTA band to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_story_block(skin_name="apple_light"):
+    """Convert story block to MJML."""
+    return _rendered("story_block", skin_name)
 
-    return f'''    <mj-section padding="32px 24px" background-color="{skin['brandAccent']}">
+
+_CTA_BAND_MJML = '''    <mj-section padding="32px 24px" background-color="{brandAccent}">
       <mj-column>
         <mj-text align="center" font-size="24px" color="#ffffff" padding="0 0 16px">
-          {COPY_TOKENS['headline']}
+          {copy_headline}
         </mj-text>
-        <mj-button href="{{{{ctaUrl}}}}" background-color="#ffffff" color="{skin['brandAccent']}">
-          {COPY_TOKENS['ctaLabel']}
+        <mj-button href="{ctaUrl}" background-color="#ffffff" color="{brandAccent}">
+          {copy_ctaLabel}
         </mj-button>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_header_nav(skin_name="apple_light"):
-    """Convert header navigation to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_cta_band(skin_name="apple_light"):
+    """Convert CTA band to MJML."""
+    return _rendered("cta_band", skin_name)
+
 
-    return f'''    <mj-section padding="16px 24px">
+_HEADER_NAV_MJML = '''    <mj-section padding="16px 24px">
       <mj-column width="40%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['logo']}" alt="{{{{brandName}}}}" width="150px" align="left" />
+        <mj-image src="{img_logo}" alt="{brandName}" width="150px" align="left" />
       </mj-column>
       <mj-column width="60%">
-        <mj-text align="right" font-size="14px" color="{skin['brandText']}" css-class="mobile-hide">
-          <a href="{{{{navLink1Url}}}}" style="color: {skin['brandText']}; text-decoration: none; margin-left: 24px;">{{{{navLink1}}}}</a>
-          <a href="{{{{navLink2Url}}}}" style="color: {skin['brandText']}; text-decoration: none; margin-left: 24px;">{{{{navLink2}}}}</a>
-          <a href="{{{{navLink3Url}}}}" style="color: {skin['brandText']}; text-decoration: none; margin-left: 24px;">{{{{navLink3}}}}</a>
+        <mj-text align="right" font-size="14px" color="{brandText}" css-class="mobile-hide">
+          <a href="{navLink1Url}" style="color: {brandText}; text-decoration: none; margin-left: 24px;">{navLink1}</a>
+          <a href="{navLink2Url}" style="color: {brandText}; text-decoration: none; margin-left: 24px;">{navLink2}</a>
+          <a href="{navLink3Url}" style="color: {brandText}; text-decoration: none; margin-left: 24px;">{navLink3}</a>
         </mj-text>
       </mj-column>
     </mj-section>
     <mj-section padding="0">
       <mj-column>
-        <mj-divider border-color="{skin['brandSecondary']}20" border-width="1px" />
+        <mj-divider border-color="{brandSecondary}20" border-width="1px" />
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_offer_banner(skin_name="apple_light"):
-    """Convert offer banner to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_header_nav(skin_name="apple_light"):
+    """Convert header navigation to MJML."""
+    return _rendered("header_nav", skin_name)
 
-    return f'''    <mj-section padding="12px 24px" background-color="{skin['brandPrimary']}">
+
+_OFFER_BANNER_MJML = '''    <mj-section padding="12px 24px" background-color="{brandPrimary}">
       <mj-column>
-        <mj-text align="center" font-size="14px" color="{skin['brandBG']}">
-          {{{{offerText}}}} &bull; <a href="{{{{offerUrl}}}}" style="color: {skin['brandAccent']}; text-decoration: underline;">Shop Now</a>
+        <mj-text align="center" font-size="14px" color="{brandBG}">
+          {offerText} &bull; <a href="{offerUrl}" style="color: {brandAccent}; text-decoration: underline;">Shop Now</a>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_order_summary(skin_name="apple_light"):
-    """Convert order summary to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_offer_banner(skin_name="apple_light"):
+    """Convert offer banner to MJML."""
+    return _rendered("offer_banner", skin_name)
 
-    return f'''    <mj-section padding="24px">
+
+_ORDER_SUMMARY_MJML = '''    <mj-section padding="24px">
       <mj-column>
-        <mj-text font-size="20px" color="{skin['brandPrimary']}" padding="0 0 16px" border-bottom="2px solid {skin['brandSecondary']}20">
+        <mj-text font-size="20px" color="{brandPrimary}" padding="0 0 16px" border-bottom="2px solid {brandSecondary}20">
           Order Summary
         </mj-text>
       </mj-column>
     </mj-section>
     <mj-section padding="0 24px">
       <mj-column width="20%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['icon']}" width="64px" />
+        <mj-image src="{img_icon}" width="64px" />
       </mj-column>
       <mj-column width="50%">
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" font-weight="600">
-          {{{{orderItem1Name}}}}
+        <mj-text font-size="14px" color="{brandPrimary}" font-weight="600">
+          {orderItem1Name}
         </mj-text>
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" padding="4px 0 0">
-          Qty: {{{{orderItem1Qty}}}}
+        <mj-text font-size="12px" color="{brandSecondary}" padding="4px 0 0">
+          Qty: {orderItem1Qty}
         </mj-text>
       </mj-column>
       <mj-column width="30%">
-        <mj-text align="right" font-size="14px" color="{skin['brandPrimary']}">
-          {{{{orderItem1Price}}}}
+        <mj-text align="right" font-size="14px" color="{brandPrimary}">
+          {orderItem1Price}
         </mj-text>
       </mj-column>
     </mj-section>
     <mj-section padding="16px 24px">
       <mj-column>
-        <mj-divider border-color="{skin['brandSecondary']}20" border-width="1px" />
+        <mj-divider border-color="{brandSecondary}20" border-width="1px" />
       </mj-column>
     </mj-section>
     <mj-section padding="0 24px">
       <mj-column width="50%">
-        <mj-text font-size="14px" color="{skin['brandSecondary']}">Subtotal</mj-text>
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="8px 0 0">Shipping</mj-text>
+        <mj-text font-size="14px" color="{brandSecondary}">Subtotal</mj-text>
+        <mj-text font-size="14px" color="{brandSecondary}" padding="8px 0 0">Shipping</mj-text>
       </mj-column>
       <mj-column width="50%">
-        <mj-text align="right" font-size="14px" color="{skin['brandPrimary']}">{{{{orderSubtotal}}}}</mj-text>
-        <mj-text align="right" font-size="14px" color="{skin['brandPrimary']}" padding="8px 0 0">{{{{orderShipping}}}}</mj-text>
+        <mj-text align="right" font-size="14px" color="{brandPrimary}">{orderSubtotal}</mj-text>
+        <mj-text align="right" font-size="14px" color="{brandPrimary}" padding="8px 0 0">{orderShipping}</mj-text>
       </mj-column>
     </mj-section>
     <mj-section padding="12px 24px">
       <mj-column width="50%">
-        <mj-text font-size="16px" color="{skin['brandPrimary']}" font-weight="700" border-top="2px solid {skin['brandPrimary']}" padding="12px 0 0">
+        <mj-text font-size="16px" color="{brandPrimary}" font-weight="700" border-top="2px solid {brandPrimary}" padding="12px 0 0">
           Total
         </mj-text>
       </mj-column>
       <mj-column width="50%">
-        <mj-text align="right" font-size="16px" color="{skin['brandPrimary']}" font-weight="700" border-top="2px solid {skin['brandPrimary']}" padding="12px 0 0">
-          {{{{orderTotal}}}}
+        <mj-text align="right" font-size="16px" color="{brandPrimary}" font-weight="700" border-top="2px solid {brandPrimary}" padding="12px 0 0">
+          {orderTotal}
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_social_icons(skin_name="apple_light"):
-    """Convert social icons to MJML."""
-    return '''    <mj-section padding="24px">
+def section_to_mjml_order_summary(skin_name="apple_light"):
+    """Convert order summary to MJML."""
+    return _rendered("order_summary", skin_name)
+
+
+_SOCIAL_ICONS_MJML = '''    <mj-section padding="24px">
       <mj-column>
         <mj-social font-size="12px" icon-size="32px" mode="horizontal" align="center">
-          <mj-social-element name="facebook" href="{{facebookUrl}}" />
-          <mj-social-element name="twitter" href="{{twitterUrl}}" />
-          <mj-social-element name="instagram" href="{{instagramUrl}}" />
-          <mj-social-element name="linkedin" href="{{linkedinUrl}}" />
+          <mj-social-element name="facebook" href="{facebookUrl}" />
+          <mj-social-element name="twitter" href="{twitterUrl}" />
+          <mj-social-element name="instagram" href="{instagramUrl}" />
+          <mj-social-element name="linkedin" href="{linkedinUrl}" />
         </mj-social>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_footer_simple(skin_name="apple_light"):
-    """Convert simple footer to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_social_icons(skin_name="apple_light"):
+    """Convert social icons to MJML."""
+    return _rendered("social_icons", skin_name)
+
 
-    return f'''    <mj-section padding="24px">
+_FOOTER_SIMPLE_MJML = '''    <mj-section padding="24px">
       <mj-column>
-        <mj-divider border-color="{skin['brandSecondary']}20" border-width="1px" padding="0 0 24px" />
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}" padding="0 0 8px">
-          {COPY_TOKENS['footerText']}
+        <mj-divider border-color="{brandSecondary}20" border-width="1px" padding="0 0 24px" />
+        <mj-text align="center" font-size="12px" color="{brandSecondary}" padding="0 0 8px">
+          {copy_footerText}
         </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}">
-          <a href="{{{{unsubscribeUrl}}}}" style="color: {skin['brandSecondary']}; text-decoration: underline;">Unsubscribe</a> &bull;
-          <a href="{{{{preferencesUrl}}}}" style="color: {skin['brandSecondary']}; text-decoration: underline;">Preferences</a> &bull;
-          <a href="{{{{privacyUrl}}}}" style="color: {skin['brandSecondary']}; text-decoration: underline;">Privacy</a>
+        <mj-text align="center" font-size="12px" color="{brandSecondary}">
+          <a href="{unsubscribeUrl}" style="color: {brandSecondary}; text-decoration: underline;">Unsubscribe</a> &bull;
+          <a href="{preferencesUrl}" style="color: {brandSecondary}; text-decoration: underline;">Preferences</a> &bull;
+          <a href="{privacyUrl}" style="color: {brandSecondary}; text-decoration: underline;">Privacy</a>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_footer_complex(skin_name="apple_light"):
-    """Convert complex footer to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_footer_simple(skin_name="apple_light"):
+    """Convert simple footer to MJML."""
+    return _rendered("footer_simple", skin_name)
 
-    return f'''    <mj-section padding="32px 24px" background-color="{skin['brandPrimary']}">
+
+_FOOTER_COMPLEX_MJML = '''    <mj-section padding="32px 24px" background-color="{brandPrimary}">
       <mj-column width="33%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['logo']}" alt="{{{{brandName}}}}" width="120px" align="left" />
-        <mj-text font-size="12px" color="{skin['brandBG']}" css-class="opacity-80" padding="12px 0 0">
-          {{{{companyAddress}}}}
+        <mj-image src="{img_logo}" alt="{brandName}" width="120px" align="left" />
+        <mj-text font-size="12px" color="{brandBG}" css-class="opacity-80" padding="12px 0 0">
+          {companyAddress}
         </mj-text>
       </mj-column>
       <mj-column width="33%">
-        <mj-text font-size="14px" color="{skin['brandBG']}" font-weight="600" padding="0 0 12px">
+        <mj-text font-size="14px" color="{brandBG}" font-weight="600" padding="0 0 12px">
           Quick Links
         </mj-text>
         <mj-text font-size="12px" padding="0">
-          <a href="{{{{aboutUrl}}}}" style="color: {skin['brandBG']}; text-decoration: none; opacity: 0.8;">About Us</a>
+          <a href="{aboutUrl}" style="color: {brandBG}; text-decoration: none; opacity: 0.8;">About Us</a>
         </mj-text>
         <mj-text font-size="12px" padding="4px 0 0">
-          <a href="{{{{contactUrl}}}}" style="color: {skin['brandBG']}; text-decoration: none; opacity: 0.8;">Contact</a>
+          <a href="{contactUrl}" style="color: {brandBG}; text-decoration: none; opacity: 0.8;">Contact</a>
         </mj-text>
         <mj-text font-size="12px" padding="4px 0 0">
-          <a href="{{{{faqUrl}}}}" style="color: {skin['brandBG']}; text-decoration: none; opacity: 0.8;">FAQ</a>
+          <a href="{faqUrl}" style="color: {brandBG}; text-decoration: none; opacity: 0.8;">FAQ</a>
         </mj-text>
       </mj-column>
       <mj-column width="33%">
-        <mj-text font-size="14px" color="{skin['brandBG']}" font-weight="600" padding="0 0 12px">
+        <mj-text font-size="14px" color="{brandBG}" font-weight="600" padding="0 0 12px">
           Legal
         </mj-text>
         <mj-text font-size="12px" padding="0">
-          <a href="{{{{privacyUrl}}}}" style="color: {skin['brandBG']}; text-decoration: none; opacity: 0.8;">Privacy Policy</a>
+          <a href="{privacyUrl}" style="color: {brandBG}; text-decoration: none; opacity: 0.8;">Privacy Policy</a>
         </mj-text>
         <mj-text font-size="12px" padding="4px 0 0">
-          <a href="{{{{termsUrl}}}}" style="color: {skin['brandBG']}; text-decoration: none; opacity: 0.8;">Terms of Service</a>
+          <a href="{termsUrl}" style="color: {brandBG}; text-decoration: none; opacity: 0.8;">Terms of Service</a>
         </mj-text>
         <mj-text font-size="12px" padding="4px 0 0">
-          <a href="{{{{unsubscribeUrl}}}}" style="color: {skin['brandBG']}; text-decoration: none; opacity: 0.8;">Unsubscribe</a>
+          <a href="{unsubscribeUrl}" style="color: {brandBG}; text-decoration: none; opacity: 0.8;">Unsubscribe</a>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_divider(skin_name="apple_light"):
-    """Convert divider to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_footer_complex(skin_name="apple_light"):
+    """Convert complex footer to MJML."""
+    return _rendered("footer_complex", skin_name)
+
 
-    return f'''    <mj-section padding="16px 24px">
+_DIVIDER_MJML = '''    <mj-section padding="16px 24px">
       <mj-column>
-        <mj-divider border-color="{skin['brandSecondary']}20" border-width="1px" />
+        <mj-divider border-color="{brandSecondary}20" border-width="1px" />
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_spacer(skin_name="apple_light"):
-    """Convert spacer to MJML."""
-    return '''    <mj-section padding="0">
+def section_to_mjml_divider(skin_name="apple_light"):
+    """Convert divider to MJML."""
+    return _rendered("divider", skin_name)
+
+
+_SPACER_MJML = '''    <mj-section padding="0">
       <mj-column>
         <mj-spacer height="24px" />
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_security_alert(skin_name="apple_light"):
-    """Convert security alert to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_spacer(skin_name="apple_light"):
+    """Convert spacer to MJML."""
+    return _rendered("spacer", skin_name)
+
 
-    return f'''    <mj-section padding="24px">
-      <mj-column background-color="{skin['brandSecondary']}10" border-radius="8px" padding="24px">
+_SECURITY_ALERT_MJML = '''    <mj-section padding="24px">
+      <mj-column background-color="{brandSecondary}10" border-radius="8px" padding="24px">
         <mj-table>
           <tr>
             <td width="64" valign="top">
-              <img src="{IMAGE_PLACEHOLDERS['icon']}" alt="Security" width="48" height="48" />
+              <img src="{img_icon}" alt="Security" width="48" height="48" />
             </td>
             <td style="padding-left: 16px;">
-              <p style="font-family: {skin['brandFont']}; font-size: 20px; color: {skin['brandPrimary']}; margin: 0 0 8px;">{{{{securityTitle}}}}</p>
-              <p style="font-family: {skin['brandFont']}; font-size: 14px; color: {skin['brandText']}; margin: 0; line-height: 1.5;">{{{{securityMessage}}}}</p>
+              <p style="font-family: {brandFont}; font-size: 20px; color: {brandPrimary}; margin: 0 0 8px;">{securityTitle}</p>
+              <p style="font-family: {brandFont}; font-size: 14px; color: {brandText}; margin: 0; line-height: 1.5;">{securityMessage}</p>
             </td>
           </tr>
         </mj-table>
@@ -566,52 +1741,54 @@ def section_to_mjml_security_alert(skin_name="apple_light"):
     </mj-section>'''
 
 
-def section_to_mjml_verification_code(skin_name="apple_light"):
-    """Convert verification code to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_security_alert(skin_name="apple_light"):
+    """Convert security alert to MJML."""
+    return _rendered("security_alert", skin_name)
 
-    return f'''    <mj-section padding="32px 24px">
+
+_VERIFICATION_CODE_MJML = '''    <mj-section padding="32px 24px">
       <mj-column>
-        <mj-text align="center" background-color="{skin['brandSecondary']}10" border="2px dashed {skin['brandSecondary']}40" border-radius="8px" padding="24px 48px">
-          <p style="font-size: 14px; color: {skin['brandSecondary']}; margin: 0 0 8px; text-transform: uppercase; letter-spacing: 1px;">Verification Code</p>
-          <p style="font-family: 'Courier New', monospace; font-size: 36px; color: {skin['brandPrimary']}; margin: 0; font-weight: 700; letter-spacing: 8px;">{{{{verificationCode}}}}</p>
+        <mj-text align="center" background-color="{brandSecondary}10" border="2px dashed {brandSecondary}40" border-radius="8px" padding="24px 48px">
+          <p style="font-size: 14px; color: {brandSecondary}; margin: 0 0 8px; text-transform: uppercase; letter-spacing: 1px;">Verification Code</p>
+          <p style="font-family: 'Courier New', monospace; font-size: 36px; color: {brandPrimary}; margin: 0; font-weight: 700; letter-spacing: 8px;">{verificationCode}</p>
         </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}" padding="16px 0 0">
-          This code expires in {{{{codeExpiry}}}}
+        <mj-text align="center" font-size="12px" color="{brandSecondary}" padding="16px 0 0">
+          This code expires in {codeExpiry}
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_shipping_tracker(skin_name="apple_light"):
-    """Convert shipping tracker to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_verification_code(skin_name="apple_light"):
+    """Convert verification code to MJML."""
+    return _rendered("verification_code", skin_name)
 
-    return f'''    <mj-section padding="24px">
-      <mj-column background-color="{skin['brandAccent']}10" border-radius="8px" padding="24px">
-        <mj-text font-size="18px" color="{skin['brandPrimary']}" padding="0 0 16px">
-          {{{{shippingStatus}}}}
+
+_SHIPPING_TRACKER_MJML = '''    <mj-section padding="24px">
+      <mj-column background-color="{brandAccent}10" border-radius="8px" padding="24px">
+        <mj-text font-size="18px" color="{brandPrimary}" padding="0 0 16px">
+          {shippingStatus}
         </mj-text>
         <mj-table>
           <tr>
             <td width="50%">
-              <p style="font-size: 12px; color: {skin['brandSecondary']}; margin: 0;">Tracking Number</p>
-              <p style="font-family: 'Courier New', monospace; font-size: 14px; color: {skin['brandPrimary']}; margin: 4px 0 0; font-weight: 600;">{{{{trackingNumber}}}}</p>
+              <p style="font-size: 12px; color: {brandSecondary}; margin: 0;">Tracking Number</p>
+              <p style="font-family: 'Courier New', monospace; font-size: 14px; color: {brandPrimary}; margin: 4px 0 0; font-weight: 600;">{trackingNumber}</p>
             </td>
             <td width="50%">
-              <p style="font-size: 12px; color: {skin['brandSecondary']}; margin: 0;">Carrier</p>
-              <p style="font-size: 14px; color: {skin['brandPrimary']}; margin: 4px 0 0; font-weight: 600;">{{{{carrier}}}}</p>
+              <p style="font-size: 12px; color: {brandSecondary}; margin: 0;">Carrier</p>
+              <p style="font-size: 14px; color: {brandPrimary}; margin: 4px 0 0; font-weight: 600;">{carrier}</p>
             </td>
           </tr>
         </mj-table>
         <mj-table padding="16px 0 0">
           <tr>
             <td width="50%">
-              <p style="font-size: 12px; color: {skin['brandSecondary']}; margin: 0;">Estimated Delivery</p>
-              <p style="font-size: 14px; color: {skin['brandAccent']}; margin: 4px 0 0; font-weight: 600;">{{{{estimatedDelivery}}}}</p>
+              <p style="font-size: 12px; color: {brandSecondary}; margin: 0;">Estimated Delivery</p>
+              <p style="font-size: 14px; color: {brandAccent}; margin: 4px 0 0; font-weight: 600;">{estimatedDelivery}</p>
             </td>
             <td width="50%" align="right">
-              <a href="{{{{trackingUrl}}}}" style="display: inline-block; padding: 10px 20px; background-color: {skin['brandAccent']}; color: #ffffff; font-size: 14px; font-weight: 600; text-decoration: none; border-radius: 6px;">Track Package</a>
+              <a href="{trackingUrl}" style="display: inline-block; padding: 10px 20px; background-color: {brandAccent}; color: #ffffff; font-size: 14px; font-weight: 600; text-decoration: none; border-radius: 6px;">Track Package</a>
             </td>
           </tr>
         </mj-table>
@@ -619,21 +1796,22 @@ def section_to_mjml_shipping_tracker(skin_name="apple_light"):
     </mj-section>'''
 
 
-def section_to_mjml_cart_item(skin_name="apple_light"):
-    """Convert cart item to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_shipping_tracker(skin_name="apple_light"):
+    """Convert shipping tracker to MJML."""
+    return _rendered("shipping_tracker", skin_name)
+
 
-    return f'''    <mj-section padding="16px 24px">
-      <mj-column border="1px solid {skin['brandSecondary']}20" border-radius="8px" padding="16px">
+_CART_ITEM_MJML = '''    <mj-section padding="16px 24px">
+      <mj-column border="1px solid {brandSecondary}20" border-radius="8px" padding="16px">
         <mj-table>
           <tr>
             <td width="120">
-              <img src="{IMAGE_PLACEHOLDERS['product']}" alt="{{{{cartItemAlt}}}}" width="100" height="100" style="border-radius: 4px;" />
+              <img src="{img_product}" alt="{cartItemAlt}" width="100" height="100" style="border-radius: 4px;" />
             </td>
             <td style="padding-left: 16px;" valign="middle">
-              <p style="font-size: 16px; color: {skin['brandPrimary']}; margin: 0 0 4px; font-weight: 600;">{{{{cartItemName}}}}</p>
-              <p style="font-size: 14px; color: {skin['brandSecondary']}; margin: 0 0 8px;">{{{{cartItemVariant}}}}</p>
-              <p style="font-size: 18px; color: {skin['brandAccent']}; margin: 0; font-weight: 700;">{{{{cartItemPrice}}}}</p>
+              <p style="font-size: 16px; color: {brandPrimary}; margin: 0 0 4px; font-weight: 600;">{cartItemName}</p>
+              <p style="font-size: 14px; color: {brandSecondary}; margin: 0 0 8px;">{cartItemVariant}</p>
+              <p style="font-size: 18px; color: {brandAccent}; margin: 0; font-weight: 700;">{cartItemPrice}</p>
             </td>
           </tr>
         </mj-table>
@@ -641,54 +1819,56 @@ def section_to_mjml_cart_item(skin_name="apple_light"):
     </mj-section>'''
 
 
-def section_to_mjml_urgency_banner(skin_name="apple_light"):
-    """Convert urgency banner to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_cart_item(skin_name="apple_light"):
+    """Convert cart item to MJML."""
+    return _rendered("cart_item", skin_name)
 
-    return f'''    <mj-section padding="16px 24px" background-color="{skin['brandAccent']}15">
+
+_URGENCY_BANNER_MJML = '''    <mj-section padding="16px 24px" background-color="{brandAccent}15">
       <mj-column>
-        <mj-text align="center" font-size="14px" color="{skin['brandAccent']}" font-weight="600">
-          &#9200; {{{{urgencyMessage}}}}
+        <mj-text align="center" font-size="14px" color="{brandAccent}" font-weight="600">
+          &#9200; {urgencyMessage}
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_event_details(skin_name="apple_light"):
-    """Convert event details to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_urgency_banner(skin_name="apple_light"):
+    """Convert urgency banner to MJML."""
+    return _rendered("urgency_banner", skin_name)
 
-    return f'''    <mj-section padding="24px">
-      <mj-column background-color="{skin['brandPrimary']}05" border-left="4px solid {skin['brandAccent']}" border-radius="0 8px 8px 0" padding="24px">
-        <mj-text font-size="20px" color="{skin['brandPrimary']}" padding="0 0 16px">
-          {{{{eventTitle}}}}
+
+_EVENT_DETAILS_MJML = '''    <mj-section padding="24px">
+      <mj-column background-color="{brandPrimary}05" border-left="4px solid {brandAccent}" border-radius="0 8px 8px 0" padding="24px">
+        <mj-text font-size="20px" color="{brandPrimary}" padding="0 0 16px">
+          {eventTitle}
         </mj-text>
         <mj-table>
           <tr>
             <td width="32" valign="top">
-              <img src="{IMAGE_PLACEHOLDERS['icon']}" alt="" width="24" height="24" />
+              <img src="{img_icon}" alt="" width="24" height="24" />
             </td>
             <td style="padding-left: 8px; padding-bottom: 12px;">
-              <p style="font-size: 12px; color: {skin['brandSecondary']}; margin: 0;">Date &amp; Time</p>
-              <p style="font-size: 14px; color: {skin['brandPrimary']}; margin: 4px 0 0; font-weight: 600;">{{{{eventDateTime}}}}</p>
+              <p style="font-size: 12px; color: {brandSecondary}; margin: 0;">Date &amp; Time</p>
+              <p style="font-size: 14px; color: {brandPrimary}; margin: 4px 0 0; font-weight: 600;">{eventDateTime}</p>
             </td>
           </tr>
           <tr>
             <td width="32" valign="top">
-              <img src="{IMAGE_PLACEHOLDERS['icon']}" alt="" width="24" height="24" />
+              <img src="{img_icon}" alt="" width="24" height="24" />
             </td>
             <td style="padding-left: 8px; padding-bottom: 12px;">
-              <p style="font-size: 12px; color: {skin['brandSecondary']}; margin: 0;">Location</p>
-              <p style="font-size: 14px; color: {skin['brandPrimary']}; margin: 4px 0 0; font-weight: 600;">{{{{eventLocation}}}}</p>
+              <p style="font-size: 12px; color: {brandSecondary}; margin: 0;">Location</p>
+              <p style="font-size: 14px; color: {brandPrimary}; margin: 4px 0 0; font-weight: 600;">{eventLocation}</p>
             </td>
           </tr>
           <tr>
             <td width="32" valign="top">
-              <img src="{IMAGE_PLACEHOLDERS['icon']}" alt="" width="24" height="24" />
+              <img src="{img_icon}" alt="" width="24" height="24" />
             </td>
             <td style="padding-left: 8px;">
-              <p style="font-size: 12px; color: {skin['brandSecondary']}; margin: 0;">Host</p>
-              <p style="font-size: 14px; color: {skin['brandPrimary']}; margin: 4px 0 0; font-weight: 600;">{{{{eventHost}}}}</p>
+              <p style="font-size: 12px; color: {brandSecondary}; margin: 0;">Host</p>
+              <p style="font-size: 14px; color: {brandPrimary}; margin: 4px 0 0; font-weight: 600;">{eventHost}</p>
             </td>
           </tr>
         </mj-table>
@@ -696,735 +1876,636 @@ def section_to_mjml_event_details(skin_name="apple_light"):
     </mj-section>'''
 
 
-def section_to_mjml_rsvp_buttons(skin_name="apple_light"):
-    """Convert RSVP buttons to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_event_details(skin_name="apple_light"):
+    """Convert event details to MJML."""
+    return _rendered("event_details", skin_name)
+
 
-    return f'''    <mj-section padding="24px">
+_RSVP_BUTTONS_MJML = '''    <mj-section padding="24px">
       <mj-column width="50%">
-        <mj-button href="{{{{rsvpAcceptUrl}}}}" background-color="{skin['brandAccent']}" align="right" padding="0 8px 0 0">
+        <mj-button href="{rsvpAcceptUrl}" background-color="{brandAccent}" align="right" padding="0 8px 0 0">
           Accept
         </mj-button>
       </mj-column>
       <mj-column width="50%">
-        <mj-button href="{{{{rsvpDeclineUrl}}}}" background-color="transparent" color="{skin['brandSecondary']}" border="2px solid {skin['brandSecondary']}" align="left" padding="0 0 0 8px">
+        <mj-button href="{rsvpDeclineUrl}" background-color="transparent" color="{brandSecondary}" border="2px solid {brandSecondary}" align="left" padding="0 0 0 8px">
           Decline
         </mj-button>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_countdown_timer(skin_name="apple_light"):
-    """Convert countdown timer to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_rsvp_buttons(skin_name="apple_light"):
+    """Convert RSVP buttons to MJML."""
+    return _rendered("rsvp_buttons", skin_name)
 
-    return f'''    <mj-section padding="32px 24px" background-color="{skin['brandPrimary']}">
-      <mj-column>
-        <mj-text align="center" font-size="14px" color="{skin['brandBG']}" text-transform="uppercase" letter-spacing="2px" padding="0 0 16px">
-          {{{{countdownLabel}}}}
-        </mj-text>
-      </mj-column>
-    </mj-section>
-    <mj-section padding="0 24px 32px" background-color="{skin['brandPrimary']}">
-      <mj-column width="25%">
-        <mj-text align="center" background-color="{skin['brandBG']}" border-radius="8px" padding="16px 8px">
-          <p style="font-size: 36px; color: {skin['brandPrimary']}; margin: 0; font-weight: 700;">{{{{countdownDays}}}}</p>
-        </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandBG']}" text-transform="uppercase" padding="8px 0 0">
-          Days
-        </mj-text>
-      </mj-column>
-      <mj-column width="25%">
-        <mj-text align="center" background-color="{skin['brandBG']}" border-radius="8px" padding="16px 8px">
-          <p style="font-size: 36px; color: {skin['brandPrimary']}; margin: 0; font-weight: 700;">{{{{countdownHours}}}}</p>
-        </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandBG']}" text-transform="uppercase" padding="8px 0 0">
-          Hours
-        </mj-text>
-      </mj-column>
-      <mj-column width="25%">
-        <mj-text align="center" background-color="{skin['brandBG']}" border-radius="8px" padding="16px 8px">
-          <p style="font-size: 36px; color: {skin['brandPrimary']}; margin: 0; font-weight: 700;">{{{{countdownMins}}}}</p>
+
+_COUNTDOWN_COLUMN_MJML = '''      <mj-column width="25%">
+        <mj-text align="center" background-color="{brandBG}" border-radius="8px" padding="16px 8px">
+          <p style="font-size: 36px; color: {brandPrimary}; margin: 0; font-weight: 700;">{countdown$unit}</p>
         </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandBG']}" text-transform="uppercase" padding="8px 0 0">
-          Mins
+        <mj-text align="center" font-size="12px" color="{brandBG}" text-transform="uppercase" padding="8px 0 0">
+          $unit
         </mj-text>
       </mj-column>
-      <mj-column width="25%">
-        <mj-text align="center" background-color="{skin['brandBG']}" border-radius="8px" padding="16px 8px">
-          <p style="font-size: 36px; color: {skin['brandPrimary']}; margin: 0; font-weight: 700;">{{{{countdownSecs}}}}</p>
-        </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandBG']}" text-transform="uppercase" padding="8px 0 0">
-          Secs
+'''
+
+_COUNTDOWN_TIMER_MJML = '''    <mj-section padding="32px 24px" background-color="{brandPrimary}">
+      <mj-column>
+        <mj-text align="center" font-size="14px" color="{brandBG}" text-transform="uppercase" letter-spacing="2px" padding="0 0 16px">
+          {countdownLabel}
         </mj-text>
       </mj-column>
-    </mj-section>'''
+    </mj-section>
+    <mj-section padding="0 24px 32px" background-color="{brandPrimary}">
+''' + _repeat_fragment(_COUNTDOWN_COLUMN_MJML, [
+    {"unit": "Days"}, {"unit": "Hours"}, {"unit": "Mins"}, {"unit": "Secs"},
+]) + '''    </mj-section>'''
 
 
-def section_to_mjml_video_placeholder(skin_name="apple_light"):
-    """Convert video placeholder to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_countdown_timer(skin_name="apple_light"):
+    """Convert countdown timer to MJML."""
+    return _rendered("countdown_timer", skin_name)
+
 
-    return f'''    <mj-section padding="24px">
+_VIDEO_PLACEHOLDER_MJML = '''    <mj-section padding="24px">
       <mj-column>
-        <mj-image src="{IMAGE_PLACEHOLDERS['hero']}" alt="{{{{videoAlt}}}}" href="{{{{videoUrl}}}}" border-radius="8px" />
-        <mj-button href="{{{{videoUrl}}}}" background-color="{skin['brandAccent']}" border-radius="50%" width="60px" height="60px" padding="0" css-class="video-play-btn">
+        <mj-image src="{img_hero}" alt="{videoAlt}" href="{videoUrl}" border-radius="8px" />
+        <mj-button href="{videoUrl}" background-color="{brandAccent}" border-radius="50%" width="60px" height="60px" padding="0" css-class="video-play-btn">
           &#9658;
         </mj-button>
-        <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" padding="16px 0 0">
-          {{{{videoCaption}}}}
+        <mj-text align="center" font-size="14px" color="{brandSecondary}" padding="16px 0 0">
+          {videoCaption}
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_accordion_faq(skin_name="apple_light"):
-    """Convert accordion FAQ to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_video_placeholder(skin_name="apple_light"):
+    """Convert video placeholder to MJML."""
+    return _rendered("video_placeholder", skin_name)
 
-    return f'''    <mj-section padding="24px">
+
+_ACCORDION_FAQ_MJML = '''    <mj-section padding="24px">
       <mj-column>
-        <mj-text font-size="24px" color="{skin['brandPrimary']}" padding="0 0 24px">
+        <mj-text font-size="24px" color="{brandPrimary}" padding="0 0 24px">
           Frequently Asked Questions
         </mj-text>
         <!-- FAQ Item 1 -->
-        <mj-text padding="0 0 8px" border-bottom="1px solid {skin['brandSecondary']}20">
-          <h3 style="font-size: 16px; color: {skin['brandPrimary']}; margin: 0 0 8px; font-weight: 600;">{{{{faq1Question}}}}</h3>
-          <p style="font-size: 14px; color: {skin['brandText']}; margin: 0 0 16px; line-height: 1.6;">{{{{faq1Answer}}}}</p>
+        <mj-text padding="0 0 8px" border-bottom="1px solid {brandSecondary}20">
+          <h3 style="font-size: 16px; color: {brandPrimary}; margin: 0 0 8px; font-weight: 600;">{faq1Question}</h3>
+          <p style="font-size: 14px; color: {brandText}; margin: 0 0 16px; line-height: 1.6;">{faq1Answer}</p>
         </mj-text>
         <!-- FAQ Item 2 -->
-        <mj-text padding="16px 0 8px" border-bottom="1px solid {skin['brandSecondary']}20">
-          <h3 style="font-size: 16px; color: {skin['brandPrimary']}; margin: 0 0 8px; font-weight: 600;">{{{{faq2Question}}}}</h3>
-          <p style="font-size: 14px; color: {skin['brandText']}; margin: 0 0 16px; line-height: 1.6;">{{{{faq2Answer}}}}</p>
+        <mj-text padding="16px 0 8px" border-bottom="1px solid {brandSecondary}20">
+          <h3 style="font-size: 16px; color: {brandPrimary}; margin: 0 0 8px; font-weight: 600;">{faq2Question}</h3>
+          <p style="font-size: 14px; color: {brandText}; margin: 0 0 16px; line-height: 1.6;">{faq2Answer}</p>
         </mj-text>
         <!-- FAQ Item 3 -->
-        <mj-text padding="16px 0 8px" border-bottom="1px solid {skin['brandSecondary']}20">
-          <h3 style="font-size: 16px; color: {skin['brandPrimary']}; margin: 0 0 8px; font-weight: 600;">{{{{faq3Question}}}}</h3>
-          <p style="font-size: 14px; color: {skin['brandText']}; margin: 0 0 16px; line-height: 1.6;">{{{{faq3Answer}}}}</p>
+        <mj-text padding="16px 0 8px" border-bottom="1px solid {brandSecondary}20">
+          <h3 style="font-size: 16px; color: {brandPrimary}; margin: 0 0 8px; font-weight: 600;">{faq3Question}</h3>
+          <p style="font-size: 14px; color: {brandText}; margin: 0 0 16px; line-height: 1.6;">{faq3Answer}</p>
         </mj-text>
         <mj-text align="center" padding="16px 0 0">
-          <a href="{{{{faqUrl}}}}" style="font-size: 14px; color: {skin['brandAccent']}; text-decoration: underline;">View all FAQs &rarr;</a>
+          <a href="{faqUrl}" style="font-size: 14px; color: {brandAccent}; text-decoration: underline;">View all FAQs &rarr;</a>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_pricing_table(skin_name="apple_light"):
-    """Convert pricing table to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_accordion_faq(skin_name="apple_light"):
+    """Convert accordion FAQ to MJML."""
+    return _rendered("accordion_faq", skin_name)
 
-    return f'''    <mj-section padding="24px">
-      <mj-column>
-        <mj-text align="center" font-size="24px" color="{skin['brandPrimary']}" padding="0 0 8px">
-          Choose Your Plan
-        </mj-text>
-        <mj-text align="center" font-size="16px" color="{skin['brandSecondary']}" padding="0 0 24px">
-          {{{{pricingSubheadline}}}}
-        </mj-text>
-      </mj-column>
-    </mj-section>
-    <mj-section padding="0 24px 24px">
-      <!-- Basic Plan -->
-      <mj-column width="33%" border="1px solid {skin['brandSecondary']}30" border-radius="8px">
-        <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="1px" padding="24px 16px 8px">
-          {{{{plan1Name}}}}
-        </mj-text>
-        <mj-text align="center" font-size="36px" color="{skin['brandPrimary']}" font-weight="700" padding="0 16px">
-          {{{{plan1Price}}}}
-        </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}" padding="4px 16px 16px">
-          {{{{plan1Period}}}}
-        </mj-text>
-        <mj-text font-size="13px" color="{skin['brandText']}" padding="0 16px 6px">
-          &#10003; {{{{plan1Feature1}}}}
-        </mj-text>
-        <mj-text font-size="13px" color="{skin['brandText']}" padding="0 16px 6px">
-          &#10003; {{{{plan1Feature2}}}}
-        </mj-text>
-        <mj-text font-size="13px" color="{skin['brandText']}" padding="0 16px 16px">
-          &#10003; {{{{plan1Feature3}}}}
-        </mj-text>
-        <mj-button href="{{{{plan1Url}}}}" background-color="transparent" color="{skin['brandAccent']}" border="2px solid {skin['brandAccent']}" padding="0 16px 24px">
-          Select Plan
-        </mj-button>
-      </mj-column>
-      <!-- Pro Plan (Featured) -->
-      <mj-column width="33%" border="2px solid {skin['brandAccent']}" border-radius="8px" background-color="{skin['brandAccent']}08">
-        <mj-text align="center" font-size="12px" color="#ffffff" background-color="{skin['brandAccent']}" text-transform="uppercase" letter-spacing="1px" padding="8px 16px" border-radius="6px 6px 0 0">
-          Most Popular
-        </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="1px" padding="16px 16px 8px">
-          {{{{plan2Name}}}}
-        </mj-text>
-        <mj-text align="center" font-size="36px" color="{skin['brandPrimary']}" font-weight="700" padding="0 16px">
-          {{{{plan2Price}}}}
-        </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}" padding="4px 16px 16px">
-          {{{{plan2Period}}}}
-        </mj-text>
-        <mj-text font-size="13px" color="{skin['brandText']}" padding="0 16px 6px">
-          &#10003; {{{{plan2Feature1}}}}
-        </mj-text>
-        <mj-text font-size="13px" color="{skin['brandText']}" padding="0 16px 6px">
-          &#10003; {{{{plan2Feature2}}}}
-        </mj-text>
-        <mj-text font-size="13px" color="{skin['brandText']}" padding="0 16px 6px">
-          &#10003; {{{{plan2Feature3}}}}
-        </mj-text>
-        <mj-text font-size="13px" color="{skin['brandText']}" padding="0 16px 16px">
-          &#10003; {{{{plan2Feature4}}}}
-        </mj-text>
-        <mj-button href="{{{{plan2Url}}}}" background-color="{skin['brandAccent']}" padding="0 16px 24px">
-          Select Plan
-        </mj-button>
-      </mj-column>
-      <!-- Enterprise Plan -->
-      <mj-column width="33%" border="1px solid {skin['brandSecondary']}30" border-radius="8px">
-        <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="1px" padding="24px 16px 8px">
-          {{{{plan3Name}}}}
-        </mj-text>
-        <mj-text align="center" font-size="36px" color="{skin['brandPrimary']}" font-weight="700" padding="0 16px">
-          {{{{plan3Price}}}}
-        </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}" padding="4px 16px 16px">
-          {{{{plan3Period}}}}
+
+_PLAN_BADGE_MJML = '''        <mj-text align="center" font-size="12px" color="#ffffff" background-color="{brandAccent}" text-transform="uppercase" letter-spacing="1px" padding="8px 16px" border-radius="6px 6px 0 0">
+          Most Popular
         </mj-text>
-        <mj-text font-size="13px" color="{skin['brandText']}" padding="0 16px 6px">
-          &#10003; {{{{plan3Feature1}}}}
+'''
+
+_PLAN_COLUMN_MJML = '''      <!-- $label -->
+      <mj-column width="33%" $column>
+$badge        <mj-text align="center" font-size="14px" color="{brandSecondary}" text-transform="uppercase" letter-spacing="1px" padding="$name_top 16px 8px">
+          {plan${n}Name}
         </mj-text>
-        <mj-text font-size="13px" color="{skin['brandText']}" padding="0 16px 6px">
-          &#10003; {{{{plan3Feature2}}}}
+        <mj-text align="center" font-size="36px" color="{brandPrimary}" font-weight="700" padding="0 16px">
+          {plan${n}Price}
         </mj-text>
-        <mj-text font-size="13px" color="{skin['brandText']}" padding="0 16px 6px">
-          &#10003; {{{{plan3Feature3}}}}
+        <mj-text align="center" font-size="12px" color="{brandSecondary}" padding="4px 16px 16px">
+          {plan${n}Period}
         </mj-text>
-        <mj-text font-size="13px" color="{skin['brandText']}" padding="0 16px 6px">
-          &#10003; {{{{plan3Feature4}}}}
+$features        <mj-button href="{plan${n}Url}" $button padding="0 16px 24px">
+          $cta
+        </mj-button>
+      </mj-column>
+'''
+
+# Pricing plans left to right; the featured plan is highlighted and badged
+_PLANS = [
+    {"n": 1, "label": "Basic Plan", "features": 3, "featured": False, "cta": "Select Plan"},
+    {"n": 2, "label": "Pro Plan (Featured)", "features": 4, "featured": True, "cta": "Select Plan"},
+    {"n": 3, "label": "Enterprise Plan", "features": 5, "featured": False, "cta": "Contact Sales"},
+]
+
+
+def _plan_column(plan):
+    """_PLAN_COLUMN_MJML fields for one entry of _PLANS."""
+    featured = plan["featured"]
+    return {
+        "n": plan["n"],
+        "label": plan["label"],
+        "column": ('border="2px solid {brandAccent}" border-radius="8px" background-color="{brandAccent}08"'
+                   if featured else 'border="1px solid {brandSecondary}30" border-radius="8px"'),
+        "badge": _PLAN_BADGE_MJML if featured else "",
+        "name_top": "16px" if featured else "24px",
+        "features": _plan_features(plan["n"], plan["features"]),
+        "button": ('background-color="{brandAccent}"' if featured
+                   else 'background-color="transparent" color="{brandAccent}" border="2px solid {brandAccent}"'),
+        "cta": plan["cta"],
+    }
+
+
+_PRICING_TABLE_MJML = '''    <mj-section padding="24px">
+      <mj-column>
+        <mj-text align="center" font-size="24px" color="{brandPrimary}" padding="0 0 8px">
+          Choose Your Plan
         </mj-text>
-        <mj-text font-size="13px" color="{skin['brandText']}" padding="0 16px 16px">
-          &#10003; {{{{plan3Feature5}}}}
+        <mj-text align="center" font-size="16px" color="{brandSecondary}" padding="0 0 24px">
+          {pricingSubheadline}
         </mj-text>
-        <mj-button href="{{{{plan3Url}}}}" background-color="transparent" color="{skin['brandAccent']}" border="2px solid {skin['brandAccent']}" padding="0 16px 24px">
-          Contact Sales
-        </mj-button>
       </mj-column>
-    </mj-section>'''
+    </mj-section>
+    <mj-section padding="0 24px 24px">
+''' + _repeat_fragment(_PLAN_COLUMN_MJML, [_plan_column(plan) for plan in _PLANS]) + '''    </mj-section>'''
 
 
-def section_to_mjml_progress_tracker(skin_name="apple_light"):
-    """Convert progress tracker to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_pricing_table(skin_name="apple_light"):
+    """Convert pricing table to MJML."""
+    return _rendered("pricing_table", skin_name)
 
-    return f'''    <mj-section padding="24px">
+
+_PROGRESS_TRACKER_MJML = '''    <mj-section padding="24px">
       <!-- Step 1 (Completed) -->
       <mj-column width="25%">
-        <mj-text align="center" background-color="{skin['brandAccent']}" border-radius="50%" padding="8px" css-class="step-circle">
+        <mj-text align="center" background-color="{brandAccent}" border-radius="50%" padding="8px" css-class="step-circle">
           <span style="font-size: 18px; color: #ffffff; font-weight: 700;">&#10003;</span>
         </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandAccent']}" font-weight="600" padding="8px 0 0">
-          {{{{step1Label}}}}
+        <mj-text align="center" font-size="12px" color="{brandAccent}" font-weight="600" padding="8px 0 0">
+          {step1Label}
         </mj-text>
       </mj-column>
       <!-- Step 2 (Current) -->
       <mj-column width="25%">
-        <mj-text align="center" background-color="{skin['brandAccent']}" border-radius="50%" padding="8px" css-class="step-circle">
+        <mj-text align="center" background-color="{brandAccent}" border-radius="50%" padding="8px" css-class="step-circle">
           <span style="font-size: 18px; color: #ffffff; font-weight: 700;">2</span>
         </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandPrimary']}" font-weight="600" padding="8px 0 0">
-          {{{{step2Label}}}}
+        <mj-text align="center" font-size="12px" color="{brandPrimary}" font-weight="600" padding="8px 0 0">
+          {step2Label}
         </mj-text>
       </mj-column>
       <!-- Step 3 (Pending) -->
       <mj-column width="25%">
-        <mj-text align="center" border="2px solid {skin['brandSecondary']}40" border-radius="50%" padding="8px" css-class="step-circle">
-          <span style="font-size: 18px; color: {skin['brandSecondary']}; font-weight: 700;">3</span>
+        <mj-text align="center" border="2px solid {brandSecondary}40" border-radius="50%" padding="8px" css-class="step-circle">
+          <span style="font-size: 18px; color: {brandSecondary}; font-weight: 700;">3</span>
         </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}" padding="8px 0 0">
-          {{{{step3Label}}}}
+        <mj-text align="center" font-size="12px" color="{brandSecondary}" padding="8px 0 0">
+          {step3Label}
         </mj-text>
       </mj-column>
       <!-- Step 4 (Pending) -->
       <mj-column width="25%">
-        <mj-text align="center" border="2px solid {skin['brandSecondary']}40" border-radius="50%" padding="8px" css-class="step-circle">
-          <span style="font-size: 18px; color: {skin['brandSecondary']}; font-weight: 700;">4</span>
+        <mj-text align="center" border="2px solid {brandSecondary}40" border-radius="50%" padding="8px" css-class="step-circle">
+          <span style="font-size: 18px; color: {brandSecondary}; font-weight: 700;">4</span>
         </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}" padding="8px 0 0">
-          {{{{step4Label}}}}
+        <mj-text align="center" font-size="12px" color="{brandSecondary}" padding="8px 0 0">
+          {step4Label}
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_app_store_badges(skin_name="apple_light"):
-    """Convert app store badges to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_progress_tracker(skin_name="apple_light"):
+    """Convert progress tracker to MJML."""
+    return _rendered("progress_tracker", skin_name)
+
 
-    return f'''    <mj-section padding="24px">
+_APP_STORE_BADGES_MJML = '''    <mj-section padding="24px">
       <mj-column>
-        <mj-text align="center" font-size="16px" color="{skin['brandPrimary']}" padding="0 0 16px">
-          {{{{appStoreHeadline}}}}
+        <mj-text align="center" font-size="16px" color="{brandPrimary}" padding="0 0 16px">
+          {appStoreHeadline}
         </mj-text>
       </mj-column>
     </mj-section>
     <mj-section padding="0 24px 24px">
       <mj-column width="50%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="Download on the App Store" href="{{{{appStoreUrl}}}}" width="135px" align="right" border-radius="6px" />
+        <mj-image src="{img_product}" alt="Download on the App Store" href="{appStoreUrl}" width="135px" align="right" border-radius="6px" />
       </mj-column>
       <mj-column width="50%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="Get it on Google Play" href="{{{{playStoreUrl}}}}" width="135px" align="left" border-radius="6px" />
+        <mj-image src="{img_product}" alt="Get it on Google Play" href="{playStoreUrl}" width="135px" align="left" border-radius="6px" />
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_team_members(skin_name="apple_light"):
-    """Convert team members to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_app_store_badges(skin_name="apple_light"):
+    """Convert app store badges to MJML."""
+    return _rendered("app_store_badges", skin_name)
 
-    return f'''    <mj-section padding="24px">
-      <mj-column>
-        <mj-text align="center" font-size="24px" color="{skin['brandPrimary']}" padding="0 0 24px">
-          {{{{teamHeadline}}}}
-        </mj-text>
-      </mj-column>
-    </mj-section>
-    <mj-section padding="0 24px 24px">
-      <!-- Member 1 -->
-      <mj-column width="33%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['avatar']}" alt="{{{{member1Name}}}}" width="100px" border-radius="50%" />
-        <mj-text align="center" font-size="16px" color="{skin['brandPrimary']}" padding="12px 0 0">
-          {{{{member1Name}}}}
-        </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" padding="4px 0 0">
-          {{{{member1Role}}}}
-        </mj-text>
-      </mj-column>
-      <!-- Member 2 -->
+
+_TEAM_MEMBER_MJML = '''      <!-- Member $n -->
       <mj-column width="33%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['avatar']}" alt="{{{{member2Name}}}}" width="100px" border-radius="50%" />
-        <mj-text align="center" font-size="16px" color="{skin['brandPrimary']}" padding="12px 0 0">
-          {{{{member2Name}}}}
+        <mj-image src="{img_avatar}" alt="{member${n}Name}" width="100px" border-radius="50%" />
+        <mj-text align="center" font-size="16px" color="{brandPrimary}" padding="12px 0 0">
+          {member${n}Name}
         </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" padding="4px 0 0">
-          {{{{member2Role}}}}
+        <mj-text align="center" font-size="14px" color="{brandSecondary}" padding="4px 0 0">
+          {member${n}Role}
         </mj-text>
       </mj-column>
-      <!-- Member 3 -->
-      <mj-column width="33%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['avatar']}" alt="{{{{member3Name}}}}" width="100px" border-radius="50%" />
-        <mj-text align="center" font-size="16px" color="{skin['brandPrimary']}" padding="12px 0 0">
-          {{{{member3Name}}}}
-        </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" padding="4px 0 0">
-          {{{{member3Role}}}}
+'''
+
+_TEAM_MEMBERS_MJML = '''    <mj-section padding="24px">
+      <mj-column>
+        <mj-text align="center" font-size="24px" color="{brandPrimary}" padding="0 0 24px">
+          {teamHeadline}
         </mj-text>
       </mj-column>
-    </mj-section>'''
+    </mj-section>
+    <mj-section padding="0 24px 24px">
+''' + _repeat_fragment(_TEAM_MEMBER_MJML, [{"n": n} for n in range(1, 4)]) + '''    </mj-section>'''
 
 
-def section_to_mjml_comparison_table(skin_name="apple_light"):
-    """Convert comparison table to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_team_members(skin_name="apple_light"):
+    """Convert team members to MJML."""
+    return _rendered("team_members", skin_name)
+
+
+_COMPARISON_ROW_MJML = '''          <tr style="background-color: $background;">
+            <td style="padding: 12px 16px; border-bottom: 1px solid {brandSecondary}20;">{compRow${n}Feature}</td>
+            <td style="padding: 12px 16px; text-align: center; border-bottom: 1px solid {brandSecondary}20;">{compRow${n}Col1}</td>
+            <td style="padding: 12px 16px; text-align: center; border-bottom: 1px solid {brandSecondary}20;">{compRow${n}Col2}</td>
+          </tr>
+'''
 
-    return f'''    <mj-section padding="24px">
+_COMPARISON_TABLE_MJML = '''    <mj-section padding="24px">
       <mj-column>
-        <mj-text align="center" font-size="24px" color="{skin['brandPrimary']}" padding="0 0 24px">
-          {{{{comparisonHeadline}}}}
+        <mj-text align="center" font-size="24px" color="{brandPrimary}" padding="0 0 24px">
+          {comparisonHeadline}
         </mj-text>
-        <mj-table border="1px solid {skin['brandSecondary']}30" border-radius="8px">
-          <tr style="background-color: {skin['brandPrimary']}; color: {skin['brandBG']};">
+        <mj-table border="1px solid {brandSecondary}30" border-radius="8px">
+          <tr style="background-color: {brandPrimary}; color: {brandBG};">
             <td style="padding: 12px 16px; font-weight: 600;">Feature</td>
-            <td style="padding: 12px 16px; text-align: center; font-weight: 600;">{{{{compCol1}}}}</td>
-            <td style="padding: 12px 16px; text-align: center; font-weight: 600;">{{{{compCol2}}}}</td>
+            <td style="padding: 12px 16px; text-align: center; font-weight: 600;">{compCol1}</td>
+            <td style="padding: 12px 16px; text-align: center; font-weight: 600;">{compCol2}</td>
           </tr>
-          <tr style="background-color: {skin['brandBG']};">
-            <td style="padding: 12px 16px; border-bottom: 1px solid {skin['brandSecondary']}20;">{{{{compRow1Feature}}}}</td>
-            <td style="padding: 12px 16px; text-align: center; border-bottom: 1px solid {skin['brandSecondary']}20;">{{{{compRow1Col1}}}}</td>
-            <td style="padding: 12px 16px; text-align: center; border-bottom: 1px solid {skin['brandSecondary']}20;">{{{{compRow1Col2}}}}</td>
-          </tr>
-          <tr style="background-color: {skin['brandSecondary']}08;">
-            <td style="padding: 12px 16px; border-bottom: 1px solid {skin['brandSecondary']}20;">{{{{compRow2Feature}}}}</td>
-            <td style="padding: 12px 16px; text-align: center; border-bottom: 1px solid {skin['brandSecondary']}20;">{{{{compRow2Col1}}}}</td>
-            <td style="padding: 12px 16px; text-align: center; border-bottom: 1px solid {skin['brandSecondary']}20;">{{{{compRow2Col2}}}}</td>
-          </tr>
-          <tr style="background-color: {skin['brandBG']};">
-            <td style="padding: 12px 16px; border-bottom: 1px solid {skin['brandSecondary']}20;">{{{{compRow3Feature}}}}</td>
-            <td style="padding: 12px 16px; text-align: center; border-bottom: 1px solid {skin['brandSecondary']}20;">{{{{compRow3Col1}}}}</td>
-            <td style="padding: 12px 16px; text-align: center; border-bottom: 1px solid {skin['brandSecondary']}20;">{{{{compRow3Col2}}}}</td>
-          </tr>
-          <tr style="background-color: {skin['brandSecondary']}08;">
-            <td style="padding: 12px 16px;">{{{{compRow4Feature}}}}</td>
-            <td style="padding: 12px 16px; text-align: center;">{{{{compRow4Col1}}}}</td>
-            <td style="padding: 12px 16px; text-align: center;">{{{{compRow4Col2}}}}</td>
+''' + _repeat_fragment(_COMPARISON_ROW_MJML, [
+    {"n": 1, "background": "{brandBG}"},
+    {"n": 2, "background": "{brandSecondary}08"},
+    {"n": 3, "background": "{brandBG}"},
+]) + '''          <tr style="background-color: {brandSecondary}08;">
+            <td style="padding: 12px 16px;">{compRow4Feature}</td>
+            <td style="padding: 12px 16px; text-align: center;">{compRow4Col1}</td>
+            <td style="padding: 12px 16px; text-align: center;">{compRow4Col2}</td>
           </tr>
         </mj-table>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_stats_metrics(skin_name="apple_light"):
-    """Convert stats metrics to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_comparison_table(skin_name="apple_light"):
+    """Convert comparison table to MJML."""
+    return _rendered("comparison_table", skin_name)
 
-    return f'''    <mj-section padding="32px 24px" background-color="{skin['brandPrimary']}">
-      <mj-column width="25%">
-        <mj-text align="center" font-size="36px" color="{skin['brandBG']}" font-weight="700" padding="0">
-          {{{{stat1Value}}}}
-        </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandBG']}" css-class="opacity-80" padding="4px 0 0">
-          {{{{stat1Label}}}}
-        </mj-text>
-      </mj-column>
-      <mj-column width="25%">
-        <mj-text align="center" font-size="36px" color="{skin['brandBG']}" font-weight="700" padding="0">
-          {{{{stat2Value}}}}
-        </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandBG']}" css-class="opacity-80" padding="4px 0 0">
-          {{{{stat2Label}}}}
-        </mj-text>
-      </mj-column>
-      <mj-column width="25%">
-        <mj-text align="center" font-size="36px" color="{skin['brandBG']}" font-weight="700" padding="0">
-          {{{{stat3Value}}}}
-        </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandBG']}" css-class="opacity-80" padding="4px 0 0">
-          {{{{stat3Label}}}}
-        </mj-text>
-      </mj-column>
-      <mj-column width="25%">
-        <mj-text align="center" font-size="36px" color="{skin['brandBG']}" font-weight="700" padding="0">
-          {{{{stat4Value}}}}
+
+_STATS_COLUMN_MJML = '''      <mj-column width="25%">
+        <mj-text align="center" font-size="36px" color="{brandBG}" font-weight="700" padding="0">
+          {stat${n}Value}
         </mj-text>
-        <mj-text align="center" font-size="14px" color="{skin['brandBG']}" css-class="opacity-80" padding="4px 0 0">
-          {{{{stat4Label}}}}
+        <mj-text align="center" font-size="14px" color="{brandBG}" css-class="opacity-80" padding="4px 0 0">
+          {stat${n}Label}
         </mj-text>
       </mj-column>
-    </mj-section>'''
+'''
 
+_STATS_METRICS_MJML = '''    <mj-section padding="32px 24px" background-color="{brandPrimary}">
+''' + _repeat_fragment(_STATS_COLUMN_MJML, [{"n": n} for n in range(1, 5)]) + '''    </mj-section>'''
 
-def section_to_mjml_rating_stars(skin_name="apple_light"):
-    """Convert rating stars to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
 
-    return f'''    <mj-section padding="24px">
-      <mj-column background-color="{skin['brandSecondary']}08" border-radius="8px" padding="24px">
+def section_to_mjml_stats_metrics(skin_name="apple_light"):
+    """Convert stats metrics to MJML."""
+    return _rendered("stats_metrics", skin_name)
+
+
+_RATING_STARS_MJML = '''    <mj-section padding="24px">
+      <mj-column background-color="{brandSecondary}08" border-radius="8px" padding="24px">
         <mj-table>
           <tr>
             <td width="120" valign="middle">
-              <img src="{IMAGE_PLACEHOLDERS['product']}" alt="{{{{ratingProductAlt}}}}" width="100" height="100" style="border-radius: 8px;" />
+              <img src="{img_product}" alt="{ratingProductAlt}" width="100" height="100" style="border-radius: 8px;" />
             </td>
             <td style="padding-left: 16px;" valign="middle">
-              <h3 style="font-size: 18px; color: {skin['brandPrimary']}; margin: 0 0 8px;">{{{{ratingProductName}}}}</h3>
-              <p style="font-size: 20px; color: {skin['brandAccent']}; margin: 0; letter-spacing: 2px;">&#9733;&#9733;&#9733;&#9733;&#9734; <span style="font-size: 16px; color: {skin['brandPrimary']}; font-weight: 700;">{{{{ratingScore}}}}</span></p>
-              <p style="font-size: 14px; color: {skin['brandSecondary']}; margin: 8px 0 0;">{{{{ratingCount}}}} reviews</p>
+              <h3 style="font-size: 18px; color: {brandPrimary}; margin: 0 0 8px;">{ratingProductName}</h3>
+              <p style="font-size: 20px; color: {brandAccent}; margin: 0; letter-spacing: 2px;">&#9733;&#9733;&#9733;&#9733;&#9734; <span style="font-size: 16px; color: {brandPrimary}; font-weight: 700;">{ratingScore}</span></p>
+              <p style="font-size: 14px; color: {brandSecondary}; margin: 8px 0 0;">{ratingCount} reviews</p>
             </td>
           </tr>
         </mj-table>
-        <mj-divider border-color="{skin['brandSecondary']}20" border-width="1px" padding="16px 0" />
-        <mj-text font-size="14px" font-style="italic" color="{skin['brandText']}" padding="0">
-          &ldquo;{{{{ratingReviewText}}}}&rdquo;
+        <mj-divider border-color="{brandSecondary}20" border-width="1px" padding="16px 0" />
+        <mj-text font-size="14px" font-style="italic" color="{brandText}" padding="0">
+          &ldquo;{ratingReviewText}&rdquo;
         </mj-text>
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" padding="8px 0 0">
-          &mdash; {{{{ratingReviewAuthor}}}}
+        <mj-text font-size="13px" color="{brandSecondary}" padding="8px 0 0">
+          &mdash; {ratingReviewAuthor}
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_gallery_carousel(skin_name="apple_light"):
-    """Convert gallery carousel to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_rating_stars(skin_name="apple_light"):
+    """Convert rating stars to MJML."""
+    return _rendered("rating_stars", skin_name)
 
-    return f'''    <mj-section padding="24px">
-      <mj-column>
-        <mj-text align="center" font-size="24px" color="{skin['brandPrimary']}" padding="0 0 16px">
-          {{{{galleryHeadline}}}}
-        </mj-text>
-      </mj-column>
-    </mj-section>
-    <mj-section padding="0 24px">
-      <mj-column width="25%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="{{{{galleryItem1Alt}}}}" href="{{{{galleryItem1Url}}}}" border-radius="8px" />
-        <mj-text align="center" font-size="13px" color="{skin['brandPrimary']}" padding="8px 0 0">
-          {{{{galleryItem1Label}}}}
-        </mj-text>
-      </mj-column>
-      <mj-column width="25%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="{{{{galleryItem2Alt}}}}" href="{{{{galleryItem2Url}}}}" border-radius="8px" />
-        <mj-text align="center" font-size="13px" color="{skin['brandPrimary']}" padding="8px 0 0">
-          {{{{galleryItem2Label}}}}
-        </mj-text>
-      </mj-column>
-      <mj-column width="25%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="{{{{galleryItem3Alt}}}}" href="{{{{galleryItem3Url}}}}" border-radius="8px" />
-        <mj-text align="center" font-size="13px" color="{skin['brandPrimary']}" padding="8px 0 0">
-          {{{{galleryItem3Label}}}}
+
+_GALLERY_ITEM_MJML = '''      <mj-column width="25%">
+        <mj-image src="{img_product}" alt="{galleryItem${n}Alt}" href="{galleryItem${n}Url}" border-radius="8px" />
+        <mj-text align="center" font-size="13px" color="{brandPrimary}" padding="8px 0 0">
+          {galleryItem${n}Label}
         </mj-text>
       </mj-column>
-      <mj-column width="25%">
-        <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="{{{{galleryItem4Alt}}}}" href="{{{{galleryItem4Url}}}}" border-radius="8px" />
-        <mj-text align="center" font-size="13px" color="{skin['brandPrimary']}" padding="8px 0 0">
-          {{{{galleryItem4Label}}}}
+'''
+
+_GALLERY_CAROUSEL_MJML = '''    <mj-section padding="24px">
+      <mj-column>
+        <mj-text align="center" font-size="24px" color="{brandPrimary}" padding="0 0 16px">
+          {galleryHeadline}
         </mj-text>
       </mj-column>
     </mj-section>
+    <mj-section padding="0 24px">
+''' + _repeat_fragment(_GALLERY_ITEM_MJML, [{"n": n} for n in range(1, 5)]) + '''    </mj-section>
     <mj-section padding="16px 24px 24px">
       <mj-column>
         <mj-text align="center">
-          <a href="{{{{galleryViewAllUrl}}}}" style="font-size: 14px; color: {skin['brandAccent']}; text-decoration: underline;">View all &rarr;</a>
+          <a href="{galleryViewAllUrl}" style="font-size: 14px; color: {brandAccent}; text-decoration: underline;">View all &rarr;</a>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_multi_step_form(skin_name="apple_light"):
-    """Convert multi-step form to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_gallery_carousel(skin_name="apple_light"):
+    """Convert gallery carousel to MJML."""
+    return _rendered("gallery_carousel", skin_name)
+
 
-    return f'''    <mj-section padding="24px">
-      <mj-column background-color="{skin['brandSecondary']}08" border-radius="8px" padding="24px">
-        <mj-text font-size="20px" color="{skin['brandPrimary']}" padding="0 0 8px">
-          {{{{formHeadline}}}}
+_MULTI_STEP_FORM_MJML = '''    <mj-section padding="24px">
+      <mj-column background-color="{brandSecondary}08" border-radius="8px" padding="24px">
+        <mj-text font-size="20px" color="{brandPrimary}" padding="0 0 8px">
+          {formHeadline}
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="0 0 20px">
-          {{{{formSubheadline}}}}
+        <mj-text font-size="14px" color="{brandSecondary}" padding="0 0 20px">
+          {formSubheadline}
         </mj-text>
         <!-- Progress bar -->
         <mj-table padding="0 0 8px">
           <tr>
-            <td style="background-color: {skin['brandSecondary']}20; border-radius: 4px; height: 8px;">
-              <div style="background-color: {skin['brandAccent']}; border-radius: 4px; height: 8px; width: 33%;"></div>
+            <td style="background-color: {brandSecondary}20; border-radius: 4px; height: 8px;">
+              <div style="background-color: {brandAccent}; border-radius: 4px; height: 8px; width: 33%;"></div>
             </td>
           </tr>
         </mj-table>
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" padding="0 0 24px">
-          Step {{{{formCurrentStep}}}} of {{{{formTotalSteps}}}}
+        <mj-text font-size="12px" color="{brandSecondary}" padding="0 0 24px">
+          Step {formCurrentStep} of {formTotalSteps}
         </mj-text>
         <!-- Field 1 -->
-        <mj-text font-size="13px" color="{skin['brandPrimary']}" font-weight="600" padding="0 0 6px">
-          {{{{formField1Label}}}}
+        <mj-text font-size="13px" color="{brandPrimary}" font-weight="600" padding="0 0 6px">
+          {formField1Label}
         </mj-text>
-        <mj-text background-color="{skin['brandBG']}" border="1px solid {skin['brandSecondary']}40" border-radius="6px" padding="12px 14px" font-size="14px" color="{skin['brandSecondary']}">
-          {{{{formField1Placeholder}}}}
+        <mj-text background-color="{brandBG}" border="1px solid {brandSecondary}40" border-radius="6px" padding="12px 14px" font-size="14px" color="{brandSecondary}">
+          {formField1Placeholder}
         </mj-text>
         <!-- Field 2 -->
-        <mj-text font-size="13px" color="{skin['brandPrimary']}" font-weight="600" padding="16px 0 6px">
-          {{{{formField2Label}}}}
+        <mj-text font-size="13px" color="{brandPrimary}" font-weight="600" padding="16px 0 6px">
+          {formField2Label}
         </mj-text>
-        <mj-text background-color="{skin['brandBG']}" border="1px solid {skin['brandSecondary']}40" border-radius="6px" padding="12px 14px" font-size="14px" color="{skin['brandSecondary']}">
-          {{{{formField2Placeholder}}}}
+        <mj-text background-color="{brandBG}" border="1px solid {brandSecondary}40" border-radius="6px" padding="12px 14px" font-size="14px" color="{brandSecondary}">
+          {formField2Placeholder}
         </mj-text>
         <!-- Field 3 -->
-        <mj-text font-size="13px" color="{skin['brandPrimary']}" font-weight="600" padding="16px 0 6px">
-          {{{{formField3Label}}}}
+        <mj-text font-size="13px" color="{brandPrimary}" font-weight="600" padding="16px 0 6px">
+          {formField3Label}
         </mj-text>
-        <mj-text background-color="{skin['brandBG']}" border="1px solid {skin['brandSecondary']}40" border-radius="6px" padding="12px 14px 20px" font-size="14px" color="{skin['brandSecondary']}">
-          {{{{formField3Placeholder}}}}
+        <mj-text background-color="{brandBG}" border="1px solid {brandSecondary}40" border-radius="6px" padding="12px 14px 20px" font-size="14px" color="{brandSecondary}">
+          {formField3Placeholder}
         </mj-text>
-        <mj-button href="{{{{formContinueUrl}}}}" background-color="{skin['brandAccent']}" padding="0">
-          {{{{formContinueLabel}}}}
+        <mj-button href="{formContinueUrl}" background-color="{brandAccent}" padding="0">
+          {formContinueLabel}
         </mj-button>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_referral_program(skin_name="apple_light"):
-    """Convert referral program section to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_multi_step_form(skin_name="apple_light"):
+    """Convert multi-step form to MJML."""
+    return _rendered("multi_step_form", skin_name)
 
-    return f'''    <mj-section padding="24px">
-      <mj-column background-color="{skin['brandAccent']}10" border="2px dashed {skin['brandAccent']}40" border-radius="12px" padding="32px">
+
+_REFERRAL_PROGRAM_MJML = '''    <mj-section padding="24px">
+      <mj-column background-color="{brandAccent}10" border="2px dashed {brandAccent}40" border-radius="12px" padding="32px">
         <!-- Icon -->
-        <mj-image src="{IMAGE_PLACEHOLDERS['icon']}" alt="Refer" width="80px" background-color="{skin['brandAccent']}" border-radius="50%" padding="0" />
-        <mj-text align="center" font-size="24px" color="{skin['brandPrimary']}" font-weight="600" padding="24px 0 8px">
-          {{{{referralHeadline}}}}
+        <mj-image src="{img_icon}" alt="Refer" width="80px" background-color="{brandAccent}" border-radius="50%" padding="0" />
+        <mj-text align="center" font-size="24px" color="{brandPrimary}" font-weight="600" padding="24px 0 8px">
+          {referralHeadline}
         </mj-text>
-        <mj-text align="center" font-size="16px" color="{skin['brandSecondary']}" padding="0 0 24px">
-          {{{{referralDescription}}}}
+        <mj-text align="center" font-size="16px" color="{brandSecondary}" padding="0 0 24px">
+          {referralDescription}
         </mj-text>
       </mj-column>
     </mj-section>
     <mj-section padding="0 24px">
-      <mj-column width="50%" background-color="{skin['brandBG']}" border-radius="8px 0 0 8px" padding="16px">
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" padding="0 0 4px">
+      <mj-column width="50%" background-color="{brandBG}" border-radius="8px 0 0 8px" padding="16px">
+        <mj-text align="center" font-size="12px" color="{brandSecondary}" text-transform="uppercase" padding="0 0 4px">
           You Get
         </mj-text>
-        <mj-text align="center" font-size="24px" color="{skin['brandAccent']}" font-weight="700" padding="0">
-          {{{{referralYourReward}}}}
+        <mj-text align="center" font-size="24px" color="{brandAccent}" font-weight="700" padding="0">
+          {referralYourReward}
         </mj-text>
       </mj-column>
-      <mj-column width="50%" background-color="{skin['brandBG']}" border-radius="0 8px 8px 0" border-left="2px solid {skin['brandSecondary']}20" padding="16px">
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" padding="0 0 4px">
+      <mj-column width="50%" background-color="{brandBG}" border-radius="0 8px 8px 0" border-left="2px solid {brandSecondary}20" padding="16px">
+        <mj-text align="center" font-size="12px" color="{brandSecondary}" text-transform="uppercase" padding="0 0 4px">
           They Get
         </mj-text>
-        <mj-text align="center" font-size="24px" color="{skin['brandAccent']}" font-weight="700" padding="0">
-          {{{{referralTheirReward}}}}
+        <mj-text align="center" font-size="24px" color="{brandAccent}" font-weight="700" padding="0">
+          {referralTheirReward}
         </mj-text>
       </mj-column>
     </mj-section>
     <mj-section padding="24px">
       <mj-column>
-        <mj-text font-family="monospace" font-size="14px" color="{skin['brandPrimary']}" background-color="{skin['brandBG']}" border="1px solid {skin['brandSecondary']}30" border-radius="8px" padding="14px 20px" align="center">
-          {{{{referralLink}}}}
+        <mj-text font-family="monospace" font-size="14px" color="{brandPrimary}" background-color="{brandBG}" border="1px solid {brandSecondary}30" border-radius="8px" padding="14px 20px" align="center">
+          {referralLink}
         </mj-text>
-        <mj-button href="{{{{referralShareUrl}}}}" background-color="{skin['brandAccent']}" padding="20px 0 0">
-          {{{{referralCtaLabel}}}}
+        <mj-button href="{referralShareUrl}" background-color="{brandAccent}" padding="20px 0 0">
+          {referralCtaLabel}
         </mj-button>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_loyalty_points(skin_name="apple_light"):
-    """Convert loyalty points section to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_referral_program(skin_name="apple_light"):
+    """Convert referral program section to MJML."""
+    return _rendered("referral_program", skin_name)
+
 
-    return f'''    <mj-section padding="24px">
-      <mj-column background-color="{skin['brandPrimary']}" border-radius="16px" padding="32px">
+_LOYALTY_POINTS_MJML = '''    <mj-section padding="24px">
+      <mj-column background-color="{brandPrimary}" border-radius="16px" padding="32px">
         <!-- Header row -->
         <mj-text font-size="14px" color="#ffffff99" text-transform="uppercase" letter-spacing="1px" padding="0 0 4px">
-          {{{{loyaltyProgramName}}}}
+          {loyaltyProgramName}
         </mj-text>
         <mj-text font-size="28px" color="#ffffff" font-weight="600" padding="0 0 24px">
-          {{{{loyaltyUserName}}}}
+          {loyaltyUserName}
         </mj-text>
         <!-- Points display -->
         <mj-text align="center" font-size="56px" color="#ffffff" font-weight="700" line-height="1" padding="0">
-          {{{{loyaltyPoints}}}}
+          {loyaltyPoints}
         </mj-text>
         <mj-text align="center" font-size="16px" color="#ffffff99" padding="8px 0 24px">
           points available
         </mj-text>
         <!-- Tier badge -->
         <mj-text align="center" font-size="14px" color="#ffffff" font-weight="600" background-color="#ffffff20" border-radius="20px" padding="6px 16px">
-          {{{{loyaltyTier}}}}
+          {loyaltyTier}
         </mj-text>
         <!-- Progress bar placeholder -->
         <mj-text align="center" font-size="13px" color="#ffffff99" padding="24px 0">
-          {{{{loyaltyPointsToNext}}}} points to {{{{loyaltyNextTier}}}}
+          {loyaltyPointsToNext} points to {loyaltyNextTier}
         </mj-text>
-        <mj-button href="{{{{loyaltyRedeemUrl}}}}" background-color="#ffffff" color="{skin['brandPrimary']}" padding="0">
-          {{{{loyaltyCtaLabel}}}}
+        <mj-button href="{loyaltyRedeemUrl}" background-color="#ffffff" color="{brandPrimary}" padding="0">
+          {loyaltyCtaLabel}
         </mj-button>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_gift_card(skin_name="apple_light"):
-    """Convert gift card section to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_loyalty_points(skin_name="apple_light"):
+    """Convert loyalty points section to MJML."""
+    return _rendered("loyalty_points", skin_name)
 
-    return f'''    <mj-section padding="24px">
-      <mj-column background-color="{skin['brandPrimary']}" border-radius="16px" padding="0">
+
+_GIFT_CARD_MJML = '''    <mj-section padding="24px">
+      <mj-column background-color="{brandPrimary}" border-radius="16px" padding="0">
         <!-- Decorative header strip -->
-        <mj-text font-size="14px" color="#ffffff" font-weight="600" text-transform="uppercase" letter-spacing="2px" background-color="{skin['brandAccent']}" padding="16px 32px">
-          {{{{giftCardBrandName}}}}
+        <mj-text font-size="14px" color="#ffffff" font-weight="600" text-transform="uppercase" letter-spacing="2px" background-color="{brandAccent}" padding="16px 32px">
+          {giftCardBrandName}
         </mj-text>
         <!-- Main body -->
         <mj-text font-size="16px" color="#ffffff99" padding="32px 32px 8px">
           Gift Card
         </mj-text>
         <mj-text font-size="48px" color="#ffffff" font-weight="700" padding="0 32px 24px">
-          {{{{giftCardAmount}}}}
+          {giftCardAmount}
         </mj-text>
         <!-- Gift card code -->
         <mj-text font-size="12px" color="#ffffff80" text-transform="uppercase" background-color="#ffffff15" border-radius="8px" padding="20px 20px 8px">
           Your Gift Code
         </mj-text>
         <mj-text font-family="monospace" font-size="28px" color="#ffffff" font-weight="600" letter-spacing="4px" background-color="#ffffff15" border-radius="8px" padding="0 20px 20px">
-          {{{{giftCardCode}}}}
+          {giftCardCode}
         </mj-text>
         <!-- From/To info -->
         <mj-text font-size="12px" color="#ffffff80" text-transform="uppercase" padding="24px 32px 4px">
-          From: {{{{giftCardFrom}}}} | To: {{{{giftCardTo}}}}
+          From: {giftCardFrom} | To: {giftCardTo}
         </mj-text>
         <!-- Personal message -->
-        <mj-text font-size="16px" color="#ffffff" font-style="italic" border-left="3px solid {skin['brandAccent']}" padding="16px 32px 24px">
-          "{{{{giftCardMessage}}}}"
+        <mj-text font-size="16px" color="#ffffff" font-style="italic" border-left="3px solid {brandAccent}" padding="16px 32px 24px">
+          "{giftCardMessage}"
         </mj-text>
-        <mj-button href="{{{{giftCardRedeemUrl}}}}" background-color="{skin['brandAccent']}" padding="0 32px 24px">
-          {{{{giftCardCtaLabel}}}}
+        <mj-button href="{giftCardRedeemUrl}" background-color="{brandAccent}" padding="0 32px 24px">
+          {giftCardCtaLabel}
         </mj-button>
         <mj-text align="center" font-size="12px" color="#ffffff60" padding="0 32px 32px">
-          Valid until {{{{giftCardExpiry}}}}
+          Valid until {giftCardExpiry}
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_subscription_renewal(skin_name="apple_light"):
-    """Convert subscription renewal section to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_gift_card(skin_name="apple_light"):
+    """Convert gift card section to MJML."""
+    return _rendered("gift_card", skin_name)
+
 
-    return f'''    <mj-section padding="24px">
-      <mj-column border="1px solid {skin['brandSecondary']}20" border-radius="12px" padding="32px">
+_SUBSCRIPTION_RENEWAL_MJML = '''    <mj-section padding="24px">
+      <mj-column border="1px solid {brandSecondary}20" border-radius="12px" padding="32px">
         <!-- Status indicator -->
-        <mj-text font-size="13px" color="{{{{subscriptionStatusColor}}}}" font-weight="600" background-color="{{{{subscriptionStatusColor}}}}15" border-radius="20px" padding="6px 16px">
-          {{{{subscriptionStatus}}}}
+        <mj-text font-size="13px" color="{subscriptionStatusColor}" font-weight="600" background-color="{subscriptionStatusColor}15" border-radius="20px" padding="6px 16px">
+          {subscriptionStatus}
         </mj-text>
-        <mj-text font-size="24px" color="{skin['brandPrimary']}" font-weight="600" padding="24px 0 8px">
-          {{{{subscriptionHeadline}}}}
+        <mj-text font-size="24px" color="{brandPrimary}" font-weight="600" padding="24px 0 8px">
+          {subscriptionHeadline}
         </mj-text>
-        <mj-text font-size="16px" color="{skin['brandSecondary']}" padding="0 0 24px">
-          {{{{subscriptionDescription}}}}
+        <mj-text font-size="16px" color="{brandSecondary}" padding="0 0 24px">
+          {subscriptionDescription}
         </mj-text>
         <!-- Plan details card -->
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" background-color="{skin['brandSecondary']}08" border-radius="8px" padding="24px 24px 4px">
+        <mj-text font-size="14px" color="{brandSecondary}" background-color="{brandSecondary}08" border-radius="8px" padding="24px 24px 4px">
           Current Plan
         </mj-text>
-        <mj-text font-size="20px" color="{skin['brandPrimary']}" font-weight="600" background-color="{skin['brandSecondary']}08" border-radius="8px" padding="0 24px 16px">
-          {{{{subscriptionPlanName}}}}
+        <mj-text font-size="20px" color="{brandPrimary}" font-weight="600" background-color="{brandSecondary}08" border-radius="8px" padding="0 24px 16px">
+          {subscriptionPlanName}
         </mj-text>
-        <mj-text font-size="28px" color="{skin['brandPrimary']}" font-weight="700" background-color="{skin['brandSecondary']}08" border-radius="8px" padding="0 24px 4px" align="right">
-          {{{{subscriptionPrice}}}}
+        <mj-text font-size="28px" color="{brandPrimary}" font-weight="700" background-color="{brandSecondary}08" border-radius="8px" padding="0 24px 4px" align="right">
+          {subscriptionPrice}
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" background-color="{skin['brandSecondary']}08" border-radius="8px" padding="0 24px 24px" align="right">
-          {{{{subscriptionBillingCycle}}}}
+        <mj-text font-size="14px" color="{brandSecondary}" background-color="{brandSecondary}08" border-radius="8px" padding="0 24px 24px" align="right">
+          {subscriptionBillingCycle}
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}20" padding="0 24px" />
+        <mj-divider border-color="{brandSecondary}20" padding="0 24px" />
         <!-- Renewal info -->
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" padding="16px 0 4px">
-          Renewal Date: {{{{subscriptionRenewalDate}}}}
+        <mj-text font-size="13px" color="{brandSecondary}" padding="16px 0 4px">
+          Renewal Date: {subscriptionRenewalDate}
         </mj-text>
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" padding="0 0 24px">
-          Payment Method: {{{{subscriptionPaymentMethod}}}}
+        <mj-text font-size="13px" color="{brandSecondary}" padding="0 0 24px">
+          Payment Method: {subscriptionPaymentMethod}
         </mj-text>
         <!-- Action buttons -->
-        <mj-button href="{{{{subscriptionManageUrl}}}}" background-color="{skin['brandAccent']}" padding="0 0 12px">
-          {{{{subscriptionPrimaryCtaLabel}}}}
+        <mj-button href="{subscriptionManageUrl}" background-color="{brandAccent}" padding="0 0 12px">
+          {subscriptionPrimaryCtaLabel}
         </mj-button>
-        <mj-button href="{{{{subscriptionUpgradeUrl}}}}" background-color="transparent" color="{skin['brandAccent']}" border="2px solid {skin['brandAccent']}" padding="0 0 24px">
-          {{{{subscriptionSecondaryCtaLabel}}}}
+        <mj-button href="{subscriptionUpgradeUrl}" background-color="transparent" color="{brandAccent}" border="2px solid {brandAccent}" padding="0 0 24px">
+          {subscriptionSecondaryCtaLabel}
         </mj-button>
-        <mj-text align="center" font-size="13px" color="{skin['brandSecondary']}" padding="0">
-          Questions? <a href="{{{{subscriptionHelpUrl}}}}" style="color: {skin['brandAccent']}; text-decoration: underline;">Contact Support</a>
+        <mj-text align="center" font-size="13px" color="{brandSecondary}" padding="0">
+          Questions? <a href="{subscriptionHelpUrl}" style="color: {brandAccent}; text-decoration: underline;">Contact Support</a>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_wishlist_item(skin_name="apple_light"):
-    """Convert wishlist item section to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_subscription_renewal(skin_name="apple_light"):
+    """Convert subscription renewal section to MJML."""
+    return _rendered("subscription_renewal", skin_name)
 
-    return f'''    <mj-section padding="16px 24px">
-      <mj-column border="1px solid {skin['brandSecondary']}20" border-radius="8px" padding="16px">
+
+_WISHLIST_ITEM_MJML = '''    <mj-section padding="16px 24px">
+      <mj-column border="1px solid {brandSecondary}20" border-radius="8px" padding="16px">
         <mj-group>
           <mj-column width="120px" padding="0">
-            <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="{{{{wishlistItemAlt}}}}" width="100px" border-radius="4px" />
+            <mj-image src="{img_product}" alt="{wishlistItemAlt}" width="100px" border-radius="4px" />
           </mj-column>
           <mj-column padding-left="16px">
-            <mj-text font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="0.5px" padding="0 0 4px">
-              {{{{wishlistItemBrand}}}}
+            <mj-text font-size="12px" color="{brandSecondary}" text-transform="uppercase" letter-spacing="0.5px" padding="0 0 4px">
+              {wishlistItemBrand}
             </mj-text>
-            <mj-text font-size="16px" color="{skin['brandPrimary']}" font-weight="600" padding="0 0 8px">
-              {{{{wishlistItemName}}}}
+            <mj-text font-size="16px" color="{brandPrimary}" font-weight="600" padding="0 0 8px">
+              {wishlistItemName}
             </mj-text>
-            <mj-text font-size="18px" color="{skin['brandPrimary']}" font-weight="700" padding="0 0 8px">
-              {{{{wishlistItemPrice}}}}
+            <mj-text font-size="18px" color="{brandPrimary}" font-weight="700" padding="0 0 8px">
+              {wishlistItemPrice}
             </mj-text>
-            <mj-text font-size="12px" color="{{{{wishlistItemStatusColor}}}}" font-weight="600" background-color="{{{{wishlistItemStatusColor}}}}15" border-radius="4px" padding="4px 10px" width="auto">
-              {{{{wishlistItemStatus}}}}
+            <mj-text font-size="12px" color="{wishlistItemStatusColor}" font-weight="600" background-color="{wishlistItemStatusColor}15" border-radius="4px" padding="4px 10px" width="auto">
+              {wishlistItemStatus}
             </mj-text>
-            <mj-button href="{{{{wishlistItemUrl}}}}" background-color="{skin['brandAccent']}" padding="12px 0 0" font-size="14px" border-radius="6px" inner-padding="10px 20px">
+            <mj-button href="{wishlistItemUrl}" background-color="{brandAccent}" padding="12px 0 0" font-size="14px" border-radius="6px" inner-padding="10px 20px">
               View Item
             </mj-button>
           </mj-column>
@@ -1433,14 +2514,15 @@ def section_to_mjml_wishlist_item(skin_name="apple_light"):
     </mj-section>'''
 
 
-def section_to_mjml_price_alert(skin_name="apple_light"):
-    """Convert price alert section to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_wishlist_item(skin_name="apple_light"):
+    """Convert wishlist item section to MJML."""
+    return _rendered("wishlist_item", skin_name)
+
 
-    return f'''    <mj-section padding="24px">
-      <mj-column border="2px solid {skin['brandAccent']}" border-radius="12px">
+_PRICE_ALERT_MJML = '''    <mj-section padding="24px">
+      <mj-column border="2px solid {brandAccent}" border-radius="12px">
         <!-- Alert header -->
-        <mj-section background-color="{skin['brandAccent']}" padding="12px 20px" full-width="full-width">
+        <mj-section background-color="{brandAccent}" padding="12px 20px" full-width="full-width">
           <mj-column width="50%">
             <mj-text font-size="14px" color="#ffffff" font-weight="700">
               🔔 PRICE DROP ALERT
@@ -1448,38 +2530,38 @@ def section_to_mjml_price_alert(skin_name="apple_light"):
           </mj-column>
           <mj-column width="50%">
             <mj-text align="right" font-size="14px" color="#ffffff" font-weight="600">
-              {{{{priceAlertSavings}}}} OFF
+              {priceAlertSavings} OFF
             </mj-text>
           </mj-column>
         </mj-section>
         <!-- Product details -->
         <mj-section padding="20px">
           <mj-column width="140px" padding="0">
-            <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="{{{{priceAlertItemAlt}}}}" width="120px" border-radius="8px" />
+            <mj-image src="{img_product}" alt="{priceAlertItemAlt}" width="120px" border-radius="8px" />
           </mj-column>
           <mj-column padding-left="20px">
-            <mj-text font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="0.5px" padding="0 0 4px">
-              {{{{priceAlertItemBrand}}}}
+            <mj-text font-size="12px" color="{brandSecondary}" text-transform="uppercase" letter-spacing="0.5px" padding="0 0 4px">
+              {priceAlertItemBrand}
             </mj-text>
-            <mj-text font-size="18px" color="{skin['brandPrimary']}" font-weight="600" padding="0 0 12px">
-              {{{{priceAlertItemName}}}}
+            <mj-text font-size="18px" color="{brandPrimary}" font-weight="600" padding="0 0 12px">
+              {priceAlertItemName}
             </mj-text>
-            <mj-text font-size="14px" color="{skin['brandSecondary']}" text-decoration="line-through" padding="0">
-              {{{{priceAlertOriginalPrice}}}}
+            <mj-text font-size="14px" color="{brandSecondary}" text-decoration="line-through" padding="0">
+              {priceAlertOriginalPrice}
             </mj-text>
-            <mj-text font-size="24px" color="{skin['brandAccent']}" font-weight="700" padding="0 0 16px">
-              {{{{priceAlertNewPrice}}}}
+            <mj-text font-size="24px" color="{brandAccent}" font-weight="700" padding="0 0 16px">
+              {priceAlertNewPrice}
             </mj-text>
-            <mj-button href="{{{{priceAlertItemUrl}}}}" background-color="{skin['brandAccent']}" padding="0" font-size="14px" border-radius="6px" inner-padding="12px 24px">
+            <mj-button href="{priceAlertItemUrl}" background-color="{brandAccent}" padding="0" font-size="14px" border-radius="6px" inner-padding="12px 24px">
               Shop Now
             </mj-button>
           </mj-column>
         </mj-section>
         <!-- Urgency footer -->
-        <mj-section background-color="{skin['brandSecondary']}08" padding="12px 20px">
+        <mj-section background-color="{brandSecondary}08" padding="12px 20px">
           <mj-column>
-            <mj-text align="center" font-size="13px" color="{skin['brandSecondary']}">
-              {{{{priceAlertUrgency}}}}
+            <mj-text align="center" font-size="13px" color="{brandSecondary}">
+              {priceAlertUrgency}
             </mj-text>
           </mj-column>
         </mj-section>
@@ -1487,167 +2569,169 @@ def section_to_mjml_price_alert(skin_name="apple_light"):
     </mj-section>'''
 
 
-def section_to_mjml_back_in_stock(skin_name="apple_light"):
-    """Convert back-in-stock section to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_price_alert(skin_name="apple_light"):
+    """Convert price alert section to MJML."""
+    return _rendered("price_alert", skin_name)
 
-    return f'''    <mj-section padding="24px">
+
+_BACK_IN_STOCK_MJML = '''    <mj-section padding="24px">
       <mj-column>
         <!-- Back in stock banner -->
-        <mj-text align="center" font-size="16px" color="{skin['brandAccent']}" font-weight="700" background-color="{skin['brandAccent']}20" border-radius="8px" padding="16px">
+        <mj-text align="center" font-size="16px" color="{brandAccent}" font-weight="700" background-color="{brandAccent}20" border-radius="8px" padding="16px">
           ✨ BACK IN STOCK ✨
         </mj-text>
       </mj-column>
     </mj-section>
     <mj-section padding="0 24px 24px">
-      <mj-column border="1px solid {skin['brandSecondary']}20" border-radius="12px" padding="24px">
-        <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="{{{{backInStockItemAlt}}}}" width="200px" border-radius="8px" padding-bottom="20px" />
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="1px" padding="0 0 8px">
-          {{{{backInStockItemBrand}}}}
+      <mj-column border="1px solid {brandSecondary}20" border-radius="12px" padding="24px">
+        <mj-image src="{img_product}" alt="{backInStockItemAlt}" width="200px" border-radius="8px" padding-bottom="20px" />
+        <mj-text align="center" font-size="12px" color="{brandSecondary}" text-transform="uppercase" letter-spacing="1px" padding="0 0 8px">
+          {backInStockItemBrand}
         </mj-text>
-        <mj-text align="center" font-size="22px" color="{skin['brandPrimary']}" font-weight="600" padding="0 0 12px">
-          {{{{backInStockItemName}}}}
+        <mj-text align="center" font-size="22px" color="{brandPrimary}" font-weight="600" padding="0 0 12px">
+          {backInStockItemName}
         </mj-text>
-        <mj-text align="center" font-size="20px" color="{skin['brandPrimary']}" font-weight="700" padding="0 0 20px">
-          {{{{backInStockItemPrice}}}}
+        <mj-text align="center" font-size="20px" color="{brandPrimary}" font-weight="700" padding="0 0 20px">
+          {backInStockItemPrice}
         </mj-text>
         <mj-text align="center" font-size="13px" color="#22c55e" font-weight="600" background-color="#22c55e15" border-radius="20px" padding="8px 16px">
-          {{{{backInStockQuantity}}}} items available
+          {backInStockQuantity} items available
         </mj-text>
-        <mj-button href="{{{{backInStockItemUrl}}}}" background-color="{skin['brandAccent']}" padding="20px 0" font-size="16px" border-radius="8px" inner-padding="14px 32px">
+        <mj-button href="{backInStockItemUrl}" background-color="{brandAccent}" padding="20px 0" font-size="16px" border-radius="8px" inner-padding="14px 32px">
           Buy Now
         </mj-button>
-        <mj-text align="center" font-size="13px" color="{skin['brandSecondary']}" padding="0">
-          {{{{backInStockMessage}}}}
+        <mj-text align="center" font-size="13px" color="{brandSecondary}" padding="0">
+          {backInStockMessage}
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_invoice_details(skin_name="apple_light"):
-    """Convert invoice details section to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_back_in_stock(skin_name="apple_light"):
+    """Convert back-in-stock section to MJML."""
+    return _rendered("back_in_stock", skin_name)
+
 
-    return f'''    <mj-section padding="24px">
+_INVOICE_DETAILS_MJML = '''    <mj-section padding="24px">
       <mj-column>
         <!-- Invoice header -->
-        <mj-text font-size="24px" color="{skin['brandPrimary']}" font-weight="700" padding="0 0 8px">
+        <mj-text font-size="24px" color="{brandPrimary}" font-weight="700" padding="0 0 8px">
           INVOICE
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="0 0 16px">
-          Invoice #{{{{invoiceNumber}}}}
+        <mj-text font-size="14px" color="{brandSecondary}" padding="0 0 16px">
+          Invoice #{invoiceNumber}
         </mj-text>
       </mj-column>
       <mj-column>
-        <mj-text align="right" font-size="14px" color="{skin['brandSecondary']}" padding="0 0 4px">
-          Issue Date: {{{{invoiceDate}}}}
+        <mj-text align="right" font-size="14px" color="{brandSecondary}" padding="0 0 4px">
+          Issue Date: {invoiceDate}
         </mj-text>
-        <mj-text align="right" font-size="14px" color="{skin['brandSecondary']}" padding="0">
-          Due Date: {{{{invoiceDueDate}}}}
+        <mj-text align="right" font-size="14px" color="{brandSecondary}" padding="0">
+          Due Date: {invoiceDueDate}
         </mj-text>
       </mj-column>
     </mj-section>
 
     <!-- Billing info -->
-    <mj-section padding="0 24px 24px" border-top="1px solid {skin['brandSecondary']}20">
+    <mj-section padding="0 24px 24px" border-top="1px solid {brandSecondary}20">
       <mj-column>
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="0.5px" padding="16px 0 8px">
+        <mj-text font-size="12px" color="{brandSecondary}" text-transform="uppercase" letter-spacing="0.5px" padding="16px 0 8px">
           Bill To:
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" font-weight="600" padding="0 0 4px">
-          {{{{invoiceBillToName}}}}
+        <mj-text font-size="14px" color="{brandPrimary}" font-weight="600" padding="0 0 4px">
+          {invoiceBillToName}
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandText']}" line-height="1.5" padding="0">
-          {{{{invoiceBillToAddress}}}}
+        <mj-text font-size="14px" color="{brandText}" line-height="1.5" padding="0">
+          {invoiceBillToAddress}
         </mj-text>
       </mj-column>
       <mj-column>
-        <mj-text align="right" font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="0.5px" padding="16px 0 8px">
+        <mj-text align="right" font-size="12px" color="{brandSecondary}" text-transform="uppercase" letter-spacing="0.5px" padding="16px 0 8px">
           From:
         </mj-text>
-        <mj-text align="right" font-size="14px" color="{skin['brandPrimary']}" font-weight="600" padding="0 0 4px">
-          {{{{companyName}}}}
+        <mj-text align="right" font-size="14px" color="{brandPrimary}" font-weight="600" padding="0 0 4px">
+          {companyName}
         </mj-text>
-        <mj-text align="right" font-size="14px" color="{skin['brandText']}" line-height="1.5" padding="0">
-          {{{{companyAddress}}}}
+        <mj-text align="right" font-size="14px" color="{brandText}" line-height="1.5" padding="0">
+          {companyAddress}
         </mj-text>
       </mj-column>
     </mj-section>
 
     <!-- Line items table -->
-    <mj-section padding="0 24px" background-color="{skin['brandSecondary']}08">
+    <mj-section padding="0 24px" background-color="{brandSecondary}08">
       <mj-column width="40%">
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" font-weight="600" text-transform="uppercase" padding="12px 16px">
+        <mj-text font-size="12px" color="{brandSecondary}" font-weight="600" text-transform="uppercase" padding="12px 16px">
           Description
         </mj-text>
       </mj-column>
       <mj-column width="20%">
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}" font-weight="600" text-transform="uppercase" padding="12px 16px">
+        <mj-text align="center" font-size="12px" color="{brandSecondary}" font-weight="600" text-transform="uppercase" padding="12px 16px">
           Qty
         </mj-text>
       </mj-column>
       <mj-column width="20%">
-        <mj-text align="right" font-size="12px" color="{skin['brandSecondary']}" font-weight="600" text-transform="uppercase" padding="12px 16px">
+        <mj-text align="right" font-size="12px" color="{brandSecondary}" font-weight="600" text-transform="uppercase" padding="12px 16px">
           Rate
         </mj-text>
       </mj-column>
       <mj-column width="20%">
-        <mj-text align="right" font-size="12px" color="{skin['brandSecondary']}" font-weight="600" text-transform="uppercase" padding="12px 16px">
+        <mj-text align="right" font-size="12px" color="{brandSecondary}" font-weight="600" text-transform="uppercase" padding="12px 16px">
           Amount
         </mj-text>
       </mj-column>
     </mj-section>
 
     <!-- Line item 1 -->
-    <mj-section padding="0 24px" border-top="1px solid {skin['brandSecondary']}10">
+    <mj-section padding="0 24px" border-top="1px solid {brandSecondary}10">
       <mj-column width="40%">
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" font-weight="500" padding="16px 16px 4px">
-          {{{{invoiceItem1Name}}}}
+        <mj-text font-size="14px" color="{brandPrimary}" font-weight="500" padding="16px 16px 4px">
+          {invoiceItem1Name}
         </mj-text>
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" padding="0 16px 16px">
-          {{{{invoiceItem1Description}}}}
+        <mj-text font-size="12px" color="{brandSecondary}" padding="0 16px 16px">
+          {invoiceItem1Description}
         </mj-text>
       </mj-column>
       <mj-column width="20%">
-        <mj-text align="center" font-size="14px" color="{skin['brandText']}" padding="16px">
-          {{{{invoiceItem1Qty}}}}
+        <mj-text align="center" font-size="14px" color="{brandText}" padding="16px">
+          {invoiceItem1Qty}
         </mj-text>
       </mj-column>
       <mj-column width="20%">
-        <mj-text align="right" font-size="14px" color="{skin['brandText']}" padding="16px">
-          {{{{invoiceItem1Rate}}}}
+        <mj-text align="right" font-size="14px" color="{brandText}" padding="16px">
+          {invoiceItem1Rate}
         </mj-text>
       </mj-column>
       <mj-column width="20%">
-        <mj-text align="right" font-size="14px" color="{skin['brandPrimary']}" font-weight="600" padding="16px">
-          {{{{invoiceItem1Amount}}}}
+        <mj-text align="right" font-size="14px" color="{brandPrimary}" font-weight="600" padding="16px">
+          {invoiceItem1Amount}
         </mj-text>
       </mj-column>
     </mj-section>
 
     <!-- Line item 2 -->
-    <mj-section padding="0 24px" border-top="1px solid {skin['brandSecondary']}10">
+    <mj-section padding="0 24px" border-top="1px solid {brandSecondary}10">
       <mj-column width="40%">
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" font-weight="500" padding="16px 16px 4px">
-          {{{{invoiceItem2Name}}}}
+        <mj-text font-size="14px" color="{brandPrimary}" font-weight="500" padding="16px 16px 4px">
+          {invoiceItem2Name}
         </mj-text>
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" padding="0 16px 16px">
-          {{{{invoiceItem2Description}}}}
+        <mj-text font-size="12px" color="{brandSecondary}" padding="0 16px 16px">
+          {invoiceItem2Description}
         </mj-text>
       </mj-column>
       <mj-column width="20%">
-        <mj-text align="center" font-size="14px" color="{skin['brandText']}" padding="16px">
-          {{{{invoiceItem2Qty}}}}
+        <mj-text align="center" font-size="14px" color="{brandText}" padding="16px">
+          {invoiceItem2Qty}
         </mj-text>
       </mj-column>
       <mj-column width="20%">
-        <mj-text align="right" font-size="14px" color="{skin['brandText']}" padding="16px">
-          {{{{invoiceItem2Rate}}}}
+        <mj-text align="right" font-size="14px" color="{brandText}" padding="16px">
+          {invoiceItem2Rate}
         </mj-text>
       </mj-column>
       <mj-column width="20%">
-        <mj-text align="right" font-size="14px" color="{skin['brandPrimary']}" font-weight="600" padding="16px">
-          {{{{invoiceItem2Amount}}}}
+        <mj-text align="right" font-size="14px" color="{brandPrimary}" font-weight="600" padding="16px">
+          {invoiceItem2Amount}
         </mj-text>
       </mj-column>
     </mj-section>
@@ -1656,72 +2740,73 @@ def section_to_mjml_invoice_details(skin_name="apple_light"):
     <mj-section padding="16px 24px 0">
       <mj-column width="60%"></mj-column>
       <mj-column width="40%">
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="8px 0">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="8px 0">
           <span style="display: inline-block; width: 50%;">Subtotal</span>
-          <span style="display: inline-block; width: 50%; text-align: right;">{{{{invoiceSubtotal}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right;">{invoiceSubtotal}</span>
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="8px 0">
-          <span style="display: inline-block; width: 50%;">Tax ({{{{invoiceTaxRate}}}})</span>
-          <span style="display: inline-block; width: 50%; text-align: right;">{{{{invoiceTax}}}}</span>
+        <mj-text font-size="14px" color="{brandSecondary}" padding="8px 0">
+          <span style="display: inline-block; width: 50%;">Tax ({invoiceTaxRate})</span>
+          <span style="display: inline-block; width: 50%; text-align: right;">{invoiceTax}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandPrimary']}" border-width="2px" padding="8px 0" />
-        <mj-text font-size="16px" color="{skin['brandPrimary']}" font-weight="700" padding="4px 0">
+        <mj-divider border-color="{brandPrimary}" border-width="2px" padding="8px 0" />
+        <mj-text font-size="16px" color="{brandPrimary}" font-weight="700" padding="4px 0">
           <span style="display: inline-block; width: 50%;">Total Due</span>
-          <span style="display: inline-block; width: 50%; text-align: right; font-size: 18px;">{{{{invoiceTotal}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; font-size: 18px;">{invoiceTotal}</span>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_receipt_summary(skin_name="apple_light"):
-    """Convert receipt summary section to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_invoice_details(skin_name="apple_light"):
+    """Convert invoice details section to MJML."""
+    return _rendered("invoice_details", skin_name)
 
-    return f'''    <mj-section padding="24px">
+
+_RECEIPT_SUMMARY_MJML = '''    <mj-section padding="24px">
       <mj-column>
         <!-- Success checkmark -->
         <mj-text align="center" font-size="32px" background-color="#22c55e20" border-radius="50%" padding="16px" css-class="checkmark-circle">
           ✓
         </mj-text>
-        <mj-text align="center" font-size="24px" color="{skin['brandPrimary']}" font-weight="700" padding="16px 0 8px">
+        <mj-text align="center" font-size="24px" color="{brandPrimary}" font-weight="700" padding="16px 0 8px">
           Payment Successful
         </mj-text>
-        <mj-text align="center" font-size="16px" color="{skin['brandSecondary']}" padding="0 0 24px">
-          Receipt #{{{{receiptNumber}}}}
+        <mj-text align="center" font-size="16px" color="{brandSecondary}" padding="0 0 24px">
+          Receipt #{receiptNumber}
         </mj-text>
       </mj-column>
     </mj-section>
 
     <!-- Amount paid highlight -->
     <mj-section padding="0 24px 24px">
-      <mj-column background-color="{skin['brandAccent']}08" border-radius="12px" padding="24px">
-        <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="0.5px" padding="0 0 8px">
+      <mj-column background-color="{brandAccent}08" border-radius="12px" padding="24px">
+        <mj-text align="center" font-size="14px" color="{brandSecondary}" text-transform="uppercase" letter-spacing="0.5px" padding="0 0 8px">
           Amount Paid
         </mj-text>
-        <mj-text align="center" font-size="36px" color="{skin['brandPrimary']}" font-weight="700" padding="0">
-          {{{{receiptAmount}}}}
+        <mj-text align="center" font-size="36px" color="{brandPrimary}" font-weight="700" padding="0">
+          {receiptAmount}
         </mj-text>
       </mj-column>
     </mj-section>
 
     <!-- Transaction details -->
     <mj-section padding="0 24px 24px">
-      <mj-column border="1px solid {skin['brandSecondary']}20" border-radius="8px">
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px" border-bottom="1px solid {skin['brandSecondary']}10">
+      <mj-column border="1px solid {brandSecondary}20" border-radius="8px">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px" border-bottom="1px solid {brandSecondary}10">
           <span style="display: inline-block; width: 50%;">Transaction ID</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 500;">{{{{receiptTransactionId}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 500;">{receiptTransactionId}</span>
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px" border-bottom="1px solid {skin['brandSecondary']}10">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px" border-bottom="1px solid {brandSecondary}10">
           <span style="display: inline-block; width: 50%;">Date &amp; Time</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 500;">{{{{receiptDateTime}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 500;">{receiptDateTime}</span>
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px" border-bottom="1px solid {skin['brandSecondary']}10">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px" border-bottom="1px solid {brandSecondary}10">
           <span style="display: inline-block; width: 50%;">Payment Method</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 500;">{{{{receiptPaymentMethod}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 500;">{receiptPaymentMethod}</span>
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px">
           <span style="display: inline-block; width: 50%;">Billed To</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 500;">{{{{receiptBilledTo}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 500;">{receiptBilledTo}</span>
         </mj-text>
       </mj-column>
     </mj-section>
@@ -1729,30 +2814,31 @@ def section_to_mjml_receipt_summary(skin_name="apple_light"):
     <!-- Items breakdown -->
     <mj-section padding="0 24px 24px">
       <mj-column>
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="0.5px" font-weight="600" padding="0 0 12px">
+        <mj-text font-size="14px" color="{brandSecondary}" text-transform="uppercase" letter-spacing="0.5px" font-weight="600" padding="0 0 12px">
           Items
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" padding="12px 0" border-bottom="1px solid {skin['brandSecondary']}10">
-          <span style="display: inline-block; width: 70%;">{{{{receiptItem1Name}}}}</span>
-          <span style="display: inline-block; width: 30%; text-align: right;">{{{{receiptItem1Price}}}}</span>
+        <mj-text font-size="14px" color="{brandPrimary}" padding="12px 0" border-bottom="1px solid {brandSecondary}10">
+          <span style="display: inline-block; width: 70%;">{receiptItem1Name}</span>
+          <span style="display: inline-block; width: 30%; text-align: right;">{receiptItem1Price}</span>
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" padding="12px 0" border-bottom="1px solid {skin['brandSecondary']}10">
-          <span style="display: inline-block; width: 70%;">{{{{receiptItem2Name}}}}</span>
-          <span style="display: inline-block; width: 30%; text-align: right;">{{{{receiptItem2Price}}}}</span>
+        <mj-text font-size="14px" color="{brandPrimary}" padding="12px 0" border-bottom="1px solid {brandSecondary}10">
+          <span style="display: inline-block; width: 70%;">{receiptItem2Name}</span>
+          <span style="display: inline-block; width: 30%; text-align: right;">{receiptItem2Price}</span>
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" font-weight="700" padding="12px 0">
+        <mj-text font-size="14px" color="{brandPrimary}" font-weight="700" padding="12px 0">
           <span style="display: inline-block; width: 70%;">Total</span>
-          <span style="display: inline-block; width: 30%; text-align: right; font-size: 16px;">{{{{receiptTotal}}}}</span>
+          <span style="display: inline-block; width: 30%; text-align: right; font-size: 16px;">{receiptTotal}</span>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_delivery_confirmation(skin_name="apple_light"):
-    """Convert delivery confirmation section to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_receipt_summary(skin_name="apple_light"):
+    """Convert receipt summary section to MJML."""
+    return _rendered("receipt_summary", skin_name)
+
 
-    return f'''    <mj-section padding="24px">
+_DELIVERY_CONFIRMATION_MJML = '''    <mj-section padding="24px">
       <mj-column background-color="#22c55e10" border-radius="12px" padding="32px 24px">
         <mj-text align="center" font-size="48px" padding="0 0 16px">
           📦
@@ -1760,7 +2846,7 @@ def section_to_mjml_delivery_confirmation(skin_name="apple_light"):
         <mj-text align="center" font-size="24px" color="#22c55e" font-weight="700" padding="0 0 8px">
           Delivered!
         </mj-text>
-        <mj-text align="center" font-size="16px" color="{skin['brandSecondary']}" padding="0">
+        <mj-text align="center" font-size="16px" color="{brandSecondary}" padding="0">
           Your package has arrived
         </mj-text>
       </mj-column>
@@ -1768,33 +2854,33 @@ def section_to_mjml_delivery_confirmation(skin_name="apple_light"):
 
     <!-- Delivery details card -->
     <mj-section padding="0 24px 24px">
-      <mj-column border="1px solid {skin['brandSecondary']}20" border-radius="12px">
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" font-weight="600" text-transform="uppercase" letter-spacing="0.5px" background-color="{skin['brandSecondary']}05" padding="16px 20px">
+      <mj-column border="1px solid {brandSecondary}20" border-radius="12px">
+        <mj-text font-size="14px" color="{brandSecondary}" font-weight="600" text-transform="uppercase" letter-spacing="0.5px" background-color="{brandSecondary}05" padding="16px 20px">
           Delivery Details
         </mj-text>
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" padding="20px 20px 4px">
+        <mj-text font-size="12px" color="{brandSecondary}" text-transform="uppercase" padding="20px 20px 4px">
           Delivered To
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" font-weight="500" padding="0 20px 16px">
-          {{{{deliveryAddress}}}}
+        <mj-text font-size="14px" color="{brandPrimary}" font-weight="500" padding="0 20px 16px">
+          {deliveryAddress}
         </mj-text>
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" padding="0 20px 4px">
+        <mj-text font-size="12px" color="{brandSecondary}" text-transform="uppercase" padding="0 20px 4px">
           Delivery Date &amp; Time
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" font-weight="500" padding="0 20px 16px">
-          {{{{deliveryDateTime}}}}
+        <mj-text font-size="14px" color="{brandPrimary}" font-weight="500" padding="0 20px 16px">
+          {deliveryDateTime}
         </mj-text>
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" padding="0 20px 4px">
+        <mj-text font-size="12px" color="{brandSecondary}" text-transform="uppercase" padding="0 20px 4px">
           Signed By
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" font-weight="500" padding="0 20px 16px">
-          {{{{deliverySignedBy}}}}
+        <mj-text font-size="14px" color="{brandPrimary}" font-weight="500" padding="0 20px 16px">
+          {deliverySignedBy}
         </mj-text>
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" padding="0 20px 4px">
+        <mj-text font-size="12px" color="{brandSecondary}" text-transform="uppercase" padding="0 20px 4px">
           Tracking Number
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandAccent']}" font-weight="500" padding="0 20px 20px">
-          {{{{deliveryTrackingNumber}}}}
+        <mj-text font-size="14px" color="{brandAccent}" font-weight="500" padding="0 20px 20px">
+          {deliveryTrackingNumber}
         </mj-text>
       </mj-column>
     </mj-section>
@@ -1802,44 +2888,45 @@ def section_to_mjml_delivery_confirmation(skin_name="apple_light"):
     <!-- Delivery photo placeholder -->
     <mj-section padding="0 24px 24px">
       <mj-column>
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" font-weight="600" text-transform="uppercase" letter-spacing="0.5px" padding="0 0 12px">
+        <mj-text font-size="14px" color="{brandSecondary}" font-weight="600" text-transform="uppercase" letter-spacing="0.5px" padding="0 0 12px">
           Proof of Delivery
         </mj-text>
-        <mj-image src="{IMAGE_PLACEHOLDERS['product']}" alt="Delivery photo" width="300px" border-radius="8px" />
+        <mj-image src="{img_product}" alt="Delivery photo" width="300px" border-radius="8px" />
       </mj-column>
     </mj-section>
 
     <!-- Order summary -->
     <mj-section padding="0 24px 24px">
-      <mj-column border="1px solid {skin['brandSecondary']}20" border-radius="8px">
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" font-weight="600" text-transform="uppercase" letter-spacing="0.5px" background-color="{skin['brandSecondary']}05" padding="12px 16px">
+      <mj-column border="1px solid {brandSecondary}20" border-radius="8px">
+        <mj-text font-size="14px" color="{brandSecondary}" font-weight="600" text-transform="uppercase" letter-spacing="0.5px" background-color="{brandSecondary}05" padding="12px 16px">
           Order Summary
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px">
           <span style="display: inline-block; width: 50%;">Order Number</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 500;">{{{{deliveryOrderNumber}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 500;">{deliveryOrderNumber}</span>
         </mj-text>
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="0 16px 16px">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="0 16px 16px">
           <span style="display: inline-block; width: 50%;">Items Delivered</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 500;">{{{{deliveryItemCount}}}} item(s)</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 500;">{deliveryItemCount} item(s)</span>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_appointment_reminder(skin_name="apple_light"):
-    """Convert appointment reminder to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_delivery_confirmation(skin_name="apple_light"):
+    """Convert delivery confirmation section to MJML."""
+    return _rendered("delivery_confirmation", skin_name)
 
-    return f'''    <!-- Appointment reminder header -->
-    <mj-section padding="24px" background-color="{skin['brandAccent']}10" border-radius="12px">
+
+_APPOINTMENT_REMINDER_MJML = '''    <!-- Appointment reminder header -->
+    <mj-section padding="24px" background-color="{brandAccent}10" border-radius="12px">
       <mj-column>
-        <mj-image src="{IMAGE_PLACEHOLDERS['icon']}" alt="Calendar" width="64px" padding="0 0 16px" />
-        <mj-text align="center" font-size="24px" color="{skin['brandPrimary']}" font-weight="700" padding="0 0 8px">
-          {{{{appointmentTitle}}}}
+        <mj-image src="{img_icon}" alt="Calendar" width="64px" padding="0 0 16px" />
+        <mj-text align="center" font-size="24px" color="{brandPrimary}" font-weight="700" padding="0 0 8px">
+          {appointmentTitle}
         </mj-text>
-        <mj-text align="center" font-size="16px" color="{skin['brandSecondary']}" padding="0 0 24px">
-          {{{{appointmentMessage}}}}
+        <mj-text align="center" font-size="16px" color="{brandSecondary}" padding="0 0 24px">
+          {appointmentMessage}
         </mj-text>
       </mj-column>
     </mj-section>
@@ -1847,25 +2934,25 @@ def section_to_mjml_appointment_reminder(skin_name="apple_light"):
     <!-- Appointment details card -->
     <mj-section padding="0 24px 24px">
       <mj-column background-color="#ffffff" border-radius="8px" padding="0">
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="0.5px" padding="20px 20px 4px">
+        <mj-text font-size="12px" color="{brandSecondary}" text-transform="uppercase" letter-spacing="0.5px" padding="20px 20px 4px">
           📅 Date
         </mj-text>
-        <mj-text font-size="18px" color="{skin['brandPrimary']}" font-weight="600" padding="0 20px 16px">
-          {{{{appointmentDate}}}}
+        <mj-text font-size="18px" color="{brandPrimary}" font-weight="600" padding="0 20px 16px">
+          {appointmentDate}
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}15" padding="0 20px" />
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="0.5px" padding="16px 20px 4px">
+        <mj-divider border-color="{brandSecondary}15" padding="0 20px" />
+        <mj-text font-size="12px" color="{brandSecondary}" text-transform="uppercase" letter-spacing="0.5px" padding="16px 20px 4px">
           ⏰ Time
         </mj-text>
-        <mj-text font-size="18px" color="{skin['brandPrimary']}" font-weight="600" padding="0 20px 16px">
-          {{{{appointmentTime}}}}
+        <mj-text font-size="18px" color="{brandPrimary}" font-weight="600" padding="0 20px 16px">
+          {appointmentTime}
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}15" padding="0 20px" />
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="0.5px" padding="16px 20px 4px">
+        <mj-divider border-color="{brandSecondary}15" padding="0 20px" />
+        <mj-text font-size="12px" color="{brandSecondary}" text-transform="uppercase" letter-spacing="0.5px" padding="16px 20px 4px">
           📍 Location
         </mj-text>
-        <mj-text font-size="16px" color="{skin['brandPrimary']}" padding="0 20px 20px">
-          {{{{appointmentLocation}}}}
+        <mj-text font-size="16px" color="{brandPrimary}" padding="0 20px 20px">
+          {appointmentLocation}
         </mj-text>
       </mj-column>
     </mj-section>
@@ -1873,28 +2960,29 @@ def section_to_mjml_appointment_reminder(skin_name="apple_light"):
     <!-- Action buttons -->
     <mj-section padding="0 24px 24px">
       <mj-column>
-        <mj-button href="{{{{addToCalendarUrl}}}}" background-color="{skin['brandAccent']}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 28px">
+        <mj-button href="{addToCalendarUrl}" background-color="{brandAccent}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 28px">
           Add to Calendar
         </mj-button>
-        <mj-button href="{{{{rescheduleUrl}}}}" background-color="transparent" color="{skin['brandAccent']}" font-size="14px" font-weight="600" border-radius="8px" border="2px solid {skin['brandAccent']}" inner-padding="12px 26px">
+        <mj-button href="{rescheduleUrl}" background-color="transparent" color="{brandAccent}" font-size="14px" font-weight="600" border-radius="8px" border="2px solid {brandAccent}" inner-padding="12px 26px">
           Reschedule
         </mj-button>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_two_factor_code(skin_name="apple_light"):
-    """Convert two-factor authentication code to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_appointment_reminder(skin_name="apple_light"):
+    """Convert appointment reminder to MJML."""
+    return _rendered("appointment_reminder", skin_name)
+
 
-    return f'''    <!-- 2FA header -->
-    <mj-section padding="24px" background-color="{skin['brandSecondary']}05">
+_TWO_FACTOR_CODE_MJML = '''    <!-- 2FA header -->
+    <mj-section padding="24px" background-color="{brandSecondary}05">
       <mj-column>
-        <mj-image src="{IMAGE_PLACEHOLDERS['icon']}" alt="Security Shield" width="80px" padding="0 0 20px" css-class="security-badge" />
-        <mj-text align="center" font-size="22px" color="{skin['brandPrimary']}" font-weight="700" padding="0 0 8px">
+        <mj-image src="{img_icon}" alt="Security Shield" width="80px" padding="0 0 20px" css-class="security-badge" />
+        <mj-text align="center" font-size="22px" color="{brandPrimary}" font-weight="700" padding="0 0 8px">
           Two-Factor Authentication
         </mj-text>
-        <mj-text align="center" font-size="15px" color="{skin['brandSecondary']}" padding="0 0 24px">
+        <mj-text align="center" font-size="15px" color="{brandSecondary}" padding="0 0 24px">
           Enter this code to verify your identity
         </mj-text>
       </mj-column>
@@ -1903,8 +2991,8 @@ def section_to_mjml_two_factor_code(skin_name="apple_light"):
     <!-- 2FA Code Display -->
     <mj-section padding="0 24px 24px">
       <mj-column>
-        <mj-text align="center" background-color="#ffffff" border="2px solid {skin['brandPrimary']}" border-radius="12px" padding="24px 48px">
-          <p style="font-family: 'SF Mono', 'Monaco', 'Consolas', monospace; font-size: 42px; color: {skin['brandPrimary']}; margin: 0; font-weight: 700; letter-spacing: 12px;">{{{{twoFactorCode}}}}</p>
+        <mj-text align="center" background-color="#ffffff" border="2px solid {brandPrimary}" border-radius="12px" padding="24px 48px">
+          <p style="font-family: 'SF Mono', 'Monaco', 'Consolas', monospace; font-size: 42px; color: {brandPrimary}; margin: 0; font-weight: 700; letter-spacing: 12px;">{twoFactorCode}</p>
         </mj-text>
       </mj-column>
     </mj-section>
@@ -1913,7 +3001,7 @@ def section_to_mjml_two_factor_code(skin_name="apple_light"):
     <mj-section padding="0 24px 24px">
       <mj-column>
         <mj-text align="center" background-color="#f59e0b15" border-radius="8px" padding="12px 20px" font-size="13px" color="#f59e0b" font-weight="600">
-          ⏱ Code expires in {{{{twoFactorExpiry}}}}
+          ⏱ Code expires in {twoFactorExpiry}
         </mj-text>
       </mj-column>
     </mj-section>
@@ -1921,22 +3009,23 @@ def section_to_mjml_two_factor_code(skin_name="apple_light"):
     <!-- Security notice -->
     <mj-section padding="0 24px 24px">
       <mj-column>
-        <mj-divider border-color="{skin['brandSecondary']}15" padding="0 0 24px" />
-        <mj-text align="center" font-size="13px" color="{skin['brandSecondary']}" padding="0 0 4px">
+        <mj-divider border-color="{brandSecondary}15" padding="0 0 24px" />
+        <mj-text align="center" font-size="13px" color="{brandSecondary}" padding="0 0 4px">
           🔒 If you didn't request this code, please ignore this email.
         </mj-text>
-        <mj-text align="center" font-size="13px" color="{skin['brandSecondary']}" padding="0">
+        <mj-text align="center" font-size="13px" color="{brandSecondary}" padding="0">
           Never share this code with anyone.
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_account_suspended(skin_name="apple_light"):
-    """Convert account suspended notification to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_two_factor_code(skin_name="apple_light"):
+    """Convert two-factor authentication code to MJML."""
+    return _rendered("two_factor_code", skin_name)
 
-    return f'''    <!-- Account suspended header -->
+
+_ACCOUNT_SUSPENDED_MJML = '''    <!-- Account suspended header -->
     <mj-section padding="24px" background-color="#ef444415" border-radius="12px">
       <mj-column>
         <mj-text align="center" font-size="48px" padding="0 0 16px">
@@ -1945,7 +3034,7 @@ def section_to_mjml_account_suspended(skin_name="apple_light"):
         <mj-text align="center" font-size="24px" color="#ef4444" font-weight="700" padding="0 0 8px">
           Account Suspended
         </mj-text>
-        <mj-text align="center" font-size="15px" color="{skin['brandSecondary']}" padding="0 0 24px">
+        <mj-text align="center" font-size="15px" color="{brandSecondary}" padding="0 0 24px">
           Your account has been temporarily suspended
         </mj-text>
       </mj-column>
@@ -1954,11 +3043,11 @@ def section_to_mjml_account_suspended(skin_name="apple_light"):
     <!-- Reason box -->
     <mj-section padding="0 24px 16px">
       <mj-column background-color="#ffffff" border-radius="8px" padding="20px">
-        <mj-text font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" letter-spacing="0.5px" font-weight="600" padding="0 0 8px">
+        <mj-text font-size="12px" color="{brandSecondary}" text-transform="uppercase" letter-spacing="0.5px" font-weight="600" padding="0 0 8px">
           Reason for Suspension
         </mj-text>
-        <mj-text font-size="15px" color="{skin['brandPrimary']}" line-height="1.6" padding="0">
-          {{{{suspensionReason}}}}
+        <mj-text font-size="15px" color="{brandPrimary}" line-height="1.6" padding="0">
+          {suspensionReason}
         </mj-text>
       </mj-column>
     </mj-section>
@@ -1966,14 +3055,14 @@ def section_to_mjml_account_suspended(skin_name="apple_light"):
     <!-- Account details -->
     <mj-section padding="0 24px 24px">
       <mj-column background-color="#ffffff" border-radius="8px" padding="0">
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Account</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 500;">{{{{suspendedEmail}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 500;">{suspendedEmail}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Suspended on</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 500;">{{{{suspensionDate}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 500;">{suspensionDate}</span>
         </mj-text>
       </mj-column>
     </mj-section>
@@ -1981,21 +3070,22 @@ def section_to_mjml_account_suspended(skin_name="apple_light"):
     <!-- Action buttons -->
     <mj-section padding="0 24px 24px">
       <mj-column>
-        <mj-button href="{{{{appealUrl}}}}" background-color="{skin['brandPrimary']}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
+        <mj-button href="{appealUrl}" background-color="{brandPrimary}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
           Appeal This Decision
         </mj-button>
         <mj-text align="center" padding="16px 0 0">
-          <a href="{{{{policyUrl}}}}" style="font-family: {skin['brandFont']}; font-size: 13px; color: {skin['brandSecondary']}; text-decoration: underline;">Review our Terms of Service</a>
+          <a href="{policyUrl}" style="font-family: {brandFont}; font-size: 13px; color: {brandSecondary}; text-decoration: underline;">Review our Terms of Service</a>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_payment_failed(skin_name="apple_light"):
-    """Convert payment failed notification to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_account_suspended(skin_name="apple_light"):
+    """Convert account suspended notification to MJML."""
+    return _rendered("account_suspended", skin_name)
+
 
-    return f'''    <!-- Payment failed header -->
+_PAYMENT_FAILED_MJML = '''    <!-- Payment failed header -->
     <mj-section padding="24px" background-color="#f59e0b10" border-radius="12px">
       <mj-column>
         <mj-text align="center" font-size="48px" padding="0 0 16px">
@@ -2004,7 +3094,7 @@ def section_to_mjml_payment_failed(skin_name="apple_light"):
         <mj-text align="center" font-size="24px" color="#f59e0b" font-weight="700" padding="0 0 8px">
           Payment Failed
         </mj-text>
-        <mj-text align="center" font-size="15px" color="{skin['brandSecondary']}" padding="0 0 24px">
+        <mj-text align="center" font-size="15px" color="{brandSecondary}" padding="0 0 24px">
           We couldn't process your payment
         </mj-text>
       </mj-column>
@@ -2013,36 +3103,36 @@ def section_to_mjml_payment_failed(skin_name="apple_light"):
     <!-- Payment details -->
     <mj-section padding="0 24px 16px">
       <mj-column background-color="#ffffff" border-radius="8px" padding="0">
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Amount</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-size: 16px; font-weight: 600;">{{{{failedAmount}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-size: 16px; font-weight: 600;">{failedAmount}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Card ending in</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 500;">•••• {{{{cardLastFour}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 500;">•••• {cardLastFour}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Attempted on</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']};">{{{{paymentDate}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary};">{paymentDate}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Reason</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: #ef4444; font-weight: 500;">{{{{failureReason}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: #ef4444; font-weight: 500;">{failureReason}</span>
         </mj-text>
       </mj-column>
     </mj-section>
 
     <!-- What happens next -->
     <mj-section padding="0 24px 24px">
-      <mj-column background-color="{skin['brandSecondary']}05" border-radius="8px" padding="16px 20px">
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" font-weight="600" padding="0 0 4px">
+      <mj-column background-color="{brandSecondary}05" border-radius="8px" padding="16px 20px">
+        <mj-text font-size="13px" color="{brandSecondary}" font-weight="600" padding="0 0 4px">
           What happens next?
         </mj-text>
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" line-height="1.5" padding="0">
-          We'll automatically retry in {{{{retryDays}}}} days. To avoid service interruption, please update your payment method.
+        <mj-text font-size="13px" color="{brandSecondary}" line-height="1.5" padding="0">
+          We'll automatically retry in {retryDays} days. To avoid service interruption, please update your payment method.
         </mj-text>
       </mj-column>
     </mj-section>
@@ -2050,21 +3140,22 @@ def section_to_mjml_payment_failed(skin_name="apple_light"):
     <!-- Action buttons -->
     <mj-section padding="0 24px 24px">
       <mj-column>
-        <mj-button href="{{{{updatePaymentUrl}}}}" background-color="{skin['brandAccent']}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
+        <mj-button href="{updatePaymentUrl}" background-color="{brandAccent}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
           Update Payment Method
         </mj-button>
-        <mj-button href="{{{{retryPaymentUrl}}}}" background-color="transparent" color="{skin['brandAccent']}" font-size="14px" font-weight="600" border-radius="8px" border="2px solid {skin['brandAccent']}" inner-padding="12px 26px">
+        <mj-button href="{retryPaymentUrl}" background-color="transparent" color="{brandAccent}" font-size="14px" font-weight="600" border-radius="8px" border="2px solid {brandAccent}" inner-padding="12px 26px">
           Retry Payment
         </mj-button>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_order_hold(skin_name="apple_light"):
-    """Convert order hold notification to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_payment_failed(skin_name="apple_light"):
+    """Convert payment failed notification to MJML."""
+    return _rendered("payment_failed", skin_name)
 
-    return f'''    <!-- Order hold header -->
+
+_ORDER_HOLD_MJML = '''    <!-- Order hold header -->
     <mj-section padding="24px" background-color="#fbbf2410" border-radius="12px">
       <mj-column>
         <mj-text align="center" font-size="48px" padding="0 0 16px">
@@ -2073,7 +3164,7 @@ def section_to_mjml_order_hold(skin_name="apple_light"):
         <mj-text align="center" font-size="24px" color="#fbbf24" font-weight="700" padding="0 0 8px">
           Order On Hold
         </mj-text>
-        <mj-text align="center" font-size="15px" color="{skin['brandSecondary']}" padding="0 0 24px">
+        <mj-text align="center" font-size="15px" color="{brandSecondary}" padding="0 0 24px">
           We need a bit more information to process your order
         </mj-text>
       </mj-column>
@@ -2082,31 +3173,31 @@ def section_to_mjml_order_hold(skin_name="apple_light"):
     <!-- Order details -->
     <mj-section padding="0 24px 16px">
       <mj-column background-color="#ffffff" border-radius="8px" padding="0">
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Order Number</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 600;">{{{{orderNumber}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 600;">{orderNumber}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Order Date</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']};">{{{{orderDate}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary};">{orderDate}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Hold Reason</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: #fbbf24; font-weight: 500;">{{{{holdReason}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: #fbbf24; font-weight: 500;">{holdReason}</span>
         </mj-text>
       </mj-column>
     </mj-section>
 
     <!-- Action required -->
     <mj-section padding="0 24px 16px">
-      <mj-column background-color="{skin['brandSecondary']}05" border-radius="8px" padding="16px 20px">
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" font-weight="600" padding="0 0 8px">
+      <mj-column background-color="{brandSecondary}05" border-radius="8px" padding="16px 20px">
+        <mj-text font-size="13px" color="{brandSecondary}" font-weight="600" padding="0 0 8px">
           Action Required
         </mj-text>
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" line-height="1.5" padding="0">
-          {{{{holdActionRequired}}}}
+        <mj-text font-size="13px" color="{brandSecondary}" line-height="1.5" padding="0">
+          {holdActionRequired}
         </mj-text>
       </mj-column>
     </mj-section>
@@ -2115,7 +3206,7 @@ def section_to_mjml_order_hold(skin_name="apple_light"):
     <mj-section padding="0 24px 16px">
       <mj-column>
         <mj-text align="center" font-size="13px" color="#ef4444">
-          ⚠️ Please respond by {{{{holdDeadline}}}} to avoid cancellation
+          ⚠️ Please respond by {holdDeadline} to avoid cancellation
         </mj-text>
       </mj-column>
     </mj-section>
@@ -2123,30 +3214,31 @@ def section_to_mjml_order_hold(skin_name="apple_light"):
     <!-- Action buttons -->
     <mj-section padding="0 24px 24px">
       <mj-column>
-        <mj-button href="{{{{resolveHoldUrl}}}}" background-color="{skin['brandAccent']}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
+        <mj-button href="{resolveHoldUrl}" background-color="{brandAccent}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
           Resolve Now
         </mj-button>
         <mj-text align="center" padding="16px 0 0">
-          <a href="{{{{cancelOrderUrl}}}}" style="font-family: {skin['brandFont']}; font-size: 13px; color: {skin['brandSecondary']}; text-decoration: underline;">Cancel this order</a>
+          <a href="{cancelOrderUrl}" style="font-family: {brandFont}; font-size: 13px; color: {brandSecondary}; text-decoration: underline;">Cancel this order</a>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_subscription_paused(skin_name="apple_light"):
-    """Convert subscription paused notification to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_order_hold(skin_name="apple_light"):
+    """Convert order hold notification to MJML."""
+    return _rendered("order_hold", skin_name)
+
 
-    return f'''    <!-- Subscription paused header -->
-    <mj-section padding="24px" background-color="{skin['brandSecondary']}08" border-radius="12px">
+_SUBSCRIPTION_PAUSED_MJML = '''    <!-- Subscription paused header -->
+    <mj-section padding="24px" background-color="{brandSecondary}08" border-radius="12px">
       <mj-column>
         <mj-text align="center" font-size="48px" padding="0 0 16px">
           ⏸️
         </mj-text>
-        <mj-text align="center" font-size="24px" color="{skin['brandPrimary']}" font-weight="700" padding="0 0 8px">
+        <mj-text align="center" font-size="24px" color="{brandPrimary}" font-weight="700" padding="0 0 8px">
           Subscription Paused
         </mj-text>
-        <mj-text align="center" font-size="15px" color="{skin['brandSecondary']}" padding="0 0 24px">
+        <mj-text align="center" font-size="15px" color="{brandSecondary}" padding="0 0 24px">
           Your subscription has been paused as requested
         </mj-text>
       </mj-column>
@@ -2155,25 +3247,25 @@ def section_to_mjml_subscription_paused(skin_name="apple_light"):
     <!-- Subscription details -->
     <mj-section padding="0 24px 16px">
       <mj-column background-color="#ffffff" border-radius="8px" padding="0">
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Plan</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 600;">{{{{subscriptionPlan}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 600;">{subscriptionPlan}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Paused on</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']};">{{{{pauseDate}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary};">{pauseDate}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Resume date</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']};">{{{{resumeDate}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary};">{resumeDate}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Status</span>
           <span style="display: inline-block; width: 50%; text-align: right;">
-            <span style="padding: 4px 12px; background-color: {skin['brandSecondary']}15; border-radius: 12px; font-size: 12px; color: {skin['brandSecondary']}; font-weight: 600;">PAUSED</span>
+            <span style="padding: 4px 12px; background-color: {brandSecondary}15; border-radius: 12px; font-size: 12px; color: {brandSecondary}; font-weight: 600;">PAUSED</span>
           </span>
         </mj-text>
       </mj-column>
@@ -2181,14 +3273,14 @@ def section_to_mjml_subscription_paused(skin_name="apple_light"):
 
     <!-- What you'll miss -->
     <mj-section padding="0 24px 24px">
-      <mj-column background-color="#ffffff" border-radius="8px" border="1px dashed {skin['brandSecondary']}30" padding="16px 20px">
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" font-weight="600" padding="0 0 8px">
+      <mj-column background-color="#ffffff" border-radius="8px" border="1px dashed {brandSecondary}30" padding="16px 20px">
+        <mj-text font-size="13px" color="{brandSecondary}" font-weight="600" padding="0 0 8px">
           While paused, you won't have access to:
         </mj-text>
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" line-height="1.8" padding="0">
-          • {{{{pausedFeature1}}}}<br/>
-          • {{{{pausedFeature2}}}}<br/>
-          • {{{{pausedFeature3}}}}
+        <mj-text font-size="13px" color="{brandSecondary}" line-height="1.8" padding="0">
+          • {pausedFeature1}<br/>
+          • {pausedFeature2}<br/>
+          • {pausedFeature3}
         </mj-text>
       </mj-column>
     </mj-section>
@@ -2196,21 +3288,22 @@ def section_to_mjml_subscription_paused(skin_name="apple_light"):
     <!-- Action buttons -->
     <mj-section padding="0 24px 24px">
       <mj-column>
-        <mj-button href="{{{{resumeNowUrl}}}}" background-color="{skin['brandAccent']}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
+        <mj-button href="{resumeNowUrl}" background-color="{brandAccent}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
           Resume Subscription
         </mj-button>
         <mj-text align="center" padding="16px 0 0">
-          <a href="{{{{manageSubscriptionUrl}}}}" style="font-family: {skin['brandFont']}; font-size: 13px; color: {skin['brandSecondary']}; text-decoration: underline;">Manage subscription settings</a>
+          <a href="{manageSubscriptionUrl}" style="font-family: {brandFont}; font-size: 13px; color: {brandSecondary}; text-decoration: underline;">Manage subscription settings</a>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_referral_success(skin_name="apple_light"):
-    """Convert referral success notification to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_subscription_paused(skin_name="apple_light"):
+    """Convert subscription paused notification to MJML."""
+    return _rendered("subscription_paused", skin_name)
 
-    return f'''    <!-- Referral success header -->
+
+_REFERRAL_SUCCESS_MJML = '''    <!-- Referral success header -->
     <mj-section padding="24px" background-color="#10b98110" border-radius="12px">
       <mj-column>
         <mj-text align="center" font-size="56px" padding="0 0 16px">
@@ -2219,8 +3312,8 @@ def section_to_mjml_referral_success(skin_name="apple_light"):
         <mj-text align="center" font-size="28px" color="#10b981" font-weight="700" padding="0 0 8px">
           Referral Successful!
         </mj-text>
-        <mj-text align="center" font-size="16px" color="{skin['brandSecondary']}" padding="0 0 24px">
-          {{{{referredFriendName}}}} has joined thanks to you
+        <mj-text align="center" font-size="16px" color="{brandSecondary}" padding="0 0 24px">
+          {referredFriendName} has joined thanks to you
         </mj-text>
       </mj-column>
     </mj-section>
@@ -2237,11 +3330,11 @@ def section_to_mjml_referral_success(skin_name="apple_light"):
         </mj-section>
         <mj-section padding="24px">
           <mj-column>
-            <mj-text align="center" font-size="48px" color="{skin['brandPrimary']}" font-weight="700" padding="0">
-              {{{{referralReward}}}}
+            <mj-text align="center" font-size="48px" color="{brandPrimary}" font-weight="700" padding="0">
+              {referralReward}
             </mj-text>
-            <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" padding="8px 0 0">
-              {{{{referralRewardType}}}}
+            <mj-text align="center" font-size="14px" color="{brandSecondary}" padding="8px 0 0">
+              {referralRewardType}
             </mj-text>
           </mj-column>
         </mj-section>
@@ -2251,18 +3344,18 @@ def section_to_mjml_referral_success(skin_name="apple_light"):
     <!-- Stats -->
     <mj-section padding="0 24px 16px">
       <mj-column width="50%" background-color="#ffffff" border-radius="8px 0 0 8px" padding="20px">
-        <mj-text align="center" font-size="32px" color="{skin['brandPrimary']}" font-weight="700" padding="0">
-          {{{{totalReferrals}}}}
+        <mj-text align="center" font-size="32px" color="{brandPrimary}" font-weight="700" padding="0">
+          {totalReferrals}
         </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" padding="4px 0 0">
+        <mj-text align="center" font-size="12px" color="{brandSecondary}" text-transform="uppercase" padding="4px 0 0">
           Total Referrals
         </mj-text>
       </mj-column>
-      <mj-column width="50%" background-color="#ffffff" border-radius="0 8px 8px 0" padding="20px" border-left="1px solid {skin['brandSecondary']}10">
+      <mj-column width="50%" background-color="#ffffff" border-radius="0 8px 8px 0" padding="20px" border-left="1px solid {brandSecondary}10">
         <mj-text align="center" font-size="32px" color="#10b981" font-weight="700" padding="0">
-          {{{{totalEarned}}}}
+          {totalEarned}
         </mj-text>
-        <mj-text align="center" font-size="12px" color="{skin['brandSecondary']}" text-transform="uppercase" padding="4px 0 0">
+        <mj-text align="center" font-size="12px" color="{brandSecondary}" text-transform="uppercase" padding="4px 0 0">
           Total Earned
         </mj-text>
       </mj-column>
@@ -2270,21 +3363,21 @@ def section_to_mjml_referral_success(skin_name="apple_light"):
 
     <!-- Keep referring -->
     <mj-section padding="0 24px 16px">
-      <mj-column background-color="{skin['brandSecondary']}05" border-radius="8px" padding="16px 20px">
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" font-weight="600" padding="0 0 4px">
+      <mj-column background-color="{brandSecondary}05" border-radius="8px" padding="16px 20px">
+        <mj-text font-size="14px" color="{brandPrimary}" font-weight="600" padding="0 0 4px">
           Keep the referrals coming!
         </mj-text>
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" line-height="1.5" padding="0">
-          Share your unique link and earn {{{{referralRewardPerReferral}}}} for each friend who signs up.
+        <mj-text font-size="13px" color="{brandSecondary}" line-height="1.5" padding="0">
+          Share your unique link and earn {referralRewardPerReferral} for each friend who signs up.
         </mj-text>
       </mj-column>
     </mj-section>
 
     <!-- Share link -->
     <mj-section padding="0 24px 24px">
-      <mj-column background-color="#ffffff" border-radius="8px" border="1px solid {skin['brandSecondary']}20" padding="12px 16px">
-        <mj-text font-family="monospace" font-size="13px" color="{skin['brandAccent']}" word-break="break-all">
-          {{{{referralLink}}}}
+      <mj-column background-color="#ffffff" border-radius="8px" border="1px solid {brandSecondary}20" padding="12px 16px">
+        <mj-text font-family="monospace" font-size="13px" color="{brandAccent}" word-break="break-all">
+          {referralLink}
         </mj-text>
       </mj-column>
     </mj-section>
@@ -2292,21 +3385,22 @@ def section_to_mjml_referral_success(skin_name="apple_light"):
     <!-- Action buttons -->
     <mj-section padding="0 24px 24px">
       <mj-column>
-        <mj-button href="{{{{shareReferralUrl}}}}" background-color="{skin['brandAccent']}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
+        <mj-button href="{shareReferralUrl}" background-color="{brandAccent}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
           Share With More Friends
         </mj-button>
         <mj-text align="center" padding="16px 0 0">
-          <a href="{{{{viewRewardsUrl}}}}" style="font-family: {skin['brandFont']}; font-size: 13px; color: {skin['brandSecondary']}; text-decoration: underline;">View all rewards</a>
+          <a href="{viewRewardsUrl}" style="font-family: {brandFont}; font-size: 13px; color: {brandSecondary}; text-decoration: underline;">View all rewards</a>
         </mj-text>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_order_returned(skin_name="apple_light"):
-    """Convert order returned notification to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_referral_success(skin_name="apple_light"):
+    """Convert referral success notification to MJML."""
+    return _rendered("referral_success", skin_name)
+
 
-    return f'''    <!-- Order returned header -->
+_ORDER_RETURNED_MJML = '''    <!-- Order returned header -->
     <mj-section padding="24px" background-color="#10b98110" border-radius="12px">
       <mj-column>
         <mj-text align="center" font-size="48px" padding="0 0 16px">
@@ -2315,7 +3409,7 @@ def section_to_mjml_order_returned(skin_name="apple_light"):
         <mj-text align="center" font-size="24px" color="#10b981" font-weight="700" padding="0 0 8px">
           Return Received
         </mj-text>
-        <mj-text align="center" font-size="15px" color="{skin['brandSecondary']}" padding="0 0 24px">
+        <mj-text align="center" font-size="15px" color="{brandSecondary}" padding="0 0 24px">
           We've received your return and are processing your refund
         </mj-text>
       </mj-column>
@@ -2324,41 +3418,41 @@ def section_to_mjml_order_returned(skin_name="apple_light"):
     <!-- Return details -->
     <mj-section padding="0 24px 16px">
       <mj-column background-color="#ffffff" border-radius="8px" padding="0">
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Order number</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 600;">{{{{orderNumber}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 600;">{orderNumber}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Return ID</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']};">{{{{returnId}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary};">{returnId}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Item returned</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']};">{{{{returnedItemName}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary};">{returnedItemName}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Refund amount</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: #10b981; font-weight: 600;">{{{{refundAmount}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: #10b981; font-weight: 600;">{refundAmount}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Refund method</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']};">{{{{refundMethod}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary};">{refundMethod}</span>
         </mj-text>
       </mj-column>
     </mj-section>
 
     <!-- Timeline info -->
     <mj-section padding="0 24px 16px">
-      <mj-column background-color="{skin['brandSecondary']}05" border-radius="8px" padding="16px 20px">
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" font-weight="600" padding="0 0 4px">
+      <mj-column background-color="{brandSecondary}05" border-radius="8px" padding="16px 20px">
+        <mj-text font-size="13px" color="{brandSecondary}" font-weight="600" padding="0 0 4px">
           When will I get my refund?
         </mj-text>
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" line-height="1.5" padding="0">
-          Your refund will be processed within {{{{refundDays}}}} business days. You'll receive a confirmation email once it's complete.
+        <mj-text font-size="13px" color="{brandSecondary}" line-height="1.5" padding="0">
+          Your refund will be processed within {refundDays} business days. You'll receive a confirmation email once it's complete.
         </mj-text>
       </mj-column>
     </mj-section>
@@ -2366,18 +3460,19 @@ def section_to_mjml_order_returned(skin_name="apple_light"):
     <!-- Action button -->
     <mj-section padding="0 24px 24px">
       <mj-column>
-        <mj-button href="{{{{returnDetailsUrl}}}}" background-color="{skin['brandAccent']}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
+        <mj-button href="{returnDetailsUrl}" background-color="{brandAccent}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
           View Return Details
         </mj-button>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_account_reactivated(skin_name="apple_light"):
-    """Convert account reactivated notification to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_order_returned(skin_name="apple_light"):
+    """Convert order returned notification to MJML."""
+    return _rendered("order_returned", skin_name)
 
-    return f'''    <!-- Account reactivated header -->
+
+_ACCOUNT_REACTIVATED_MJML = '''    <!-- Account reactivated header -->
     <mj-section padding="24px" background-color="#6366f110" border-radius="12px">
       <mj-column>
         <mj-text align="center" font-size="48px" padding="0 0 16px">
@@ -2386,7 +3481,7 @@ def section_to_mjml_account_reactivated(skin_name="apple_light"):
         <mj-text align="center" font-size="24px" color="#6366f1" font-weight="700" padding="0 0 8px">
           Welcome Back!
         </mj-text>
-        <mj-text align="center" font-size="15px" color="{skin['brandSecondary']}" padding="0 0 24px">
+        <mj-text align="center" font-size="15px" color="{brandSecondary}" padding="0 0 24px">
           Your account has been successfully reactivated
         </mj-text>
       </mj-column>
@@ -2395,36 +3490,36 @@ def section_to_mjml_account_reactivated(skin_name="apple_light"):
     <!-- Account details -->
     <mj-section padding="0 24px 16px">
       <mj-column background-color="#ffffff" border-radius="8px" padding="0">
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Account</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 600;">{{{{userEmail}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 600;">{userEmail}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Status</span>
           <span style="display: inline-block; width: 50%; text-align: right; color: #10b981; font-weight: 600;">Active</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Plan</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']};">{{{{planName}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary};">{planName}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Reactivated on</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']};">{{{{reactivationDate}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary};">{reactivationDate}</span>
         </mj-text>
       </mj-column>
     </mj-section>
 
     <!-- What's new section -->
     <mj-section padding="0 24px 16px">
-      <mj-column background-color="{skin['brandSecondary']}05" border-radius="8px" padding="16px 20px">
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" font-weight="600" padding="0 0 4px">
+      <mj-column background-color="{brandSecondary}05" border-radius="8px" padding="16px 20px">
+        <mj-text font-size="13px" color="{brandSecondary}" font-weight="600" padding="0 0 4px">
           While you were away
         </mj-text>
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" line-height="1.5" padding="0">
-          {{{{whatsNewText}}}}
+        <mj-text font-size="13px" color="{brandSecondary}" line-height="1.5" padding="0">
+          {whatsNewText}
         </mj-text>
       </mj-column>
     </mj-section>
@@ -2432,18 +3527,19 @@ def section_to_mjml_account_reactivated(skin_name="apple_light"):
     <!-- Action button -->
     <mj-section padding="0 24px 24px">
       <mj-column>
-        <mj-button href="{{{{dashboardUrl}}}}" background-color="{skin['brandAccent']}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
+        <mj-button href="{dashboardUrl}" background-color="{brandAccent}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
           Go to Dashboard
         </mj-button>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_loyalty_tier_upgrade(skin_name="apple_light"):
-    """Convert loyalty tier upgrade notification to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_account_reactivated(skin_name="apple_light"):
+    """Convert account reactivated notification to MJML."""
+    return _rendered("account_reactivated", skin_name)
+
 
-    return f'''    <!-- Loyalty tier upgrade header -->
+_LOYALTY_TIER_UPGRADE_MJML = '''    <!-- Loyalty tier upgrade header -->
     <mj-section padding="24px" background-color="#fbbf2420" border-radius="12px">
       <mj-column>
         <mj-text align="center" font-size="48px" padding="0 0 16px">
@@ -2452,8 +3548,8 @@ def section_to_mjml_loyalty_tier_upgrade(skin_name="apple_light"):
         <mj-text align="center" font-size="24px" color="#f59e0b" font-weight="700" padding="0 0 8px">
           You've Been Upgraded!
         </mj-text>
-        <mj-text align="center" font-size="15px" color="{skin['brandSecondary']}" padding="0 0 24px">
-          Welcome to {{{{newTierName}}}} status
+        <mj-text align="center" font-size="15px" color="{brandSecondary}" padding="0 0 24px">
+          Welcome to {newTierName} status
         </mj-text>
       </mj-column>
     </mj-section>
@@ -2461,10 +3557,10 @@ def section_to_mjml_loyalty_tier_upgrade(skin_name="apple_light"):
     <!-- Tier change display -->
     <mj-section padding="0 24px 16px">
       <mj-column>
-        <mj-text align="center" font-size="14px" color="{skin['brandSecondary']}" padding="12px 24px">
-          <span style="display: inline-block; padding: 12px 24px; background-color: {skin['brandSecondary']}10; border-radius: 8px; text-decoration: line-through;">{{{{previousTierName}}}}</span>
+        <mj-text align="center" font-size="14px" color="{brandSecondary}" padding="12px 24px">
+          <span style="display: inline-block; padding: 12px 24px; background-color: {brandSecondary}10; border-radius: 8px; text-decoration: line-through;">{previousTierName}</span>
           <span style="display: inline-block; padding: 0 16px; font-size: 20px;">→</span>
-          <span style="display: inline-block; padding: 12px 24px; background: linear-gradient(135deg, #fbbf24 0%, #f59e0b 100%); border-radius: 8px; color: #ffffff; font-weight: 600;">{{{{newTierName}}}}</span>
+          <span style="display: inline-block; padding: 12px 24px; background: linear-gradient(135deg, #fbbf24 0%, #f59e0b 100%); border-radius: 8px; color: #ffffff; font-weight: 600;">{newTierName}</span>
         </mj-text>
       </mj-column>
     </mj-section>
@@ -2472,7 +3568,7 @@ def section_to_mjml_loyalty_tier_upgrade(skin_name="apple_light"):
     <!-- New benefits -->
     <mj-section padding="0 24px 16px">
       <mj-column>
-        <mj-text align="center" font-size="14px" color="{skin['brandPrimary']}" font-weight="600" padding="0 0 16px">
+        <mj-text align="center" font-size="14px" color="{brandPrimary}" font-weight="600" padding="0 0 16px">
           Your New Benefits
         </mj-text>
       </mj-column>
@@ -2480,30 +3576,30 @@ def section_to_mjml_loyalty_tier_upgrade(skin_name="apple_light"):
 
     <mj-section padding="0 24px 16px">
       <mj-column background-color="#ffffff" border-radius="8px" padding="0">
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" padding="14px 20px">
-          <span style="margin-right: 8px;">✨</span> {{{{benefit1}}}}
+        <mj-text font-size="14px" color="{brandPrimary}" padding="14px 20px">
+          <span style="margin-right: 8px;">✨</span> {benefit1}
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" padding="14px 20px">
-          <span style="margin-right: 8px;">🎁</span> {{{{benefit2}}}}
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandPrimary}" padding="14px 20px">
+          <span style="margin-right: 8px;">🎁</span> {benefit2}
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" padding="14px 20px">
-          <span style="margin-right: 8px;">🚀</span> {{{{benefit3}}}}
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandPrimary}" padding="14px 20px">
+          <span style="margin-right: 8px;">🚀</span> {benefit3}
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandPrimary']}" padding="14px 20px">
-          <span style="margin-right: 8px;">💎</span> {{{{benefit4}}}}
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandPrimary}" padding="14px 20px">
+          <span style="margin-right: 8px;">💎</span> {benefit4}
         </mj-text>
       </mj-column>
     </mj-section>
 
     <!-- Points info -->
     <mj-section padding="0 24px 16px">
-      <mj-column background-color="{skin['brandSecondary']}05" border-radius="8px" padding="16px 20px">
-        <mj-text font-size="13px" color="{skin['brandSecondary']}" padding="0">
+      <mj-column background-color="{brandSecondary}05" border-radius="8px" padding="16px 20px">
+        <mj-text font-size="13px" color="{brandSecondary}" padding="0">
           <span style="display: inline-block; width: 50%;">Current points balance</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: #f59e0b; font-weight: 600; font-size: 16px;">{{{{pointsBalance}}}} pts</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: #f59e0b; font-weight: 600; font-size: 16px;">{pointsBalance} pts</span>
         </mj-text>
       </mj-column>
     </mj-section>
@@ -2511,18 +3607,19 @@ def section_to_mjml_loyalty_tier_upgrade(skin_name="apple_light"):
     <!-- Action button -->
     <mj-section padding="0 24px 24px">
       <mj-column>
-        <mj-button href="{{{{rewardsUrl}}}}" background-color="{skin['brandAccent']}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
+        <mj-button href="{rewardsUrl}" background-color="{brandAccent}" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 32px">
           Explore Your Rewards
         </mj-button>
       </mj-column>
     </mj-section>'''
 
 
-def section_to_mjml_password_changed(skin_name="apple_light"):
-    """Convert password changed notification to MJML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+def section_to_mjml_loyalty_tier_upgrade(skin_name="apple_light"):
+    """Convert loyalty tier upgrade notification to MJML."""
+    return _rendered("loyalty_tier_upgrade", skin_name)
 
-    return f'''    <!-- Password changed header -->
+
+_PASSWORD_CHANGED_MJML = '''    <!-- Password changed header -->
     <mj-section padding="24px" background-color="#10b98110" border-radius="12px">
       <mj-column>
         <mj-text align="center" font-size="48px" padding="0 0 16px">
@@ -2531,7 +3628,7 @@ def section_to_mjml_password_changed(skin_name="apple_light"):
         <mj-text align="center" font-size="24px" color="#10b981" font-weight="700" padding="0 0 8px">
           Password Changed
         </mj-text>
-        <mj-text align="center" font-size="15px" color="{skin['brandSecondary']}" padding="0 0 24px">
+        <mj-text align="center" font-size="15px" color="{brandSecondary}" padding="0 0 24px">
           Your password has been successfully updated
         </mj-text>
       </mj-column>
@@ -2540,19 +3637,19 @@ def section_to_mjml_password_changed(skin_name="apple_light"):
     <!-- Change details -->
     <mj-section padding="0 24px 16px">
       <mj-column background-color="#ffffff" border-radius="8px" padding="0">
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Account</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']}; font-weight: 600;">{{{{userEmail}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary}; font-weight: 600;">{userEmail}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">Changed on</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']};">{{{{changeDate}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary};">{changeDate}</span>
         </mj-text>
-        <mj-divider border-color="{skin['brandSecondary']}10" padding="0 20px" />
-        <mj-text font-size="14px" color="{skin['brandSecondary']}" padding="16px 20px">
+        <mj-divider border-color="{brandSecondary}10" padding="0 20px" />
+        <mj-text font-size="14px" color="{brandSecondary}" padding="16px 20px">
           <span style="display: inline-block; width: 50%;">IP Address</span>
-          <span style="display: inline-block; width: 50%; text-align: right; color: {skin['brandPrimary']};">{{{{ipAddress}}}}</span>
+          <span style="display: inline-block; width: 50%; text-align: right; color: {brandPrimary};">{ipAddress}</span>
         </mj-text>
       </mj-column>
     </mj-section>
@@ -2571,18 +3668,115 @@ def section_to_mjml_password_changed(skin_name="apple_light"):
     <!-- Action buttons -->
     <mj-section padding="0 24px 24px">
       <mj-column width="50%">
-        <mj-button href="{{{{secureAccountUrl}}}}" background-color="#f59e0b" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 28px" width="100%">
+        <mj-button href="{secureAccountUrl}" background-color="#f59e0b" color="#ffffff" font-size="14px" font-weight="600" border-radius="8px" inner-padding="14px 28px" width="100%">
           Secure My Account
         </mj-button>
       </mj-column>
       <mj-column width="50%">
-        <mj-button href="{{{{accountSettingsUrl}}}}" background-color="transparent" color="{skin['brandAccent']}" font-size="14px" font-weight="600" border-radius="8px" border="2px solid {skin['brandAccent']}" inner-padding="12px 28px" width="100%">
+        <mj-button href="{accountSettingsUrl}" background-color="transparent" color="{brandAccent}" font-size="14px" font-weight="600" border-radius="8px" border="2px solid {brandAccent}" inner-padding="12px 28px" width="100%">
           Account Settings
         </mj-button>
       </mj-column>
     </mj-section>'''
 
 
+def section_to_mjml_password_changed(skin_name="apple_light"):
+    """Convert password changed notification to MJML."""
+    return _rendered("password_changed", skin_name)
+
+
+# Section type -> format template, for _rendered
+_SECTION_TEMPLATES = {
+    "hero": _HERO_MJML,
+    "subhero": _SUBHERO_MJML,
+    "1col_text": _1COL_TEXT_MJML,
+    "2col_text_image": _2COL_TEXT_IMAGE_MJML,
+    "3col_features": _3COL_FEATURES_MJML,
+    "product_grid": _PRODUCT_GRID_MJML,
+    "testimonial": _TESTIMONIAL_MJML,
+    "story_block": _STORY_BLOCK_MJML,
+    "cta_band": _CTA_BAND_MJML,
+    "header_nav": _HEADER_NAV_MJML,
+    "offer_banner": _OFFER_BANNER_MJML,
+    "order_summary": _ORDER_SUMMARY_MJML,
+    "social_icons": _SOCIAL_ICONS_MJML,
+    "footer_simple": _FOOTER_SIMPLE_MJML,
+    "footer_complex": _FOOTER_COMPLEX_MJML,
+    "divider": _DIVIDER_MJML,
+    "spacer": _SPACER_MJML,
+    "security_alert": _SECURITY_ALERT_MJML,
+    "verification_code": _VERIFICATION_CODE_MJML,
+    "shipping_tracker": _SHIPPING_TRACKER_MJML,
+    "cart_item": _CART_ITEM_MJML,
+    "urgency_banner": _URGENCY_BANNER_MJML,
+    "event_details": _EVENT_DETAILS_MJML,
+    "rsvp_buttons": _RSVP_BUTTONS_MJML,
+    "countdown_timer": _COUNTDOWN_TIMER_MJML,
+    "video_placeholder": _VIDEO_PLACEHOLDER_MJML,
+    "accordion_faq": _ACCORDION_FAQ_MJML,
+    "pricing_table": _PRICING_TABLE_MJML,
+    "progress_tracker": _PROGRESS_TRACKER_MJML,
+    "app_store_badges": _APP_STORE_BADGES_MJML,
+    "team_members": _TEAM_MEMBERS_MJML,
+    "comparison_table": _COMPARISON_TABLE_MJML,
+    "stats_metrics": _STATS_METRICS_MJML,
+    "rating_stars": _RATING_STARS_MJML,
+    "gallery_carousel": _GALLERY_CAROUSEL_MJML,
+    "multi_step_form": _MULTI_STEP_FORM_MJML,
+    "referral_program": _REFERRAL_PROGRAM_MJML,
+    "loyalty_points": _LOYALTY_POINTS_MJML,
+    "gift_card": _GIFT_CARD_MJML,
+    "subscription_renewal": _SUBSCRIPTION_RENEWAL_MJML,
+    "wishlist_item": _WISHLIST_ITEM_MJML,
+    "price_alert": _PRICE_ALERT_MJML,
+    "back_in_stock": _BACK_IN_STOCK_MJML,
+    "invoice_details": _INVOICE_DETAILS_MJML,
+    "receipt_summary": _RECEIPT_SUMMARY_MJML,
+    "delivery_confirmation": _DELIVERY_CONFIRMATION_MJML,
+    "appointment_reminder": _APPOINTMENT_REMINDER_MJML,
+    "two_factor_code": _TWO_FACTOR_CODE_MJML,
+    "account_suspended": _ACCOUNT_SUSPENDED_MJML,
+    "payment_failed": _PAYMENT_FAILED_MJML,
+    "order_hold": _ORDER_HOLD_MJML,
+    "subscription_paused": _SUBSCRIPTION_PAUSED_MJML,
+    "referral_success": _REFERRAL_SUCCESS_MJML,
+    "order_returned": _ORDER_RETURNED_MJML,
+    "account_reactivated": _ACCOUNT_REACTIVATED_MJML,
+    "loyalty_tier_upgrade": _LOYALTY_TIER_UPGRADE_MJML,
+    "password_changed": _PASSWORD_CHANGED_MJML,
+}
+
+
+def _uses_skin_fields(template):
+    """Whether a section template has any _skin_view field (vs only runtime placeholders)."""
+    skin_fields = _SKIN_VIEW["apple_light"]
+    return any(field in skin_fields for _, field, _, _ in Formatter().parse(template) if field)
+
+
+# Sections that look the same in every skin (spacer, social_icons, ...),
+# rendered once for all skins
+_STATIC_SECTIONS = {
+    section_type: template.format_map(_PassThrough())
+    for section_type, template in _SECTION_TEMPLATES.items()
+    if not _uses_skin_fields(template)
+}
+
+
+def _rendered(section_type, skin_name):
+    """MJML for a section type in a skin; unknown skins render as apple_light."""
+    return _render_section(section_type, skin_name if skin_name in DESIGN_SKINS else "apple_light")
+
+
+# The one cache of rendered section MJML, filled on first use so importing
+# the module renders nothing. Keys are limited to section types x DESIGN_SKINS.
+@cache
+def _render_section(section_type, skin_name):
+    static = _STATIC_SECTIONS.get(section_type)
+    if static is not None:
+        return static
+    return _SECTION_TEMPLATES[section_type].format_map(_SKIN_VIEW[skin_name])
+
+
 # Registry mapping section types to MJML converters
 MJML_SECTION_REGISTRY = {
     "hero": section_to_mjml_hero,
@@ -2646,32 +3840,103 @@ MJML_SECTION_REGISTRY = {
 
 
 def get_mjml_section(section_type, skin_name="apple_light"):
-    """Get MJML output for a section type."""
-    if section_type in MJML_SECTION_REGISTRY:
-        return MJML_SECTION_REGISTRY[section_type](skin_name)
-    return None
+    """Get MJML output for a section type ("" for unknown types)."""
+    builder = MJML_SECTION_REGISTRY.get(section_type)
+    return builder(skin_name) if builder is not None else ""
 
 
-def generate_mjml_template(sections, skin_name="apple_light"):
-    """Generate a complete MJML template from a list of section types."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
-
-    mjml_sections = []
+def _write_body(buf, sections, skin_name):
+    """Write the MJML for a list of section types to buf, newline-separated."""
+    separator = ""
     for section_type in sections:
-        mjml_section = get_mjml_section(section_type, skin_name)
-        if mjml_section:
-            mjml_sections.append(mjml_section)
+        mjml = get_mjml_section(section_type, skin_name)
+        if mjml:
+            buf.write(separator)
+            buf.write(mjml)
+            separator = "\n"
+
+
+def build_body(sections, skin_name="apple_light"):
+    """
+    Join the MJML for a list of section types into mj-body content.
+
+    Unknown section types are skipped; sections are newline-separated.
+    """
+    buf = io.StringIO()
+    _write_body(buf, sections, skin_name)
+    return buf.getvalue()
 
-    body_content = "\n".join(mjml_sections)
 
-    return f'''<mjml>
-{get_mjml_head(skin_name)}
-  <mj-body background-color="{skin['brandBG']}">
-{body_content}
+_BODY_OPEN_MJML = '''
+  <mj-body background-color="{brandBG}">
+'''
+_MJML_EPILOGUE = '''
   </mj-body>
 </mjml>'''
 
 
+@lru_cache(maxsize=8)
+def _mjml_prelude(skin_name):
+    """Everything before the first section: <mjml>, the head and the <mj-body> tag."""
+    return '<mjml>\n' + get_mjml_head(skin_name) + _BODY_OPEN_MJML.format_map(_skin_view(skin_name))
+
+
+def generate_mjml_template(sections, skin_name="apple_light"):
+    """Generate a complete MJML template from a list of section types."""
+    return _generate_cached(tuple(sections), skin_name)
+
+
+@lru_cache(maxsize=1024)
+def _generate_cached(sections, skin_name):
+    """generate_mjml_template for a tuple of sections; many templates share a layout."""
+    # One buffer for the whole document, so the body is never copied on its own
+    buf = io.StringIO()
+    buf.write(_mjml_prelude(skin_name))
+    _write_body(buf, sections, skin_name)
+    buf.write(_MJML_EPILOGUE)
+    return buf.getvalue()
+
+
+_MJML_EPILOGUE_BYTES = _MJML_EPILOGUE.encode('utf-8')
+
+
+@lru_cache(maxsize=8)
+def _mjml_prelude_bytes(skin_name):
+    return _mjml_prelude(skin_name).encode('utf-8')
+
+
+# UTF-8 section MJML for generate_mjml_template_bytes, encoded once per
+# (section, skin). Like _render_section, keys are limited to registered
+# section types x DESIGN_SKINS.
+@cache
+def _section_bytes(section_type, skin_name):
+    return get_mjml_section(section_type, skin_name).encode('utf-8')
+
+
+def generate_mjml_template_bytes(sections, skin_name="apple_light"):
+    """
+    generate_mjml_template as UTF-8 bytes, for writing to files or stdin.
+
+    Joins pre-encoded section fragments instead of encoding the finished
+    document.
+    """
+    section_skin = skin_name if skin_name in DESIGN_SKINS else "apple_light"
+    body = b"\n".join(filter(None, [_section_bytes(section_type, section_skin)
+                                    for section_type in sections
+                                    if section_type in MJML_SECTION_REGISTRY]))
+    return b"".join([_mjml_prelude_bytes(skin_name), body, _MJML_EPILOGUE_BYTES])
+
+
+def clear_mjml_caches():
+    """Drop the cached head, section and template MJML, e.g. after a bulk render."""
+    get_mjml_head.cache_clear()
+    _mjml_prelude.cache_clear()
+    _mjml_prelude_bytes.cache_clear()
+    _render_section.cache_clear()
+    _section_bytes.cache_clear()
+    _generate_cached.cache_clear()
+
+
 def convert_template_to_mjml(template_data):
     """
     Convert a template dictionary (with HTML) to MJML format.
@@ -2688,6 +3953,21 @@ def convert_template_to_mjml(template_data):
     return generate_mjml_template(sections, skin_name)
 
 
+def generate_mjml_templates(templates):
+    """
+    Yield the MJML for each template dict, as convert_template_to_mjml would.
+
+    For bulk conversion: the head and <mj-body> prelude are built once per
+    skin, sections come pre-rendered, and repeated layouts are served from
+    the generate_mjml_template cache. Nothing is built until iterated.
+    """
+    for template_data in templates:
+        yield generate_mjml_template(
+            template_data.get('sections_used', []),
+            template_data.get('skin', 'apple_light'),
+        )
+
+
 def list_supported_sections():
     """List all section types that have MJML converters."""
     return list(MJML_SECTION_REGISTRY.keys())
@@ -0,0 +1,80 @@
+#!/usr/bin/env node
+/*
+ * Long-lived MJML compiler used by mjml_converter.py.
+ *
+ * Keeps Node and MJML loaded between compiles. Requests arrive as frames of
+ * "<byte length>\n<json>", where the JSON is
+ * {"mjml": "...", "minify": bool, "beautify": bool}. Each request is answered,
+ * in order, with a frame of the same shape holding either {"html": "..."} or
+ * {"error": "..."}.
+ *
+ * Run without arguments, it serves one client over stdin/stdout. Run as
+ * `node mjml_server.js <socket path>`, it listens on that Unix socket and
+ * serves every connection with the same protocol, so several processes can
+ * share one MJML instance (point TEMPLATEFORGE_MJML_SOCKET at the path).
+ */
+'use strict';
+
+const fs = require('fs');
+const net = require('net');
+const mjml2html = require('mjml');
+
+async function compile(payload) {
+  try {
+    const request = JSON.parse(payload);
+    // mjml 4 compiles synchronously; later versions return a promise
+    const result = await mjml2html(request.mjml, {
+      minify: Boolean(request.minify),
+      beautify: Boolean(request.beautify),
+      validationLevel: 'soft',
+    });
+    return { html: result.html };
+  } catch (err) {
+    return { error: String((err && err.message) || err) };
+  }
+}
+
+function serve(input, output, onEnd) {
+  let buffer = Buffer.alloc(0);
+  let queue = Promise.resolve();
+
+  function reply(message) {
+    const body = Buffer.from(JSON.stringify(message), 'utf8');
+    output.write(Buffer.concat([Buffer.from(body.length + '\n', 'ascii'), body]));
+  }
+
+  input.on('data', (chunk) => {
+    buffer = Buffer.concat([buffer, chunk]);
+    for (;;) {
+      const newline = buffer.indexOf(10);
+      if (newline === -1) return;
+      const length = parseInt(buffer.subarray(0, newline).toString('ascii'), 10);
+      const end = newline + 1 + length;
+      if (buffer.length < end) return;
+      const payload = buffer.subarray(newline + 1, end).toString('utf8');
+      buffer = buffer.subarray(end);
+      queue = queue.then(() => compile(payload)).then(reply);
+    }
+  });
+
+  input.on('end', () => {
+    queue.then(onEnd);
+  });
+}
+
+const socketPath = process.argv[2];
+
+if (socketPath) {
+  // A socket left behind by a previous run would make listen() fail
+  try {
+    fs.unlinkSync(socketPath);
+  } catch (err) {
+    if (err.code !== 'ENOENT') throw err;
+  }
+  net.createServer((conn) => {
+    conn.on('error', () => conn.destroy());
+    serve(conn, conn, () => conn.end());
+  }).listen(socketPath);
+} else {
+  serve(process.stdin, process.stdout, () => process.exit(0));
+}
@@ -28,12 +28,16 @@ from external_sources import (
     fetch_templates_from_source,
     list_available_sources,
     extract_section_patterns,
+    json_default,
+    write_results_json,
     EXTERNAL_SOURCES,
 )
 from mjml_converter import (
     convert_template_to_mjml,
     generate_mjml_template,
+    generate_mjml_templates,
     compile_template,
+    compile_templates,
     compile_mjml_to_html,
     is_mjml_available,
 )
@@ -139,14 +143,10 @@ def run_pipeline(output_file=None, verbose=True, output_format="html", compile_m
         if verbose:
             print("Converting templates to MJML format...")
 
-        for template in batch["normalizedTemplates"]:
-            template["mjml"] = convert_template_to_mjml(template)
-
-        for template in batch["reskinnedTemplates"]:
-            template["mjml"] = convert_template_to_mjml(template)
-
-        for template in batch["layoutVariants"]:
-            template["mjml"] = convert_template_to_mjml(template)
+        for key in ("normalizedTemplates", "reskinnedTemplates", "layoutVariants"):
+            templates = batch[key]
+            for template, mjml in zip(templates, generate_mjml_templates(templates)):
+                template["mjml"] = mjml
 
         if verbose:
             print(f"  - Converted {batch['metadata']['total_templates']} templates to MJML")
@@ -183,22 +183,14 @@ def run_pipeline(output_file=None, verbose=True, output_format="html", compile_m
             compiled_count = 0
             error_count = 0
 
-            for template in batch["normalizedTemplates"]:
-                compile_template(template)
-                if template.get("compiled_html"):
-                    compiled_count += 1
-                else:
-                    error_count += 1
-
-            for template in batch["reskinnedTemplates"]:
-                compile_template(template)
-                if template.get("compiled_html"):
-                    compiled_count += 1
-                else:
-                    error_count += 1
-
-            for template in batch["layoutVariants"]:
-                compile_template(template)
+            # One MJML CLI run for every template in the batch
+            all_templates = (
+                batch["normalizedTemplates"]
+                + batch["reskinnedTemplates"]
+                + batch["layoutVariants"]
+            )
+            compile_templates(all_templates)
+            for template in all_templates:
                 if template.get("compiled_html"):
                     compiled_count += 1
                 else:
@@ -318,14 +310,13 @@ def run_external_fetch(source_id=None, output_file=None, verbose=True):
     if verbose:
         print()
         print("Section patterns extracted:")
-        for pattern in sorted(patterns, key=lambda x: -x['occurrences']):
+        for pattern in patterns:
             print(f"  {pattern['type']}: {pattern['occurrences']} occurrences")
         print()
 
     # Save if output specified
     if output_file:
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        write_results_json(results, output_file)
         if verbose:
             print(f"Saved to: {output_file}")
             print(f"File size: {os.path.getsize(output_file) / 1024:.1f} KB")
@@ -488,7 +479,7 @@ def main():
             verbose=verbose
         )
         if args.json_only and not args.output:
-            print(json.dumps(result))
+            print(json.dumps(result, default=json_default))
         return
 
     # Template derivation mode
@@ -3902,16 +3902,21 @@ SECTION_REGISTRY = {
 }
 
 
+# Section markup only interpolates the IMAGE_PLACEHOLDERS and COPY_TOKENS
+# constants, so every section is built once here; lookups hand out copies
+_SECTIONS = {name: func() for name, func in SECTION_REGISTRY.items()}
+
+
 def get_section(section_type):
     """Get a section by type."""
-    if section_type in SECTION_REGISTRY:
-        return SECTION_REGISTRY[section_type]()
+    if section_type in _SECTIONS:
+        return dict(_SECTIONS[section_type])
     return None
 
 
 def get_all_sections():
     """Get all available sections."""
-    return {name: func() for name, func in SECTION_REGISTRY.items()}
+    return {name: dict(section) for name, section in _SECTIONS.items()}
 
 
 def list_section_types():
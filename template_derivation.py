@@ -59,10 +59,15 @@ CONTENT_PATTERNS = {
 }
 
 
+def _raw_markup(parsed: Dict) -> str:
+    """Full template source when the parse kept it, otherwise its preview."""
+    return parsed.get("raw") or parsed.get("raw_preview", "")
+
+
 def identify_category(template_data: Dict) -> str:
     """Identify the likely category of a template based on filename and content."""
     filename = template_data.get("filename", "").lower()
-    raw_content = template_data.get("parsed", {}).get("raw", "").lower()
+    raw_content = _raw_markup(template_data.get("parsed", {})).lower()
 
     # Check filename first for strong signals
     for category, keywords in CATEGORY_KEYWORDS.items():
@@ -87,9 +92,15 @@ def infer_sections_from_mjml(parsed: Dict, available_sections: List[str]) -> Lis
     seen_footer = False
 
     for section in parsed.get("sections", []):
-        mjml_tag = section.get("mjml_tag", "")
-        attrs = section.get("attrs", {})
-        content = " ".join(section.get("content", [])).lower()
+        if isinstance(section, dict):
+            # Sections loaded from saved fetch JSON, or built by hand
+            mjml_tag = section.get("mjml_tag", "")
+            attrs = section.get("attrs", {})
+            content = " ".join(section.get("content", [])).lower()
+        else:
+            mjml_tag = section.mjml_tag
+            attrs = section.attrs_dict()
+            content = " ".join(section.content).lower()
 
         # Map MJML tag to section type
         section_type = None
@@ -152,7 +163,7 @@ def infer_section_from_content(content: str, attrs: Dict, available_sections: Li
 def infer_sections_from_html(parsed: Dict, available_sections: List[str]) -> List[str]:
     """Infer section types from parsed HTML structure."""
     sections = ["header_nav"]  # Start with header
-    raw = parsed.get("raw", "").lower()
+    raw = _raw_markup(parsed).lower()
 
     # Look for common patterns in HTML
     if re.search(r"<img[^>]+hero|banner|header", raw, re.IGNORECASE):
@@ -261,7 +272,7 @@ def derive_all_templates(verbose: bool = True) -> Dict[str, Any]:
     if verbose:
         print("\nFetching external templates...")
 
-    external_results = fetch_all_external_templates(verbose=verbose)
+    external_results = fetch_all_external_templates(verbose=verbose, keep_raw=True)
     templates = external_results.get("templates_fetched", [])
 
     if not templates:
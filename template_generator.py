@@ -8,7 +8,7 @@ import json
 from design_system import (
     MAX_WIDTH,
     DESIGN_SKINS,
-    get_base_styles,
+    apply_skin,
     get_outlook_conditionals,
 )
 from section_library import get_section, get_all_sections, list_section_types
@@ -1395,18 +1395,9 @@ TEMPLATE_TYPES = {
 }
 
 
-def generate_html_wrapper(content, skin_name="apple_light"):
-    """Wraps section content in a complete HTML email document."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
-
-    # Build inline styles with skin values
-    styles = get_base_styles()
-    for token, value in skin.items():
-        styles = styles.replace(f"{{{token}}}", str(value))
-
-    outlook = get_outlook_conditionals()
-
-    return f'''<!DOCTYPE html>
+# Email document around the section rows; a str.format template over the
+# skin tokens plus max_width, outlook, styles and content
+_HTML_WRAPPER = '''<!DOCTYPE html>
 <html lang="en" xmlns="http://www.w3.org/1999/xhtml" xmlns:v="urn:schemas-microsoft-com:vml" xmlns:o="urn:schemas-microsoft-com:office:office">
 <head>
     <meta charset="UTF-8">
@@ -1418,7 +1409,7 @@ def generate_html_wrapper(content, skin_name="apple_light"):
     {outlook}
     {styles}
 </head>
-<body style="margin: 0; padding: 0; background-color: {skin['brandBG']};">
+<body style="margin: 0; padding: 0; background-color: {brandBG};">
     <!-- Hidden preheader text -->
     <div style="display: none; max-height: 0; overflow: hidden;">
         {{{{preheader}}}}
@@ -1426,11 +1417,11 @@ def generate_html_wrapper(content, skin_name="apple_light"):
     </div>
 
     <!-- Email wrapper -->
-    <table role="presentation" class="wrapper" width="100%" cellpadding="0" cellspacing="0" border="0" style="background-color: {skin['brandBG']};">
+    <table role="presentation" class="wrapper" width="100%" cellpadding="0" cellspacing="0" border="0" style="background-color: {brandBG};">
         <tr>
             <td align="center" style="padding: 24px 16px;">
                 <!-- Main container -->
-                <table role="presentation" class="main" width="{MAX_WIDTH}" cellpadding="0" cellspacing="0" border="0" style="max-width: {MAX_WIDTH}px; width: 100%; background-color: {skin['brandBG']};">
+                <table role="presentation" class="main" width="{max_width}" cellpadding="0" cellspacing="0" border="0" style="max-width: {max_width}px; width: 100%; background-color: {brandBG};">
 {content}
                 </table>
             </td>
@@ -1440,19 +1431,52 @@ def generate_html_wrapper(content, skin_name="apple_light"):
 </html>'''
 
 
+# Fallback for unknown skin names, looked up once rather than on every call
+_DEFAULT_SKIN = DESIGN_SKINS["apple_light"]
+
+
+def _resolve_skin(skin_name):
+    """Skin tokens by name; unknown skins fall back to apple_light."""
+    return DESIGN_SKINS.get(skin_name) or _DEFAULT_SKIN
+
+
+def generate_html_wrapper(content, skin_name="apple_light"):
+    """Wraps section content in a complete HTML email document."""
+    return _wrap_html(content, _resolve_skin(skin_name))
+
+
+def _wrap_html(content, skin):
+    """generate_html_wrapper for an already-resolved skin dict."""
+    # Build inline styles with skin values
+    styles = apply_skin(skin)
+
+    outlook = get_outlook_conditionals()
+
+    return _HTML_WRAPPER.format_map({
+        **skin,
+        "max_width": MAX_WIDTH,
+        "outlook": outlook,
+        "styles": styles,
+        "content": content,
+    })
+
+
 def apply_skin_to_section(section_html, skin_name):
     """Apply a design skin's values to section HTML."""
-    skin = DESIGN_SKINS.get(skin_name, DESIGN_SKINS["apple_light"])
+    return _apply_skin_tokens(section_html, _resolve_skin(skin_name))
+
+
+def _apply_skin_tokens(section_html, skin):
+    """apply_skin_to_section for an already-resolved skin dict."""
     result = section_html
 
     # Replace all token placeholders with skin values
-    for token, value in skin.items():
-        result = result.replace(f"{{{{brandBG}}}}", skin["brandBG"])
-        result = result.replace(f"{{{{brandPrimary}}}}", skin["brandPrimary"])
-        result = result.replace(f"{{{{brandSecondary}}}}", skin["brandSecondary"])
-        result = result.replace(f"{{{{brandText}}}}", skin["brandText"])
-        result = result.replace(f"{{{{brandAccent}}}}", skin["brandAccent"])
-        result = result.replace(f"{{{{brandFont}}}}", skin["brandFont"])
+    result = result.replace("{{brandBG}}", skin["brandBG"])
+    result = result.replace("{{brandPrimary}}", skin["brandPrimary"])
+    result = result.replace("{{brandSecondary}}", skin["brandSecondary"])
+    result = result.replace("{{brandText}}", skin["brandText"])
+    result = result.replace("{{brandAccent}}", skin["brandAccent"])
+    result = result.replace("{{brandFont}}", skin["brandFont"])
 
     # Also handle the single-brace format used in styles
     result = result.replace("{brandBG}", skin["brandBG"])
@@ -1471,16 +1495,17 @@ def generate_template(template_type, skin_name="apple_light"):
         raise ValueError(f"Unknown template type: {template_type}")
 
     template_def = TEMPLATE_TYPES[template_type]
+    skin = _resolve_skin(skin_name)
     sections_html = []
 
     for section_type in template_def["sections"]:
         section = get_section(section_type)
         if section:
-            skinned_html = apply_skin_to_section(section["html"], skin_name)
+            skinned_html = _apply_skin_tokens(section["html"], skin)
             sections_html.append(f"                    <tr><td>{skinned_html}</td></tr>")
 
     content = "\n".join(sections_html)
-    full_html = generate_html_wrapper(content, skin_name)
+    full_html = _wrap_html(content, skin)
 
     return {
         "type": template_type,
@@ -1540,15 +1565,16 @@ def generate_layout_variant(template_type, variant_num, skin_name="apple_light")
         variant_desc = "Minimal streamlined version"
 
     # Generate the variant template
+    skin = _resolve_skin(skin_name)
     sections_html = []
     for section_type in variant_sections:
         section = get_section(section_type)
         if section:
-            skinned_html = apply_skin_to_section(section["html"], skin_name)
+            skinned_html = _apply_skin_tokens(section["html"], skin)
             sections_html.append(f"                    <tr><td>{skinned_html}</td></tr>")
 
     content = "\n".join(sections_html)
-    full_html = generate_html_wrapper(content, skin_name)
+    full_html = _wrap_html(content, skin)
 
     return {
         "type": f"{template_type}_variant_{variant_num}",
@@ -0,0 +1,92 @@
+"""Shared fixtures: repo modules on sys.path and a stand-in MJML CLI."""
+
+import os
+import sys
+import textwrap
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import mjml_converter  # noqa: E402
+
+# Minimal MJML CLI: "-i -s" renders stdin to stdout, otherwise each input
+# file is rendered into the -o directory. Documents containing FAIL error;
+# ones containing SLOW record the CLI's pid in slow-<pid> and hang; ones
+# containing HUGE write output until they are stopped.
+FAKE_MJML_CLI = textwrap.dedent('''\
+    #!{python}
+    import os, sys, time
+    args = sys.argv[1:]
+    inputs, out_dir, use_stdin = [], None, False
+    i = 0
+    while i < len(args):
+        if args[i] == '-i':
+            use_stdin = True
+        elif args[i] == '-o':
+            out_dir = args[i + 1]
+            i += 1
+        elif args[i].startswith('--config.'):
+            i += 1
+        elif args[i] != '-s':
+            inputs.append(args[i])
+        i += 1
+    with open(os.path.join(os.path.dirname(__file__), 'calls.log'), 'a') as log:
+        log.write(' '.join(args) + '\\n')
+    docs = [('stdin', sys.stdin.read())] if use_stdin else [(p, open(p).read()) for p in inputs]
+    status = 0
+    for name, src in docs:
+        if 'SLOW' in src:
+            open(os.path.join(os.path.dirname(__file__), 'slow-%d' % os.getpid()), 'w').close()
+            time.sleep(60)
+        if 'HUGE' in src:
+            out = sys.stdout if use_stdin else open(os.path.join(out_dir, os.path.basename(name)[:-5] + '.html'), 'w')
+            while True:
+                out.write('x' * 65536)
+                out.flush()
+        if 'FAIL' in src:
+            sys.stderr.write('Error in %s: bad mjml\\n' % os.path.basename(name))
+            status = 1
+            continue
+        html = '<html>' + src + '</html>'
+        if use_stdin:
+            sys.stdout.write(html)
+        else:
+            with open(os.path.join(out_dir, os.path.basename(name)[:-5] + '.html'), 'w') as f:
+                f.write(html)
+    sys.exit(status)
+''')
+
+
+@pytest.fixture
+def fake_mjml(tmp_path, monkeypatch):
+    """
+    Route compiles through a stand-in MJML CLI with a private cache dir.
+
+    Returns the path of the CLI's call log, one line of arguments per run.
+    """
+    bin_dir = tmp_path / 'bin'
+    bin_dir.mkdir()
+    cli = bin_dir / 'mjml'
+    cli.write_text(FAKE_MJML_CLI.format(python=sys.executable))
+    cli.chmod(0o755)
+
+    monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv('TEMPLATEFORGE_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.delenv('TEMPLATEFORGE_MJML_SOCKET', raising=False)
+    monkeypatch.setattr(mjml_converter, 'MJML_SERVER_SOCKET', None)
+    monkeypatch.setattr(mjml_converter, 'MJML_SERVER_SCRIPT', str(tmp_path / 'no-server.js'))
+    monkeypatch.setattr(mjml_converter, 'mrml', None)
+    monkeypatch.setattr(mjml_converter, 'htmlmin', None)
+    monkeypatch.setattr(mjml_converter, 'MJML_MINIFY_WITH_HTMLMIN', False)
+    mjml_converter._stop_mjml_server()
+    monkeypatch.setattr(mjml_converter, '_mjml_server_failed', False)
+    monkeypatch.setattr(mjml_converter, '_mjml_server_failures', 0)
+    monkeypatch.setattr(mjml_converter, '_shared_server_failures', 0)
+    mjml_converter.invalidate_mjml_path_cache()
+    mjml_converter.clear_compiled_cache()
+    yield bin_dir / 'calls.log'
+    mjml_converter._stop_mjml_server()
+    mjml_converter.invalidate_mjml_path_cache()
+    mjml_converter.clear_compiled_cache()
@@ -0,0 +1,81 @@
+"""The lxml iterparse replay gives the same parse results as html.parser."""
+
+import json
+
+import pytest
+
+pytest.importorskip('lxml')
+
+import external_sources  # noqa: E402
+from external_sources import json_default, parse_html_structure, parse_mjml_structure  # noqa: E402
+
+MJML = '''<mjml>
+  <mj-body>
+    <mj-navbar></mj-navbar>
+    <mj-hero background-url="hero.png" mode="fluid-height"></mj-hero>
+    <mj-section background-color="#ffffff" full-width="full-width"></mj-section>
+    <mj-text align="left">Meet <b>our</b> team</mj-text>
+    <!-- a comment between sections -->
+    <mj-image src="a.png" />
+    <mj-divider />
+    <mj-social></mj-social>
+  </mj-body>
+</mjml>'''
+
+REPEATED_ATTRIBUTE_MJML = (
+    '<mjml><mj-body>'
+    '<mj-section background-color="#111111" full-width="full-width" background-color="#222222">'
+    '</mj-section></mj-body></mjml>'
+)
+
+HTML = '''<html><body>
+<table><tr><td>
+  <table class="main"><tr><td>
+    <h1>Hello</h1><img src="a.png"><br><p>Shop now <a href="#">Buy</a></p>
+  </td></tr></table>
+  <table><tr><td>Footer <b><i>misnested</b></i> unsubscribe</td></tr></table>
+</td></tr></table>
+</body></html>'''
+
+
+def _as_json(parsed):
+    return json.loads(json.dumps(parsed, default=json_default))
+
+
+def _both_parsers(monkeypatch, parse, content, **kwargs):
+    """(html.parser result, lxml result) for one document."""
+    with_lxml = _as_json(parse(content, **kwargs))
+    monkeypatch.setattr(external_sources, 'lxml_etree', None)
+    without_lxml = _as_json(parse(content, **kwargs))
+    monkeypatch.undo()
+    return without_lxml, with_lxml
+
+
+@pytest.mark.parametrize('content', [MJML, REPEATED_ATTRIBUTE_MJML], ids=['sections', 'repeated-attribute'])
+def test_mjml_matches_html_parser(monkeypatch, content):
+    baseline, replayed = _both_parsers(monkeypatch, parse_mjml_structure, content)
+    assert replayed == baseline
+
+
+def test_repeated_attribute_keeps_the_last_value():
+    section = parse_mjml_structure(REPEATED_ATTRIBUTE_MJML)['sections'][0]
+    assert section.attrs_dict()['background-color'] == '#222222'
+
+
+@pytest.mark.parametrize('capture_html', [False, True])
+def test_html_matches_html_parser(monkeypatch, capture_html):
+    baseline, replayed = _both_parsers(monkeypatch, parse_html_structure, HTML, capture_html=capture_html)
+    assert replayed == baseline
+
+
+def test_captured_markup_follows_the_source():
+    sections = parse_html_structure(HTML, capture_html=True)['sections']
+    assert '<img><br><p>' in sections[0]['html']
+    assert '<b><i>misnested</b></i>' in sections[1]['html']
+
+
+@pytest.mark.parametrize('content', ['', '  \n  '], ids=['empty', 'whitespace'])
+def test_empty_documents_parse_quietly(capsys, content):
+    assert parse_mjml_structure(content)['sections'] == []
+    assert parse_html_structure(content)['sections'] == []
+    assert capsys.readouterr().out == ''
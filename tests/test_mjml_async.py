@@ -0,0 +1,86 @@
+"""Async MJML compilation: compile_templates_async and the streaming generator."""
+
+import asyncio
+import os
+import time
+
+import mjml_converter
+
+
+def _document(marker):
+    return f'<mjml><mj-body><mj-text>{marker}</mj-text></mj-body></mjml>'
+
+
+def test_compile_templates_async_updates_each_template(fake_mjml):
+    templates = [{'mjml': _document(f'doc-{i}')} for i in range(5)]
+    templates.append({'mjml': _document('FAIL')})
+    templates.append({'name': 'no mjml'})
+
+    result = asyncio.run(mjml_converter.compile_templates_async(templates, max_concurrency=2))
+
+    assert result is templates
+    for i, template in enumerate(templates[:5]):
+        assert template['compiled_html'] == f'<html>{_document(f"doc-{i}")}</html>'
+        assert template['compilation_error'] is None
+    assert templates[5]['compiled_html'] is None
+    assert 'bad mjml' in templates[5]['compilation_error']
+    assert templates[6]['compilation_error'] == 'No MJML content to compile'
+
+
+def test_streaming_yields_every_template(fake_mjml):
+    templates = [{'mjml': _document(f'doc-{i}')} for i in range(6)]
+
+    async def collect():
+        return [t async for t in mjml_converter.compile_templates_streaming(iter(templates), concurrency=2)]
+
+    streamed = asyncio.run(collect())
+
+    assert sorted(map(id, streamed)) == sorted(map(id, templates))
+    for i, template in enumerate(templates):
+        assert template['compiled_html'] == f'<html>{_document(f"doc-{i}")}</html>'
+
+
+def _wait_for_slow_cli(bin_dir, count):
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        pids = [int(name[5:]) for name in os.listdir(bin_dir) if name.startswith('slow-')]
+        if len(pids) >= count:
+            return pids
+        time.sleep(0.02)
+    raise AssertionError('slow MJML CLI did not start')
+
+
+def _is_running(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def test_streaming_stopped_early_kills_in_flight_compiles(fake_mjml):
+    templates = [{'mjml': _document('fast')}] + [{'mjml': _document(f'SLOW {i}')} for i in range(3)]
+
+    async def first_then_stop():
+        stream = mjml_converter.compile_templates_streaming(templates, concurrency=3)
+        first = await stream.__anext__()
+        pids = await asyncio.to_thread(_wait_for_slow_cli, fake_mjml.parent, 2)
+        await stream.aclose()
+        return first, pids
+
+    started = time.monotonic()
+    first, pids = asyncio.run(first_then_stop())
+
+    assert first is templates[0]
+    assert time.monotonic() - started < 30
+    assert not any(_is_running(pid) for pid in pids)
+
+
+def test_oversized_output_is_cut_off(fake_mjml, monkeypatch):
+    monkeypatch.setattr(mjml_converter, 'MJML_MAX_OUTPUT_BYTES', 1 << 20)
+
+    started = time.monotonic()
+    result = asyncio.run(mjml_converter.compile_mjml_async(_document('HUGE')))
+
+    assert result == mjml_converter._output_too_large_result()
+    assert time.monotonic() - started < 20
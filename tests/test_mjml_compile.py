@@ -0,0 +1,273 @@
+"""MJML to HTML compilation: CLI fallback, batching and the process pool."""
+
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import mjml_converter
+
+
+def _document(marker):
+    return (
+        '<mjml><mj-body><mj-section><mj-column>'
+        f'<mj-text>{marker}</mj-text>'
+        '</mj-column></mj-section></mj-body></mjml>'
+    )
+
+
+def test_parallel_results_belong_to_their_templates(fake_mjml, monkeypatch):
+    # A CLI compile in the parent first, so any state a worker could
+    # inherit from it (temp files, server pipes) exists before the pool starts
+    assert mjml_converter.compile_mjml_to_html(_document('warm-up'))['success']
+
+    monkeypatch.setattr(mjml_converter.os, 'cpu_count', lambda: 4)
+    monkeypatch.setattr(mjml_converter, '_compile_pool', None)
+    templates = [{'mjml': _document(f'marker-{i:02d}-end ' + 'x' * 40 * i)} for i in range(16)]
+    templates.insert(5, {'name': 'no mjml'})
+    try:
+        result = mjml_converter.compile_templates_parallel(templates)
+    finally:
+        mjml_converter._compile_pool.shutdown()
+
+    assert result is templates
+    assert templates[5]['compiled_html'] is None
+    assert templates[5]['compilation_error'] == 'No MJML content to compile'
+    compiled = templates[:5] + templates[6:]
+    for i, template in enumerate(compiled):
+        assert template['compilation_error'] is None
+        assert f'marker-{i:02d}-end' in template['compiled_html']
+
+
+def _cache_path_with(monkeypatch, **settings):
+    """Compile cache path for one document under the given module settings."""
+    for name, value in settings.items():
+        monkeypatch.setattr(mjml_converter, name, value)
+    mjml_converter.invalidate_mjml_path_cache()
+    return mjml_converter._compiled_cache_path(_document('key'), True, False)
+
+
+def _server_with_mjml_version(directory, version):
+    package = directory / 'node_modules' / 'mjml'
+    package.mkdir(parents=True)
+    (package / 'package.json').write_text('{"version": "%s"}' % version)
+    return str(directory / 'mjml_server.js')
+
+
+def test_cache_key_covers_content_and_flags(fake_mjml):
+    path = mjml_converter._compiled_cache_path
+    assert path(_document('a'), True, False) == path(_document('a'), True, False)
+    assert path(_document('a'), True, False) != path(_document('b'), True, False)
+    assert path(_document('a'), True, False) != path(_document('a'), False, False)
+    assert path(_document('a'), False, False) != path(_document('a'), False, True)
+
+
+def test_cache_key_covers_renderer_and_mjml_version(fake_mjml, monkeypatch, tmp_path):
+    node = _cache_path_with(monkeypatch, mrml=None)
+    assert _cache_path_with(monkeypatch, mrml=object()) != node
+
+    old = _server_with_mjml_version(tmp_path / 'old', '4.15.0')
+    new = _server_with_mjml_version(tmp_path / 'new', '4.17.1')
+    assert (_cache_path_with(monkeypatch, mrml=None, MJML_SERVER_SCRIPT=old)
+            != _cache_path_with(monkeypatch, mrml=None, MJML_SERVER_SCRIPT=new))
+
+
+def test_cached_compile_skips_the_cli(fake_mjml):
+    first = mjml_converter.compile_mjml_to_html(_document('cached'))
+    mjml_converter.clear_compiled_cache()
+    second = mjml_converter.compile_mjml_to_html(_document('cached'))
+
+    assert first == second
+    assert len(fake_mjml.read_text().splitlines()) == 1
+
+
+def test_disk_cache_evicts_least_recently_used(fake_mjml, monkeypatch):
+    monkeypatch.setattr(mjml_converter, 'MJML_CACHE_TRIM_INTERVAL', 1)
+    paths = []
+    for i in range(3):
+        mjml_converter._store_compiled_html(_document(f'doc{i}'), True, False, 'x' * 1000)
+        path = mjml_converter._compiled_cache_path(_document(f'doc{i}'), True, False)
+        os.utime(path, (i, i))
+        paths.append(path)
+    # Reading doc0 makes it the most recently used entry
+    assert mjml_converter._load_compiled_html(_document('doc0'), True, False) == 'x' * 1000
+
+    monkeypatch.setattr(mjml_converter, 'MJML_CACHE_MAX_BYTES', 3000)
+    mjml_converter._store_compiled_html(_document('doc3'), True, False, 'x' * 1000)
+
+    assert [os.path.exists(path) for path in paths] == [True, False, True]
+
+
+def test_clear_compiled_cache_can_purge_disk(fake_mjml):
+    mjml_converter.compile_mjml_to_html(_document('purged'))
+    path = mjml_converter._compiled_cache_path(_document('purged'), True, False)
+    assert os.path.exists(path)
+
+    mjml_converter.clear_compiled_cache()
+    assert os.path.exists(path)
+    mjml_converter.clear_compiled_cache(disk=True)
+    assert not os.path.exists(path)
+
+    mjml_converter.compile_mjml_to_html(_document('purged'))
+    assert len(fake_mjml.read_text().splitlines()) == 2
+
+
+def test_cli_path_is_remembered_per_search_context(fake_mjml, monkeypatch, tmp_path):
+    found = mjml_converter.get_mjml_path()
+    assert found == str(fake_mjml.parent / 'mjml')
+
+    # A later process with the same PATH and directories reuses the answer
+    find = mjml_converter._find_mjml_path
+    mjml_converter.get_mjml_path.cache_clear()
+    monkeypatch.setattr(mjml_converter, '_find_mjml_path', lambda: None)
+    assert mjml_converter.get_mjml_path() == found
+    monkeypatch.setattr(mjml_converter, '_find_mjml_path', find)
+
+    # A different PATH searches again instead of trusting that answer
+    other_bin = tmp_path / 'other-bin'
+    other_bin.mkdir()
+    other = other_bin / 'mjml'
+    other.write_text((fake_mjml.parent / 'mjml').read_text())
+    other.chmod(0o755)
+    monkeypatch.setenv('PATH', f"{other_bin}{os.pathsep}{os.environ['PATH']}")
+    mjml_converter.get_mjml_path.cache_clear()
+    assert mjml_converter.get_mjml_path() == str(other)
+
+
+def test_batch_failure_recompiles_only_the_failed_document(fake_mjml):
+    documents = [_document('first'), _document('FAIL'), _document('third')]
+
+    results = mjml_converter.compile_mjml_batch(documents)
+
+    assert [result['success'] for result in results] == [True, False, True]
+    assert 'bad mjml' in results[1]['error']
+    calls = fake_mjml.read_text().splitlines()
+    assert len(calls) == 2
+    assert calls[1].startswith('-i -s')
+
+
+def test_unusable_scratch_dir_falls_back_to_default_tempdir(fake_mjml, monkeypatch, tmp_path):
+    monkeypatch.setattr(mjml_converter, '_SCRATCH_DIR', str(tmp_path / 'missing'))
+    documents = [_document('first'), _document('second')]
+
+    batch = mjml_converter.compile_mjml_batch(documents)
+    single = mjml_converter.compile_mjml_to_html(_document('third'))
+
+    assert [result['html'] for result in batch] == ['<html>' + doc + '</html>' for doc in documents]
+    assert single['html'] == '<html>' + _document('third') + '</html>'
+
+
+def test_oversized_cli_output_is_rejected(fake_mjml, monkeypatch):
+    monkeypatch.setattr(mjml_converter, 'MJML_MAX_OUTPUT_BYTES', 1 << 20)
+
+    result = mjml_converter.compile_mjml_to_html(_document('HUGE'))
+
+    assert result == mjml_converter._output_too_large_result()
+
+
+def test_htmlmin_minifies_only_when_opted_in(fake_mjml, monkeypatch):
+    fake_htmlmin = SimpleNamespace(minify=lambda html, **options: 'htmlmin:' + html)
+    monkeypatch.setattr(mjml_converter, 'htmlmin', fake_htmlmin)
+
+    # Installed but not opted in: MJML's own minifier is used
+    result = mjml_converter.compile_mjml_to_html(_document('mjml-minified'))
+    assert result['html'] == '<html>' + _document('mjml-minified') + '</html>'
+
+    monkeypatch.setattr(mjml_converter, 'MJML_MINIFY_WITH_HTMLMIN', True)
+    result = mjml_converter.compile_mjml_to_html(_document('htmlmin-minified'))
+    assert result['html'] == 'htmlmin:<html>' + _document('htmlmin-minified') + '</html>'
+
+    assert fake_mjml.read_text().splitlines() == ['-i -s --config.minify true', '-i -s']
+
+
+class _FakeMrml:
+    """Stands in for the mrml bindings, recording the render options used."""
+
+    def __init__(self):
+        self.options = []
+
+    def RenderOptions(self, disable_comments):
+        return {'disable_comments': disable_comments}
+
+    def to_html(self, mjml_content, render_options):
+        self.options.append(render_options)
+        return SimpleNamespace(content='mrml:' + mjml_content)
+
+
+def test_mrml_minify_only_drops_comments(fake_mjml, monkeypatch):
+    fake_mrml = _FakeMrml()
+    monkeypatch.setattr(mjml_converter, 'mrml', fake_mrml)
+
+    minified = mjml_converter.compile_mjml_to_html(_document('a'), enable_cache=False)
+    plain = mjml_converter.compile_mjml_to_html(_document('a'), minify=False, enable_cache=False)
+    beautified = mjml_converter.compile_mjml_to_html(_document('a'), minify=False, beautify=True,
+                                                     enable_cache=False)
+
+    assert minified['html'] == plain['html'] == 'mrml:' + _document('a')
+    assert fake_mrml.options == [{'disable_comments': True}, {'disable_comments': False}]
+    # mrml can't beautify, so that compile goes to the MJML CLI
+    assert beautified['html'] == '<html>' + _document('a') + '</html>'
+    assert fake_mjml.read_text().splitlines() == ['-i -s --config.beautify true']
+
+
+# Node server that logs each start and answers every request with a frame
+# header that isn't a length
+BROKEN_SERVER_JS = """
+require('fs').appendFileSync(process.argv[1] + '.log', 'start\\n');
+process.stdin.on('data', () => process.stdout.write('garbage\\n'));
+"""
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='needs Node.js')
+def test_broken_server_is_given_up_after_repeated_failures(fake_mjml, monkeypatch, tmp_path):
+    script = tmp_path / 'broken_server.js'
+    script.write_text(BROKEN_SERVER_JS)
+    monkeypatch.setattr(mjml_converter, 'MJML_SERVER_SCRIPT', str(script))
+
+    for i in range(mjml_converter.MJML_SERVER_MAX_FAILURES + 2):
+        result = mjml_converter.compile_mjml_to_html(_document(f'doc{i}'), enable_cache=False)
+        assert result['html'] == '<html>' + _document(f'doc{i}') + '</html>'
+
+    starts = (tmp_path / 'broken_server.js.log').read_text().splitlines()
+    assert len(starts) == mjml_converter.MJML_SERVER_MAX_FAILURES
+
+
+def test_unreachable_shared_server_is_given_up(fake_mjml, monkeypatch, tmp_path):
+    # A shared server that hangs up on every connection
+    path = str(tmp_path / 'mjml.sock')
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen()
+    connections = []
+
+    def hang_up():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            connections.append(conn)
+            conn.close()
+
+    threading.Thread(target=hang_up, daemon=True).start()
+    monkeypatch.setattr(mjml_converter, 'MJML_SERVER_SOCKET', path)
+    try:
+        for i in range(mjml_converter.MJML_SERVER_MAX_FAILURES + 2):
+            assert mjml_converter.compile_mjml_to_html(_document(f'doc{i}'), enable_cache=False)['success']
+    finally:
+        listener.close()
+
+    assert len(connections) == mjml_converter.MJML_SERVER_MAX_FAILURES
+
+
+def test_import_does_not_load_the_fetcher():
+    # The compiler only needs the cache dir, not HTTP, lxml or orjson
+    code = "import sys, mjml_converter; print('external_sources' in sys.modules)"
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                         cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), check=True)
+    assert out.stdout.strip() == 'False'
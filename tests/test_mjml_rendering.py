@@ -0,0 +1,47 @@
+"""MJML section rendering against the output of the original string builders.
+
+data/mjml_render_hashes.json holds SHA-256 digests of every section, head
+and full template, rendered for each skin (plus an unknown skin, which falls
+back to the default) by the builders before sections moved to
+_SECTION_TEMPLATES.
+"""
+
+import hashlib
+import json
+import os
+
+import pytest
+
+import mjml_converter
+
+with open(os.path.join(os.path.dirname(__file__), 'data', 'mjml_render_hashes.json')) as f:
+    GOLDEN = json.load(f)
+
+
+def _render(key):
+    kind, *names = key.split('/')
+    if kind == 'head':
+        return mjml_converter.get_mjml_head(names[0])
+    if kind == 'section':
+        return mjml_converter.get_mjml_section(names[0], names[1])
+    return mjml_converter.generate_mjml_template(list(mjml_converter.MJML_SECTION_REGISTRY), names[0])
+
+
+def test_every_section_type_is_covered():
+    golden_types = {key.split('/')[1] for key in GOLDEN if key.startswith('section/')}
+    assert golden_types == set(mjml_converter.MJML_SECTION_REGISTRY)
+
+
+@pytest.mark.parametrize('key', sorted(GOLDEN))
+def test_rendering_matches_original_output(key):
+    mjml_converter.clear_mjml_caches()
+    rendered = _render(key)
+    assert hashlib.sha256(rendered.encode('utf-8')).hexdigest() == GOLDEN[key]
+
+
+@pytest.mark.parametrize('skin_name', sorted({key.rsplit('/', 1)[1] for key in GOLDEN}))
+def test_bytes_template_matches_encoded_str_template(skin_name):
+    layouts = [list(mjml_converter.MJML_SECTION_REGISTRY), ['hero', 'bogus', 'footer_simple'], []]
+    for sections in layouts:
+        expected = mjml_converter.generate_mjml_template(sections, skin_name).encode('utf-8')
+        assert mjml_converter.generate_mjml_template_bytes(sections, skin_name) == expected
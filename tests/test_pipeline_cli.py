@@ -0,0 +1,27 @@
+"""pipeline.py command line: output modes that print JSON."""
+
+import json
+import sys
+
+import external_sources
+import pipeline
+
+MJML = '<mjml><mj-body><mj-hero background-url="hero.png"></mj-hero><mj-divider /></mj-body></mjml>'
+
+
+def test_fetch_external_json_only_prints_parsed_sections(monkeypatch, capsys, tmp_path):
+    monkeypatch.setenv('TEMPLATEFORGE_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(external_sources, 'fetch_url', lambda url, *args, **kwargs: MJML)
+    monkeypatch.setattr(sys, 'argv', ['pipeline.py', '--external-source', 'mjml_templates', '--json-only'])
+
+    pipeline.main()
+
+    result = json.loads(capsys.readouterr().out)
+    templates = result['templates_fetched']
+    assert len(templates) == len(external_sources.EXTERNAL_SOURCES['mjml_templates']['templates'])
+    assert templates[0]['parsed']['sections'][0] == {
+        'mjml_tag': 'mj-hero',
+        'section_type': 'hero',
+        'attrs': {'background-url': 'hero.png'},
+        'content': [],
+    }
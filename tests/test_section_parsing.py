@@ -0,0 +1,101 @@
+"""MJML section extraction and normalization, for Section and dict sections."""
+
+import json
+
+import external_sources
+from external_sources import (
+    Section,
+    json_default,
+    normalize_external_template,
+    parse_mjml_structure,
+)
+from section_library import list_section_types
+from template_derivation import derive_template_from_external, infer_sections_from_mjml
+
+MJML = '''<mjml>
+  <mj-body>
+    <mj-navbar></mj-navbar>
+    <mj-hero background-url="hero.png"></mj-hero>
+    <mj-section background-color="#ffffff"></mj-section>
+    <mj-text>Meet our team</mj-text>
+    <mj-divider />
+    <mj-social></mj-social>
+  </mj-body>
+</mjml>'''
+
+
+def _dict_sections(parsed):
+    """The parse result as it reads back from saved fetch JSON."""
+    return json.loads(json.dumps(parsed, default=json_default))
+
+
+def test_parse_mjml_structure_returns_section_records():
+    parsed = parse_mjml_structure(MJML)
+
+    sections = parsed['sections']
+    assert all(isinstance(section, Section) for section in sections)
+    assert [section.mjml_tag for section in sections] == [
+        'mj-navbar', 'mj-hero', 'mj-section', 'mj-text', 'mj-divider', 'mj-social'
+    ]
+    assert sections[2].attrs_dict() == {'background-color': '#ffffff'}
+    assert sections[3].content == ['Meet our team']
+    assert parsed['raw_preview'] == MJML[:500]
+
+
+def test_section_to_dict_round_trips_through_json():
+    section = parse_mjml_structure(MJML)['sections'][1]
+
+    assert json.loads(json.dumps(section, default=json_default)) == {
+        'mjml_tag': 'mj-hero',
+        'section_type': section.section_type,
+        'attrs': {'background-url': 'hero.png'},
+        'content': section.content,
+    }
+
+
+def test_infer_sections_accepts_records_and_dicts():
+    available = list_section_types()
+    parsed = parse_mjml_structure(MJML)
+
+    from_records = infer_sections_from_mjml(parsed, available)
+    from_dicts = infer_sections_from_mjml(_dict_sections(parsed), available)
+
+    assert from_records == from_dicts
+    assert from_records[0] == 'header_nav'
+    assert from_records[-1] == 'footer_simple'
+
+
+def test_normalize_accepts_records_and_dicts():
+    parsed = parse_mjml_structure(MJML)
+    del parsed['sections_used']
+    as_dicts = _dict_sections(parsed)
+
+    from_records = normalize_external_template(parsed, 'test')
+    from_dicts = normalize_external_template(as_dicts, 'test')
+
+    assert from_records == from_dicts
+    assert from_records['sections_extracted'][0] == 'header_nav'
+    assert from_records['sections_extracted'][-1] == 'footer_simple'
+
+
+def test_full_source_is_kept_only_when_asked():
+    assert 'raw' not in parse_mjml_structure(MJML)
+    assert parse_mjml_structure(MJML, keep_raw=True)['raw'] == MJML
+
+
+def test_derivation_reads_the_kept_source_without_fetching(monkeypatch):
+    def no_network(*args, **kwargs):
+        raise AssertionError('derivation fetched the template again')
+    monkeypatch.setattr(external_sources, 'fetch_url', no_network)
+
+    # The category keywords sit past the preview, so only the full source finds them
+    html = '<html><body>' + ' ' * 600 + '<p>Your order has shipped, track the delivery</p></body></html>'
+    record = {
+        'filename': 'message.html',
+        'type': 'html',
+        'url': 'https://templates.invalid/message.html',
+        'parsed': external_sources.parse_html_structure(html, keep_raw=True),
+    }
+
+    derived = derive_template_from_external(record, list_section_types())
+    assert derived['definition']['category'] == 'Ecommerce'